@@ -16,26 +16,39 @@ def get_historical_data():
     """Cache historical data analysis to avoid re-processing 40+ files."""
     return analyzer.analyze_historical_data("fomc-transcript")
 
+@st.cache_data
+def get_market_reaction(historical_data):
+    """Cache multi-asset, multi-horizon market reaction table."""
+    from modules import market_reaction
+    return market_reaction.market_reaction_table(historical_data)
+
+@st.cache_resource
+def get_topic_model():
+    """Corpus topic model (persisted; only new/changed transcripts are folded in)."""
+    from modules import topic_model
+    return topic_model.build_topic_model("fomc-transcript")
+
+@st.cache_resource
+def get_keyword_index():
+    """Corpus lemma -> sentence index (persisted; only new/changed transcripts are re-indexed)."""
+    from modules import keyword_index
+    return keyword_index.build_keyword_index("fomc-transcript")
+
+@st.cache_resource
+def get_validator():
+    """FinBERT validator loaded once per process and shared across sessions."""
+    from modules.validator import ScientificValidator
+    return ScientificValidator()
+
 @st.cache_data
 def process_transcript_cached(text):
     """Cache transcript processing (splitting, filtering, cleaning)."""
-    # 1. Split
-    opening_raw, qa_raw = preprocessor.split_transcript(text)
-    
-    if opening_raw is None or qa_raw is None:
-        return None, None, None
-    
-    # 2. Filter Q&A
-    qa_filtered = preprocessor.filter_speaker(qa_raw, "CHAIR POWELL")
-    
-    # 3. Clean
-    opening = preprocessor.clean_text(opening_raw)
-    qa = preprocessor.clean_text(qa_filtered)
-    
-    # Gabungkan
-    cleaned_text = opening + " " + qa
-    
-    return opening, qa, cleaned_text
+    return preprocessor.prepare_transcript(text, "CHAIR POWELL")
+
+@st.cache_resource(max_entries=8)
+def get_transcript_analysis(opening, qa):
+    """Cache single-parse TranscriptAnalysis (shared state, metrics derived lazily)."""
+    return analyzer.TranscriptAnalysis(opening, qa)
 
 def convert_df_to_csv(df):
     """Convert DataFrame to CSV for download."""
@@ -75,7 +88,7 @@ def main():
 
             # Processing
             with st.spinner('Memproses transkrip...'):
-                opening, qa, cleaned_text = process_transcript_cached(text)
+                opening, qa, _ = process_transcript_cached(text)
                 
                 if opening is None:
                     st.error("Gagal memisahkan transkrip! Separator tidak ditemukan. Pastikan transkrip mengandung frasa kunci yang sesuai.")
@@ -83,25 +96,28 @@ def main():
             
             # Analisis Sentimen
             try:
-                opening_scores = analyzer.get_vader_score(opening)
-                qa_scores = analyzer.get_vader_score(qa)
+                # Satu kali parsing & scoring per kalimat, semua metrik diturunkan dari sini
+                analysis = get_transcript_analysis(opening, qa)
+                
+                opening_scores = analysis.opening_scores
+                qa_scores = analysis.qa_scores
                 
                 # Analisis Flow (Kalimat)
-                opening_sentences = analyzer.get_sentence_scores(opening)
-                qa_sentences = analyzer.get_sentence_scores(qa)
+                opening_sentences = analysis.opening_sentences
+                qa_sentences = analysis.qa_sentences
                 
                 # Analisis Certainty
-                certainty_opening = analyzer.analyze_certainty(opening)
-                certainty_qa = analyzer.analyze_certainty(qa)
+                certainty_opening = analysis.certainty_opening
+                certainty_qa = analysis.certainty_qa
                 
                 # Analisis Topik
-                topic_scores = analyzer.analyze_topic_sentiment(cleaned_text)
+                topic_scores = analysis.topic_scores
                 
                 # Smart Conclusion
                 conclusion = analyzer.generate_smart_conclusion(opening_scores['compound'], qa_scores['compound'])
                 
                 # Calculate Highlights
-                highlights = analyzer.extract_key_highlights(opening, qa)
+                highlights = analysis.highlights()
                 
                 # Notification (Only once per file)
                 if 'last_processed_file' not in st.session_state:
@@ -173,15 +189,17 @@ def main():
                 # Menampilkan Teks & Word Cloud
                 with st.expander("Lihat Transkrip & Word Cloud"):
                     st.subheader("Word Cloud (Kata Kunci Dominan)")
-                    fig_wc = visualizer.plot_wordcloud(cleaned_text)
-                    st.pyplot(fig_wc)
+                    # PNG di-cache per tabel frekuensi: rerun tidak me-render ulang
+                    wordcloud_png = visualizer.wordcloud_png(analysis.keyword_frequencies)
+                    if wordcloud_png:
+                        st.image(wordcloud_png, use_container_width=True)
                     
                     # --- NEW FEATURE: Keyword Sentiment Context ---
                     st.divider()
                     st.subheader("🔍 Analisis Konteks Kata Kunci")
                     
                     # Get top keywords
-                    top_keywords = analyzer.get_top_keywords(cleaned_text, n=30)
+                    top_keywords = analysis.top_keywords(n=30)
                     
                     if top_keywords:
                         selected_keyword = st.selectbox(
@@ -192,7 +210,7 @@ def main():
                         
                         if selected_keyword:
                             # Analyze context
-                            keyword_context = analyzer.analyze_keyword_context(cleaned_text, selected_keyword)
+                            keyword_context = analysis.keyword_context(selected_keyword)
                             
                             if keyword_context:
                                 # Metrics
@@ -322,7 +340,7 @@ def main():
                     with st.spinner("Melakukan Clustering & Optimasi..."):
                         # Perform Optimized Clustering
                         # Returns tuple: (results, optimal_k, silhouette_score)
-                        cluster_results, best_k, best_score = analyzer.perform_optimized_clustering(cleaned_text)
+                        cluster_results, best_k, best_score = analysis.clusters()
                         
                         if cluster_results:
                             st.success(f"Optimal Clusters: **{best_k}** (Silhouette Score: per {best_score:.4f})")
@@ -367,12 +385,12 @@ def main():
                     current_score = None
                     
                     # Cek file saat ini untuk plotting
-                    if uploaded_file is not None and 'cleaned_text' in locals():
+                    if uploaded_file is not None and 'analysis' in locals():
                         match = re.search(r'(\d{8})', uploaded_file.name)
                         if match:
                             try:
                                 current_date = datetime.strptime(match.group(1), '%Y%m%d').date()
-                                current_score = analyzer.get_vader_score(cleaned_text)['compound']
+                                current_score = analysis.overall_scores['compound']
                             except ValueError:
                                 pass
                     
@@ -397,6 +415,50 @@ def main():
                     # Scatter Plot
                     st.plotly_chart(visualizer.plot_market_correlation(historical_data, corr_result['text']), use_container_width=True)
                     
+                    # 3. Multi-Asset, Multi-Horizon Reaction
+                    with st.expander("🌐 Reaksi Multi-Aset & Multi-Horizon"):
+                        st.caption("Return dari Open hari pertemuan sampai Close t+h hari perdagangan untuk S&P 500, Yield 10Y, Dollar Index, dan VIX.")
+                        reaction = get_market_reaction(historical_data)
+                        st.plotly_chart(visualizer.plot_reaction_heatmap(reaction), use_container_width=True)
+                        st.dataframe(reaction['p_value'].style.format("{:.4f}"))
+                    
+                    # 4. Corpus Topic Trends
+                    with st.expander("🧭 Tren Topik Korpus"):
+                        st.caption("Topik dari satu model TF-IDF + K-Means untuk seluruh korpus, sehingga topik dapat dibandingkan antar pertemuan.")
+                        model = get_topic_model()
+                        st.plotly_chart(visualizer.plot_topic_trends(model.topic_meeting_table('sentiment')), use_container_width=True)
+                        
+                        if uploaded_file is not None and 'analysis' in locals():
+                            sentences, compounds = analysis.cluster_input
+                            st.plotly_chart(visualizer.plot_cluster_sentiment(model.topic_summary(sentences, compounds)), use_container_width=True)
+                    
+                    # 5. Keyword Tone Across Meetings
+                    with st.expander("🔎 Nada per Kata Kunci (Seluruh Korpus)"):
+                        st.caption("Dijawab dari inverted index lemma korpus (kata utuh, skor tersimpan), tanpa parsing ulang transkrip.")
+                        kw_col1, kw_col2 = st.columns([2, 1])
+                        corpus_keyword = kw_col1.text_input("Kata kunci", value="labor")
+                        since = kw_col2.date_input("Sejak", value=datetime(2020, 1, 1).date())
+                        
+                        if corpus_keyword.strip():
+                            index = get_keyword_index()
+                            trend = index.trend(corpus_keyword, since=since.isoformat())
+                            if trend.empty:
+                                st.info("Kata kunci tidak ditemukan di korpus.")
+                            else:
+                                st.plotly_chart(visualizer.plot_keyword_over_time(trend, corpus_keyword), use_container_width=True)
+                                context = pd.DataFrame(index.context(corpus_keyword, since=since.isoformat()))
+                                st.dataframe(context[['date', 'section', 'seq', 'compound', 'text']], use_container_width=True, hide_index=True)
+                    
+                    # 6. Corpus Word Cloud
+                    with st.expander("☁️ Word Cloud Korpus"):
+                        st.caption("Dari frekuensi kata kunci yang tersimpan di index korpus (tanpa tokenisasi ulang).")
+                        cloud_since = st.date_input("Sejak", value=datetime(2020, 1, 1).date(), key="corpus_wordcloud_since")
+                        corpus_png = visualizer.wordcloud_png(get_keyword_index().keyword_frequencies(since=cloud_since.isoformat()))
+                        if corpus_png:
+                            st.image(corpus_png, use_container_width=True)
+                        else:
+                            st.info("Tidak ada kata kunci di korpus untuk periode ini.")
+                    
                 else:
                     st.warning("Tidak ada data historis ditemukan di folder 'fomc-transcript'.")
         else:
@@ -412,40 +474,32 @@ def main():
         
         st.info("⚠️ **Catatan:** Proses ini membutuhkan download model (~440MB) pada penggunaan pertama dan mungkin memerlukan waktu.")
         
-        if uploaded_file is not None and 'cleaned_text' in locals():
+        if uploaded_file is not None and 'analysis' in locals():
+            validate_all = st.checkbox("Validasi seluruh kalimat (bukan sampel 50 kalimat)", value=False)
             if st.button("🚀 Jalankan Validasi Silang (Cross-Validation)"):
                 try:
                     with st.spinner("Memuat Model FinBERT & Melakukan Validasi... (Harap tunggu)"):
-                        # Lazy import to avoid loading heavy model at startup
-                        from modules.validator import ScientificValidator
-                        from nltk.tokenize import sent_tokenize
-                        
-                        # Initialize Validator
-                        validator = ScientificValidator()
+                        # Model dimuat sekali per proses (lazy, tidak saat startup)
+                        validator = get_validator()
                         
                         # Prepare data for validation
-                        # We need list of sentences and their VADER scores
-                        sentences = sent_tokenize(cleaned_text)
-                        
-                        # Filter short sentences
-                        valid_sents = []
-                        vader_scores = []
-                        
-                        for s in sentences:
-                            if len(s.split()) > 5:
-                                valid_sents.append(s)
-                                vader_scores.append(analyzer.get_vader_score(s)['compound'])
+                        # We need list of sentences (> 5 kata) and their VADER scores
+                        valid_sents, vader_scores = analysis.cluster_input
                                 
                         if not valid_sents:
                             st.warning("Data kalimat valid tidak cukup.")
                         else:
                             # Run Validation
-                            # Sample size 50 for balance between speed and accuracy
-                            val_results = validator.validate_against_sota(valid_sents, vader_scores, sample_size=50)
+                            # Sample size 50 for balance between speed and accuracy (None = semua kalimat)
+                            val_results = validator.validate_against_sota(valid_sents, vader_scores, sample_size=None if validate_all else 50)
                             
                             st.divider()
                             st.subheader("Hasil Validasi Statistik")
                             
+                            cache_stats = val_results.get('cache_stats')
+                            if cache_stats:
+                                st.caption(f"{len(val_results['data'])} kalimat divalidasi · FinBERT cache hit rate: {cache_stats['hit_rate']:.0%} ({cache_stats['entries']} kalimat tersimpan)")
+                            
                             col_v1, col_v2 = st.columns(2)
                             with col_v1:
                                 st.metric(
@@ -1,15 +1,27 @@
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+from vaderSentiment.vaderSentiment import (
+    SentimentIntensityAnalyzer, BOOSTER_DICT, SPECIAL_CASES, C_INCR, N_SCALAR, negated
+)
 from scipy import stats
 import numpy as np
 import os
 import re
-from datetime import datetime, timedelta
-import yfinance as yf
+import string
+import time
+import heapq
+import inspect
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import threading
+from collections import Counter, OrderedDict, namedtuple
+from functools import cached_property, lru_cache
+from datetime import datetime
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.metrics import silhouette_score
-import nltk
-from nltk.tokenize import sent_tokenize
+from modules.nlp import KEYWORD_STOPWORDS, KEYWORD_TAGS, MODEL_NAME, get_nlp, is_keyword_token, split_sentences
+from modules.cache import ScoreCache, cache_path, make_fingerprint
+from modules.corpus import CorpusManifest
+from modules.market import get_market_data
+from modules.preprocessor import clean_text, prepare_transcript
 
 # Custom Financial Lexicon
 # Kata-kata ini memiliki bobot sentimen khusus dalam konteks ekonomi/The Fed
@@ -109,19 +121,621 @@ HEDGE_MODIFIERS = {
     'may': 0.8,
 }
 
-# Load spaCy model globally once
-import spacy
-try:
-    NLP = spacy.load("en_core_web_sm")
-except OSError:
-    from spacy.cli import download
-    download("en_core_web_sm")
-    NLP = spacy.load("en_core_web_sm")
+# Topik Ekonomi (substring match, lowercase)
+TOPIC_KEYWORDS = {
+    'Inflation': ['inflation', 'price', 'cpi', 'pce', 'cost', 'expensive'],
+    'Labor Market': ['labor', 'job', 'employment', 'unemployment', 'wage', 'hiring', 'worker'],
+    'Growth': ['growth', 'gdp', 'economy', 'spending', 'investment', 'activity', 'expansion']
+}
+
+# Modal Verbs Categorization (Certainty Index)
+CERTAINTY_WORDS = {'will', 'must', 'shall', 'definitely', 'certainly', 'clearly', 'undoubtedly', 'always', 'never'}
+UNCERTAINTY_WORDS = {'may', 'might', 'could', 'possibly', 'probably', 'perhaps', 'unlikely', 'likely', 'seems', 'appears'}
+
+# Smart Context Logic: Definisi Indikator
+BAD_INDICATORS = {'inflation', 'unemployment', 'cpi', 'pce', 'prices', 'price', 'cost', 'risk', 'uncertainty', 'volatility', 'pressure'}
+GOOD_INDICATORS = {'growth', 'gdp', 'employment', 'jobs', 'hiring', 'demand', 'spending', 'investment', 'activity', 'expansion', 'recovery'}
+ECONOMIC_INDICATORS = BAD_INDICATORS | GOOD_INDICATORS
+
+# Definisi Arah (Lemmatized)
+UP_VERBS = {'rise', 'increase', 'grow', 'climb', 'jump', 'accelerate', 'surge', 'high', 'elevated', 'up', 'peak', 'skyrocket'}
+DOWN_VERBS = {'fall', 'drop', 'decline', 'decrease', 'slow', 'cool', 'moderate', 'ease', 'lower', 'low', 'down', 'weak', 'soft', 'weaken'}
+
+# Record hasil fused token pass per kalimat
+SentenceFeatures = namedtuple('SentenceFeatures', [
+    'text',         # Teks asli
+    'tokens',       # Token stream hasil Smart Context Logic
+    'processed',    # Token stream digabung (input VADER)
+    'hedges',       # Hedge words unik yang ditemukan
+    'damping',      # Faktor damping hedge words
+    'certain',      # Jumlah kata pasti
+    'uncertain',    # Jumlah kata tidak pasti
+    'total_words',  # Jumlah token alfabet
+    'topics',       # Topik (TOPIC_KEYWORDS) yang muncul
+    'keywords',     # Kata kunci Noun/Adjective (lowercase, urutan kemunculan)
+    'terms',        # Term index korpus: (lemma, bentuk lowercase, offset karakter) token alfabet non-stopword
+])
+
+# Ukuran batch default untuk nlp.pipe
+DEFAULT_BATCH_SIZE = 64
+
+# Toleransi parity VectorizedVader vs SentimentIntensityAnalyzer.polarity_scores
+# (selisih absolut maksimum per skor, setelah pembulatan 3/4 desimal VADER).
+# Operasi float dilakukan dalam urutan yang sama dengan VADER, sehingga hasil
+# seharusnya identik; toleransi hanya menampung perbedaan pembulatan akhir.
+PARITY_TOLERANCE = 1e-4
+
+# Kode kata yang punya aturan khusus di VADER (negasi "no", "least", "never so", "but", dst.)
+_RULE_WORDS = ['no', 'least', 'at', 'very', 'never', 'so', 'this', 'without', 'doubt', 'or', 'nor', 'but', 'kind', 'of']
+_RULE_CODE = {word: code for code, word in enumerate(_RULE_WORDS, start=1)}
+
+# Frasa multi-kata yang ditangani _special_idioms_check (SPECIAL_CASES + booster n-gram)
+_IDIOM_PHRASES = [phrase.split() for phrase in list(SPECIAL_CASES) + list(BOOSTER_DICT) if ' ' in phrase]
+
+class VectorizedVader:
+    """
+    Scorer kompatibel VADER (polarity_scores) yang memproses satu batch kalimat sekaligus.
+    
+    Token dipetakan ke ID integer terhadap vocabulary lexicon gabungan (VADER + Financial);
+    valence, booster, negasi, aturan "no"/"least"/"but", normalisasi compound, dan damping
+    hedge words dihitung sebagai operasi array NumPy untuk seluruh token dalam batch.
+    Kasus langka yang bergantung pada urutan list (idiom SPECIAL_CASES dan quirk
+    nilai duplikat di _but_check) dijalankan dengan fungsi VADER asli agar hasil tetap identik.
+    """
+    
+    def __init__(self, vader):
+        """
+        Args:
+            vader (SentimentIntensityAnalyzer): Analyzer dengan lexicon gabungan (dibaca, tidak diubah).
+        """
+        self._vader = vader
+        self.lexicon = vader.lexicon
+        self._emoji_chars = frozenset(e for e in vader.emojis if len(e) == 1)
+        self._ids = {}
+        self._columns = {'valence': [], 'in_lex': [], 'booster': [], 'negated': [], 'code': []}
+        self._arrays = None
+        self._lock = threading.Lock()
+        
+    def _token_id(self, word):
+        token_id = self._ids.get(word)
+        if token_id is None:
+            token_id = self._ids[word] = len(self._ids)
+            self._columns['valence'].append(self.lexicon.get(word, 0.0))
+            self._columns['in_lex'].append(word in self.lexicon)
+            self._columns['booster'].append(BOOSTER_DICT.get(word, 0.0))
+            self._columns['negated'].append(negated([word]))
+            self._columns['code'].append(_RULE_CODE.get(word, 0))
+            self._arrays = None
+        return token_id
+        
+    def _vocab_arrays(self):
+        if self._arrays is None or len(self._arrays['code']) != len(self._ids):
+            self._arrays = {
+                'valence': np.array(self._columns['valence'], dtype=float),
+                'in_lex': np.array(self._columns['in_lex'], dtype=bool),
+                'booster': np.array(self._columns['booster'], dtype=float),
+                'negated': np.array(self._columns['negated'], dtype=bool),
+                'code': np.array(self._columns['code'], dtype=np.int8),
+            }
+        return self._arrays
+        
+    def _replace_emojis(self, text):
+        # Sama dengan awal polarity_scores (hanya dijalankan jika teks mengandung emoji)
+        text_no_emoji = ""
+        prev_space = True
+        for chr in text:
+            if chr in self._vader.emojis:
+                if not prev_space:
+                    text_no_emoji += ' '
+                text_no_emoji += self._vader.emojis[chr]
+                prev_space = False
+            else:
+                text_no_emoji += chr
+                prev_space = chr == ' '
+        return text_no_emoji
+        
+    @staticmethod
+    def _punctuation_amplifier(text):
+        ep_count = min(text.count("!"), 4)
+        qm_count = text.count("?")
+        qm_amplifier = 0
+        if qm_count > 1:
+            qm_amplifier = qm_count * 0.18 if qm_count <= 3 else 0.96
+        return ep_count * 0.292 + qm_amplifier
+        
+    def polarity_scores_many(self, texts, damping=None):
+        """
+        Skor VADER untuk banyak teks sekaligus (setara polarity_scores per teks).
+        
+        Args:
+            texts (list): List teks.
+            damping (array, optional): Faktor damping hedge words per teks; compound
+                dikalikan faktor ini jika < 1.0 (sama dengan FomcSentimentEngine).
+            
+        Returns:
+            list: List dict skor {'neg', 'neu', 'pos', 'compound'}, urutan sama dengan input.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+            
+        # 1. Tokenisasi (identik dengan SentiText) -> ID token + flag huruf kapital
+        words = []
+        flat_words = []
+        lengths = []
+        amplifiers = []
+        for text in texts:
+            if not self._emoji_chars.isdisjoint(text):
+                text = self._replace_emojis(text)
+            text = text.strip()
+            raw_words = text.split()
+            stripped = [w.strip(string.punctuation) for w in raw_words]
+            # Sama dengan SentiText._strip_punc_if_word (emoticon pendek dibiarkan utuh)
+            sentence_words = [w if len(s) <= 2 else s for w, s in zip(raw_words, stripped)]
+            words.append(sentence_words)
+            flat_words.extend(sentence_words)
+            lengths.append(len(sentence_words))
+            amplifiers.append(self._punctuation_amplifier(text))
+            
+        lowered = [w.lower() for w in flat_words]
+        upper = [w.isupper() for w in flat_words]
+        with self._lock: # Vocabulary bertambah saat kata baru muncul
+            get_id = self._ids.get
+            token_ids = [get_id(w) for w in lowered]
+            if None in token_ids:
+                token_ids = [self._token_id(w) if i is None else i for w, i in zip(lowered, token_ids)]
+            vocab = self._vocab_arrays()
+            idiom_ids = [[self._ids.get(word) for word in phrase] for phrase in _IDIOM_PHRASES]
+        n_texts = len(texts)
+        ids = np.array(token_ids, dtype=np.int64)
+        upper = np.array(upper, dtype=bool)
+        lengths = np.array(lengths, dtype=np.int64)
+        sent = np.repeat(np.arange(n_texts), lengths)
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        pos = np.arange(len(ids)) - starts[sent]
+        n_upper = np.bincount(sent, weights=upper.astype(float), minlength=n_texts)
+        cap_diff = ((lengths - n_upper) > 0) & ((lengths - n_upper) < lengths)
+        cap = upper & cap_diff[sent]
+        
+        def shifted(values, k, fill):
+            # values[g - k] (k > 0: token sebelumnya, k < 0: token sesudahnya)
+            out = np.full(len(values), fill, dtype=values.dtype)
+            if k > 0:
+                out[k:] = values[:-k]
+            elif k < 0:
+                out[:k] = values[-k:]
+            return out
+            
+        code = vocab['code'][ids]
+        in_lex = vocab['in_lex'][ids]
+        booster = vocab['booster'][ids]
+        neg = vocab['negated'][ids]
+        prev_code = {k: np.where(pos >= k, shifted(code, k, 0), 0) for k in (1, 2, 3)}
+        prev_in_lex = {k: shifted(in_lex, k, False) for k in (1, 2, 3)}
+        prev_booster = {k: shifted(booster, k, 0.0) for k in (1, 2, 3)}
+        prev_neg = {k: shifted(neg, k, False) for k in (1, 2, 3)}
+        prev_cap = {k: shifted(cap, k, False) for k in (1, 2, 3)}
+        has_next = pos < (lengths[sent] - 1)
+        next_code = np.where(has_next, shifted(code, -1, 0), 0)
+        next_in_lex = has_next & shifted(in_lex, -1, False)
+        
+        def is_word(codes, *words_):
+            return np.isin(codes, [_RULE_CODE[w] for w in words_])
+            
+        # 2. Valence dasar: hanya kata lexicon yang bukan booster dan bukan "kind of"
+        kind_of = (code == _RULE_CODE['kind']) & (next_code == _RULE_CODE['of'])
+        active = in_lex & (booster == 0) & ~kind_of
+        lex_valence = vocab['valence'][ids]
+        valence = np.where(active, lex_valence, 0.0)
+        valence = np.where(active & (code == _RULE_CODE['no']) & next_in_lex, 0.0, valence)
+        after_no = (
+            (prev_code[1] == _RULE_CODE['no']) | (prev_code[2] == _RULE_CODE['no'])
+            | ((prev_code[3] == _RULE_CODE['no']) & is_word(prev_code[1], 'or', 'nor'))
+        )
+        valence = np.where(active & after_no, lex_valence * N_SCALAR, valence)
+        valence = np.where(active & cap, np.where(valence > 0, valence + C_INCR, valence - C_INCR), valence)
+        
+        # 3. Booster + negasi untuk 3 kata sebelumnya (berurutan, seperti VADER)
+        for start_i, factor in ((0, 1.0), (1, 0.95), (2, 0.9)):
+            k = start_i + 1
+            cond = active & (pos > start_i) & ~prev_in_lex[k]
+            scalar = np.where(valence < 0, -prev_booster[k], prev_booster[k])
+            boosted_cap = (prev_booster[k] != 0) & prev_cap[k]
+            scalar = np.where(boosted_cap, np.where(valence > 0, scalar + C_INCR, scalar - C_INCR), scalar)
+            if factor != 1.0:
+                scalar = np.where(scalar != 0, scalar * factor, scalar)
+            valence = np.where(cond, valence + scalar, valence)
+            
+            if start_i == 0:
+                valence = np.where(cond & prev_neg[1], valence * N_SCALAR, valence)
+            elif start_i == 1:
+                never_so = (prev_code[2] == _RULE_CODE['never']) & is_word(prev_code[1], 'so', 'this')
+                without_doubt = (prev_code[2] == _RULE_CODE['without']) & (prev_code[1] == _RULE_CODE['doubt'])
+                valence = np.where(cond & never_so, valence * 1.25, valence)
+                valence = np.where(cond & ~never_so & ~without_doubt & prev_neg[2], valence * N_SCALAR, valence)
+            else:
+                never_so = (
+                    ((prev_code[3] == _RULE_CODE['never']) & is_word(prev_code[2], 'so', 'this'))
+                    | is_word(prev_code[1], 'so', 'this')
+                )
+                without_doubt = (prev_code[3] == _RULE_CODE['without']) & (
+                    (prev_code[2] == _RULE_CODE['doubt']) | (prev_code[1] == _RULE_CODE['doubt'])
+                )
+                valence = np.where(cond & never_so, valence * 1.25, valence)
+                valence = np.where(cond & ~never_so & ~without_doubt & prev_neg[3], valence * N_SCALAR, valence)
+                
+                # Idiom (SPECIAL_CASES / booster n-gram) langka: pakai fungsi VADER asli
+                for g in np.flatnonzero(cond & _idiom_window(idiom_ids, ids, sent, pos)):
+                    s = sent[g]
+                    valence[g] = SentimentIntensityAnalyzer._special_idioms_check(valence[g], words[s], int(pos[g]))
+                    
+        # 4. "least" check
+        least = active & (prev_code[1] == _RULE_CODE['least']) & ~prev_in_lex[1]
+        least &= (pos == 1) | ~is_word(prev_code[2], 'at', 'very')
+        valence = np.where(least, valence * N_SCALAR, valence)
+        
+        # 5. "but" check: sebelum "but" x0.5, sesudahnya x1.5 (kata "but" pertama per kalimat)
+        is_but = code == _RULE_CODE['but']
+        but_pos = np.full(n_texts, -1, dtype=np.int64)
+        but_tokens = np.flatnonzero(is_but)[::-1]
+        but_pos[sent[but_tokens]] = pos[but_tokens]
+        token_but = but_pos[sent]
+        has_but = token_but >= 0
+        modified = np.where(has_but & (pos < token_but), valence * 0.5, valence)
+        modified = np.where(has_but & (pos > token_but), valence * 1.5, modified)
+        for s in np.flatnonzero(but_pos >= 0):
+            lo, hi = starts[s], starts[s] + lengths[s]
+            original = valence[lo:hi]
+            nonzero = np.concatenate((original[original != 0], modified[lo:hi][modified[lo:hi] != 0]))
+            if len(np.unique(nonzero)) < len(nonzero):
+                # Nilai duplikat: _but_check memakai list.index(), hasilnya bergantung urutan
+                modified[lo:hi] = _but_check_in_order(original.tolist(), int(but_pos[s]))
+        sentiments = modified
+        
+        # 6. Agregasi per kalimat (urutan penjumlahan sama dengan VADER)
+        sum_s = np.bincount(sent, weights=sentiments, minlength=n_texts)
+        pos_sum = np.bincount(sent, weights=np.where(sentiments > 0, sentiments + 1, 0.0), minlength=n_texts)
+        neg_sum = np.bincount(sent, weights=np.where(sentiments < 0, sentiments - 1, 0.0), minlength=n_texts)
+        neu_count = np.bincount(sent, weights=(sentiments == 0).astype(float), minlength=n_texts)
+        amplifiers = np.array(amplifiers, dtype=float)
+        
+        sum_s = np.where(sum_s > 0, sum_s + amplifiers, np.where(sum_s < 0, sum_s - amplifiers, sum_s))
+        compound = np.clip(sum_s / np.sqrt(sum_s * sum_s + 15), -1.0, 1.0)
+        pos_wins = pos_sum > np.abs(neg_sum)
+        neg_wins = pos_sum < np.abs(neg_sum)
+        pos_sum = np.where(pos_wins, pos_sum + amplifiers, pos_sum)
+        neg_sum = np.where(neg_wins, neg_sum - amplifiers, neg_sum)
+        total = pos_sum + np.abs(neg_sum) + neu_count
+        
+        with np.errstate(invalid='ignore', divide='ignore'):
+            pos_score = np.abs(pos_sum / total)
+            neg_score = np.abs(neg_sum / total)
+            neu_score = np.abs(neu_count / total)
+            
+        if damping is None:
+            damping = np.ones(n_texts)
+        damping = np.asarray(damping, dtype=float)
+        
+        results = []
+        for i in range(n_texts):
+            if lengths[i] == 0:
+                scores = {'neg': 0.0, 'neu': 0.0, 'pos': 0.0, 'compound': 0.0}
+            else:
+                scores = {
+                    'neg': round(float(neg_score[i]), 3),
+                    'neu': round(float(neu_score[i]), 3),
+                    'pos': round(float(pos_score[i]), 3),
+                    'compound': round(float(compound[i]), 4)
+                }
+            if damping[i] < 1.0:
+                scores['compound'] = scores['compound'] * float(damping[i])
+            results.append(scores)
+        return results
+
+def _but_check_in_order(sentiments, but_index):
+    """
+    Emulasi persis SentimentIntensityAnalyzer._but_check (termasuk efek list.index()
+    pada nilai duplikat) dalam O(n log n): indeks pertama tiap nilai dilacak dengan heap.
+    """
+    sentiments = list(sentiments)
+    positions = {}
+    for i, value in enumerate(sentiments):
+        positions.setdefault(value, []).append(i) # Sudah terurut: valid sebagai heap
+    for j in range(len(sentiments)):
+        value = sentiments[j]
+        heap = positions[value]
+        while sentiments[heap[0]] != value:
+            heapq.heappop(heap)
+        si = heap[0]
+        if si == but_index:
+            continue
+        new_value = value * 0.5 if si < but_index else value * 1.5
+        sentiments[si] = new_value
+        heapq.heappush(positions.setdefault(new_value, []), si)
+    return sentiments
+
+def _idiom_window(idiom_ids, ids, sent, pos):
+    """Token yang punya awal frasa idiom (list ID per frasa) di posisi i-3..i dalam kalimat yang sama."""
+    phrase_start = np.zeros(len(ids), dtype=bool)
+    for phrase_ids in idiom_ids:
+        if None in phrase_ids:
+            continue
+        match = ids == phrase_ids[0]
+        for offset, token_id in enumerate(phrase_ids[1:], start=1):
+            following = np.zeros(len(ids), dtype=bool)
+            following[:-offset] = (ids[offset:] == token_id) & (sent[offset:] == sent[:-offset])
+            match &= following
+        phrase_start |= match
+    window = phrase_start.copy()
+    for k in (1, 2, 3):
+        window[k:] |= phrase_start[:-k] & (pos[k:] >= k)
+    return window
+
+class FomcSentimentEngine:
+    """
+    Mesin skor sentimen VADER + Custom Lexicon Keuangan yang dibangun sekali dan dipakai ulang.
+    
+    Membaca file lexicon VADER, menggabungkan FINANCIAL_LEXICON, dan menyiapkan tabel
+    hedge words hanya satu kali saat inisialisasi. Setelah dibangun, objek ini hanya
+    dibaca (read-only) sehingga aman dibagi antar sesi Streamlit dan antar thread.
+    
+    Jika cache_path diberikan, hasil per kalimat disimpan di ScoreCache (SQLite)
+    dengan key hash(kalimat) + fingerprint lexicon/aturan.
+    
+    Secara default skor dihitung dengan VectorizedVader (hasil identik dengan
+    polarity_scores, lihat check_vectorized_parity); vectorized=False memakai VADER asli.
+    """
+    
+    def __init__(self, lexicon=None, hedge_modifiers=None, cache_path=None, vectorized=True):
+        """
+        Args:
+            lexicon (dict, optional): Lexicon tambahan (default: FINANCIAL_LEXICON).
+            hedge_modifiers (dict, optional): Tabel damping hedge words (default: HEDGE_MODIFIERS).
+            cache_path (str, optional): File SQLite untuk ScoreCache (None = tanpa cache).
+            vectorized (bool): Pakai VectorizedVader untuk skor batch.
+        """
+        self._vader = SentimentIntensityAnalyzer()
+        self._vader.lexicon.update(FINANCIAL_LEXICON if lexicon is None else lexicon)
+        self.hedge_modifiers = dict(HEDGE_MODIFIERS if hedge_modifiers is None else hedge_modifiers)
+        self._scorer = VectorizedVader(self._vader) if vectorized else None
+        self.fingerprint = rules_fingerprint(self._vader.lexicon, self.hedge_modifiers, vectorized)
+        self.cache = ScoreCache(cache_path, self.fingerprint) if cache_path else None
+        
+    @property
+    def lexicon(self):
+        """Lexicon gabungan (VADER + Financial)."""
+        return self._vader.lexicon
+        
+    def damping_factor(self, hedges):
+        """
+        Menghitung faktor damping dari hedge words (Fed Speak) yang ditemukan.
+        
+        Args:
+            hedges (iterable): Hedge words unik yang muncul di teks asli.
+        """
+        damping_factor = 1.0
+        for word in hedges:
+            damping_factor *= self.hedge_modifiers.get(word, 1.0)
+        return damping_factor
+        
+    def features(self, doc):
+        """Fused token pass (lihat extract_sentence_features) dengan tabel hedge engine ini."""
+        return extract_sentence_features(doc, self.hedge_modifiers)
+        
+    def score(self, text):
+        """
+        Menghitung skor sentimen VADER dengan Custom Lexicon Keuangan
+        dan Logika Damping untuk Hedge Words (Fed Speak).
+        
+        Args:
+            text (str): Teks input.
+            
+        Returns:
+            dict: Dictionary berisi skor {'compound': float, 'pos': float, 'neu': float, 'neg': float}.
+        """
+        return self.score_many([text])[0]
+        
+    def score_doc(self, doc):
+        """
+        Menghitung skor sentimen dari Doc spaCy yang sudah di-parse.
+        
+        Args:
+            doc (spacy.tokens.Doc): Hasil parsing kalimat/teks.
+            
+        Returns:
+            dict: Dictionary berisi skor {'compound': float, 'pos': float, 'neu': float, 'neg': float}.
+        """
+        return self.score_features(self.features(doc))
+        
+    def score_features(self, features):
+        """
+        Menghitung skor VADER dari record SentenceFeatures.
+        
+        Args:
+            features (SentenceFeatures): Hasil extract_sentence_features.
+            
+        Returns:
+            dict: Dictionary berisi skor {'compound': float, 'pos': float, 'neu': float, 'neg': float}.
+        """
+        return self._score_processed(features.processed, features.hedges)
+        
+    def score_combined(self, features_list):
+        """
+        Menghitung skor VADER untuk gabungan beberapa kalimat (mis. satu section penuh)
+        tanpa parsing ulang: token hasil rewrite digabung, hedge words di-union.
+        
+        Args:
+            features_list (list): List SentenceFeatures.
+            
+        Returns:
+            dict: Dictionary berisi skor {'compound': float, 'pos': float, 'neu': float, 'neg': float}.
+        """
+        processed = " ".join(features.processed for features in features_list)
+        hedges = set()
+        for features in features_list:
+            hedges.update(features.hedges)
+        return self._score_processed(processed, hedges)
+        
+    def score_features_many(self, features_list):
+        """
+        Menghitung skor VADER untuk banyak record SentenceFeatures dalam satu batch.
+        
+        Args:
+            features_list (list): List SentenceFeatures.
+            
+        Returns:
+            list: List dict skor, urutan sama dengan input.
+        """
+        if self._scorer is None:
+            return [self.score_features(features) for features in features_list]
+        damping = [self.damping_factor(features.hedges) for features in features_list]
+        return self._scorer.polarity_scores_many([features.processed for features in features_list], damping)
+        
+    def _score_processed(self, processed_text, hedges):
+        if self._scorer is not None:
+            return self._scorer.polarity_scores_many([processed_text], [self.damping_factor(hedges)])[0]
+            
+        # 1. Basic VADER Score (processed_text sudah melewati Smart Context Logic)
+        scores = self._vader.polarity_scores(processed_text)
+        
+        # 2. Hedge Words Damping Logic
+        # Apply damping to compound score only (biasakan intensitas berkurang)
+        # Jika damping_factor < 1.0, skor mendekati 0.
+        damping_factor = self.damping_factor(hedges)
+        if damping_factor < 1.0:
+            scores['compound'] = scores['compound'] * damping_factor
+            
+        return scores
+        
+    def analyze_many(self, texts, batch_size=DEFAULT_BATCH_SIZE, n_process=1):
+        """
+        Menghasilkan (SentenceFeatures, skor) untuk banyak teks sekaligus.
+        Teks yang sudah ada di ScoreCache tidak di-parse ulang; sisanya dialirkan
+        lewat nlp.pipe (batch, opsional multi-proses) lalu disimpan ke cache.
+        
+        Args:
+            texts (list): List teks input.
+            batch_size (int): Jumlah teks per batch spaCy.
+            n_process (int): Jumlah proses spaCy (1 = tanpa multiprocessing, -1 = semua core).
+            
+        Returns:
+            list: List tuple (SentenceFeatures, dict skor), urutan sama dengan input.
+        """
+        texts = list(texts)
+        if not texts:
+            return []
+            
+        if self.cache is not None:
+            cached = self.cache.get_many(texts)
+        else:
+            cached = [None] * len(texts)
+            
+        results = {}
+        missing = []
+        for text, value in zip(texts, cached):
+            if value is not None:
+                results[text] = _record_from_json(value)
+            elif text not in results:
+                results[text] = None
+                missing.append(text)
+                
+        if missing:
+            docs = get_nlp('rules').pipe(missing, batch_size=batch_size, n_process=n_process)
+            features_list = [self.features(doc) for doc in docs]
+            for text, features, scores in zip(missing, features_list, self.score_features_many(features_list)):
+                results[text] = (features, scores)
+            if self.cache is not None:
+                self.cache.put_many(missing, [_record_to_json(*results[text]) for text in missing])
+                
+        return [results[text] for text in texts]
+        
+    def score_many(self, texts, batch_size=DEFAULT_BATCH_SIZE, n_process=1):
+        """
+        Menghitung skor sentimen untuk banyak teks sekaligus (lihat analyze_many).
+        
+        Args:
+            texts (list): List teks input.
+            batch_size (int): Jumlah teks per batch spaCy.
+            n_process (int): Jumlah proses spaCy (1 = tanpa multiprocessing, -1 = semua core).
+            
+        Returns:
+            list: List dict skor, urutan sama dengan input.
+        """
+        return [scores for _, scores in self.analyze_many(texts, batch_size=batch_size, n_process=n_process)]
+
+def _record_to_json(features, scores):
+    record = features._asdict()
+    del record['processed'] # Bisa direkonstruksi dari tokens
+    record['hedges'] = sorted(features.hedges)
+    record['topics'] = sorted(features.topics)
+    return {'features': record, 'scores': scores}
+
+def _record_from_json(value):
+    record = dict(value['features'])
+    record['processed'] = " ".join(record['tokens'])
+    record['hedges'] = frozenset(record['hedges'])
+    record['topics'] = frozenset(record['topics'])
+    record['terms'] = [tuple(term) for term in record['terms']]
+    return SentenceFeatures(**record), dict(value['scores'])
+
+def _source_of(func):
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        return func.__code__.co_code.hex()
+
+def rules_fingerprint(lexicon, hedge_modifiers, vectorized=False):
+    """
+    Fingerprint konfigurasi skor: lexicon gabungan, tabel hedge, himpunan kata aturan,
+    kode fused token pass, scorer, dan model spaCy. Dipakai sebagai bagian key ScoreCache.
+    """
+    scorer_funcs = (VectorizedVader.polarity_scores_many, _but_check_in_order, _idiom_window) if vectorized else ()
+    return make_fingerprint(
+        sorted(lexicon.items()),
+        sorted(hedge_modifiers.items()),
+        [sorted(words) for words in (BAD_INDICATORS, GOOD_INDICATORS, UP_VERBS, DOWN_VERBS, CERTAINTY_WORDS, UNCERTAINTY_WORDS)],
+        sorted(TOPIC_KEYWORDS.items()),
+        [sorted(KEYWORD_TAGS), sorted(KEYWORD_STOPWORDS)],
+        [_source_of(func) for func in (extract_sentence_features, _economic_token, _token_topics, is_keyword_token) + scorer_funcs],
+        MODEL_NAME
+    )
+
+_ENGINE = None
+_ENGINE_LOCK = threading.Lock()
+
+def get_engine():
+    """
+    Mengembalikan instance FomcSentimentEngine global (dibuat sekali per proses).
+    Engine global memakai ScoreCache di CACHE_DIR/scores.sqlite.
+    """
+    global _ENGINE
+    if _ENGINE is None:
+        with _ENGINE_LOCK:
+            if _ENGINE is None:
+                # Persistent ScoreCache aktif kecuali dimatikan lewat FOMC_SCORE_CACHE=0
+                use_cache = os.environ.get('FOMC_SCORE_CACHE', '1') != '0'
+                _ENGINE = FomcSentimentEngine(cache_path=cache_path('scores.sqlite') if use_cache else None)
+    return _ENGINE
+
+def score_sentences(sentences, batch_size=DEFAULT_BATCH_SIZE, n_process=1):
+    """
+    Batch API: menghitung skor sentimen banyak kalimat lewat satu aliran nlp.pipe.
+    
+    Args:
+        sentences (list): List kalimat.
+        batch_size (int): Jumlah kalimat per batch spaCy.
+        n_process (int): Jumlah proses spaCy (1 = tanpa multiprocessing, -1 = semua core).
+        
+    Returns:
+        list: List dict skor VADER, urutan sama dengan input.
+    """
+    return get_engine().score_many(sentences, batch_size=batch_size, n_process=n_process)
 
 def get_vader_score(text):
     """
     Menghitung skor sentimen VADER dengan Custom Lexicon Keuangan
     dan Logika Damping untuk Hedge Words (Fed Speak).
+    Wrapper tipis di atas FomcSentimentEngine global.
     
     Args:
         text (str): Teks input.
@@ -129,94 +743,196 @@ def get_vader_score(text):
     Returns:
         dict: Dictionary berisi skor {'compound': float, 'pos': float, 'neu': float, 'neg': float}.
     """
-    analyzer = SentimentIntensityAnalyzer()
-    
-    analyzer.lexicon.update(FINANCIAL_LEXICON)
-    
-    # 1. Smart Context Logic (spaCy)
-    # Mengubah kalimat berdasarkan logika ekonomi sebelum masuk VADER
-    processed_text = apply_economic_logic(text)
-    
-    # 2. Basic VADER Score
-    scores = analyzer.polarity_scores(processed_text)
-    
-    # 3. Hedge Words Damping Logic
-    # Cek apakah ada hedge words di teks ASLI (sebelum diproses logic ekonomi jika perlu, 
-    # tapi processed_text isinya token yang digabung, jadi cek raw text lebih aman untuk keyword matching)
-    
-    damping_factor = 1.0
-    text_lower = text.lower()
-    
-    words = text_lower.split() # Simple split for check
-    # Note: Ini simple check, ideally tokenized. Tapi cukup untuk keyword 'might', 'could' dll.
+    return get_engine().score(text)
+
+def check_vectorized_parity(directory='fomc-transcript', tolerance=PARITY_TOLERANCE, lexicon=None, max_examples=10):
+    """
+    Membandingkan VectorizedVader dengan SentimentIntensityAnalyzer.polarity_scores
+    pada setiap kalimat transkrip di direktori korpus.
     
-    for word, factor in HEDGE_MODIFIERS.items():
-        if word in words:
-            damping_factor *= factor
-            
-    # Apply damping to compound score only (biasakan intensitas berkurang)
-    # Jika damping_factor < 1.0, skor mendekati 0.
-    if damping_factor < 1.0:
-        scores['compound'] = scores['compound'] * damping_factor
+    Args:
+        directory (str): Direktori transkrip (.txt).
+        tolerance (float): Selisih absolut maksimum yang diterima per skor (PARITY_TOLERANCE).
+        lexicon (dict, optional): Lexicon tambahan (default: FINANCIAL_LEXICON).
+        max_examples (int): Jumlah contoh kalimat yang tidak cocok yang dikembalikan.
         
-    return scores
+    Returns:
+        dict: {
+            'sentences': int, 'mismatches': int, 'max_abs_diff': float, 'passed': bool,
+            'examples': list [(kalimat, skor VADER, skor vectorized), ...],
+            'vader_seconds': float, 'vectorized_seconds': float
+        }
+    """
+    vader = SentimentIntensityAnalyzer()
+    vader.lexicon.update(FINANCIAL_LEXICON if lexicon is None else lexicon)
+    scorer = VectorizedVader(vader)
+    
+    sentences = []
+    for filename in sorted(f for f in os.listdir(directory) if f.endswith('.txt')):
+        with open(os.path.join(directory, filename), 'r', encoding='utf-8') as f:
+            sentences.extend(split_sentences(clean_text(f.read())))
+            
+    start = time.perf_counter()
+    expected = [vader.polarity_scores(sent) for sent in sentences]
+    vader_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    actual = scorer.polarity_scores_many(sentences)
+    vectorized_seconds = time.perf_counter() - start
+    
+    max_abs_diff = 0.0
+    mismatches = []
+    for sent, ref, out in zip(sentences, expected, actual):
+        diff = max(abs(ref[key] - out[key]) for key in ref)
+        max_abs_diff = max(max_abs_diff, diff)
+        if diff > tolerance:
+            mismatches.append((sent, ref, out))
+            
+    return {
+        'sentences': len(sentences),
+        'mismatches': len(mismatches),
+        'max_abs_diff': max_abs_diff,
+        'passed': not mismatches,
+        'examples': mismatches[:max_examples],
+        'vader_seconds': vader_seconds,
+        'vectorized_seconds': vectorized_seconds
+    }
 
 def apply_economic_logic(text):
     """
     Menggunakan Dependency Parsing (spaCy) untuk menerapkan logika ekonomi.
     Contoh: "Inflation falls" -> "Inflation_Good"
     """
-    doc = NLP(text)
+    return rewrite_economic_doc(get_nlp('rules')(text))
+
+def rewrite_economic_doc(doc):
+    """
+    Menerapkan logika ekonomi pada Doc spaCy yang sudah di-parse.
     
-    # Definisi Indikator
-    bad_indicators = {'inflation', 'unemployment', 'cpi', 'pce', 'prices', 'price', 'cost', 'risk', 'uncertainty', 'volatility', 'pressure'}
-    good_indicators = {'growth', 'gdp', 'employment', 'jobs', 'hiring', 'demand', 'spending', 'investment', 'activity', 'expansion', 'recovery'}
+    Args:
+        doc (spacy.tokens.Doc): Hasil parsing teks.
+        
+    Returns:
+        str: Teks hasil rewrite (token digabung spasi).
+    """
+    return extract_sentence_features(doc).processed
+
+@lru_cache(maxsize=65536)
+def _token_topics(word):
+    """Topik yang keyword-nya muncul (substring) di dalam satu token lowercase."""
+    return frozenset(
+        topic for topic, keywords in TOPIC_KEYWORDS.items()
+        if any(keyword in word for keyword in keywords)
+    )
+
+def _economic_token(token, lemma):
+    """
+    Logika ekonomi untuk satu token indikator.
+    
+    Returns:
+        str: 'economic_positive' / 'economic_negative', atau None jika tidak ada konteks arah.
+    """
+    # Cari modifier atau verb yang terhubung (Head atau Children)
+    # Cek Head (misal: inflation <- falls)
+    head_lemma = token.head.lemma_.lower()
+    
+    # Cek Children (misal: lower -> inflation)
+    children_lemmas = [child.lemma_.lower() for child in token.children]
+    
+    is_down = head_lemma in DOWN_VERBS or any(c in DOWN_VERBS for c in children_lemmas)
+    is_up = head_lemma in UP_VERBS or any(c in UP_VERBS for c in children_lemmas)
+    
+    # Logika: Bad Indicator
+    if lemma in BAD_INDICATORS:
+        if is_down:
+            return "economic_positive" # Inflation Down = Good
+        if is_up:
+            return "economic_negative" # Inflation Up = Bad
+            
+    # Logika: Good Indicator
+    else:
+        if is_up:
+            return "economic_positive" # Growth Up = Good
+        if is_down:
+            return "economic_negative" # Growth Down = Bad
+            
+    return None
+
+def extract_sentence_features(doc, hedge_modifiers=HEDGE_MODIFIERS):
+    """
+    Fused token pass: satu kali traversal token untuk semua aturan per kalimat.
     
-    # Definisi Arah (Lemmatized)
-    up_verbs = {'rise', 'increase', 'grow', 'climb', 'jump', 'accelerate', 'surge', 'high', 'elevated', 'up', 'peak', 'skyrocket'}
-    down_verbs = {'fall', 'drop', 'decline', 'decrease', 'slow', 'cool', 'moderate', 'ease', 'lower', 'low', 'down', 'weak', 'soft', 'weaken'}
+    Menghasilkan record SentenceFeatures berisi token hasil logika ekonomi,
+    hedge words (untuk damping), hitungan Certainty Index, flag topik, kata kunci
+    (POS & stopword dari Doc yang sama, lihat nlp.is_keyword_token), dan term untuk
+    keyword_index (lemma + offset, tanpa parsing ulang).
     
-    new_tokens = []
+    Args:
+        doc (spacy.tokens.Doc | Span): Hasil parsing kalimat/teks.
+        hedge_modifiers (dict): Tabel damping hedge words.
+        
+    Returns:
+        SentenceFeatures: Record fitur kalimat.
+    """
+    tokens = []
+    hedges = set()
+    topics = set()
+    keywords = []
+    terms = []
+    start = doc[0].idx if len(doc) else 0 # Offset relatif terhadap awal kalimat (juga untuk Span)
+    certain_count = 0
+    uncertain_count = 0
+    total_words = 0
     
     for token in doc:
+        word = token.lower_
         lemma = token.lemma_.lower()
         
-        # Cek apakah token ini adalah indikator ekonomi
-        if lemma in bad_indicators or lemma in good_indicators:
-            # Cari modifier atau verb yang terhubung (Head atau Children)
-            # Sederhana: Cek tetangga atau head
-            context_found = False
-            
-            # Cek Head (misal: inflation <- falls)
-            head_lemma = token.head.lemma_.lower()
-            
-            # Cek Children (misal: lower -> inflation)
-            children_lemmas = [child.lemma_.lower() for child in token.children]
-            
-            # Logika: Bad Indicator
-            if lemma in bad_indicators:
-                if head_lemma in down_verbs or any(c in down_verbs for c in children_lemmas):
-                    new_tokens.append("economic_positive") # Inflation Down = Good
-                    context_found = True
-                elif head_lemma in up_verbs or any(c in up_verbs for c in children_lemmas):
-                    new_tokens.append("economic_negative") # Inflation Up = Bad
-                    context_found = True
-                    
-            # Logika: Good Indicator
-            elif lemma in good_indicators:
-                if head_lemma in up_verbs or any(c in up_verbs for c in children_lemmas):
-                    new_tokens.append("economic_positive") # Growth Up = Good
-                    context_found = True
-                elif head_lemma in down_verbs or any(c in down_verbs for c in children_lemmas):
-                    new_tokens.append("economic_negative") # Growth Down = Bad
-                    context_found = True
-            
-            if not context_found:
-                new_tokens.append(token.text)
-        else:
-            new_tokens.append(token.text)
+        # 1. Smart Context Logic (Indikator ekonomi + arah)
+        rewritten = None
+        if lemma in ECONOMIC_INDICATORS:
+            rewritten = _economic_token(token, lemma)
+        tokens.append(rewritten or token.text)
+        
+        # 2. Hedge Words (Fed Speak)
+        if word in hedge_modifiers:
+            hedges.add(word)
             
-    return " ".join(new_tokens)
+        # 3. Certainty Index
+        if token.is_alpha:
+            total_words += 1
+            if not token.is_stop:
+                # Pipeline tanpa lemmatizer (mis. spacy.blank) memberi lemma kosong
+                terms.append((lemma or word, word, token.idx - start))
+            if word in CERTAINTY_WORDS:
+                certain_count += 1
+            elif word in UNCERTAINTY_WORDS:
+                uncertain_count += 1
+                
+        # 4. Topik (substring keyword di dalam token)
+        topics.update(_token_topics(word))
+        
+        # 5. Kata kunci (Word Cloud & Top Keywords)
+        if is_keyword_token(token):
+            keywords.append(word)
+            
+    damping = 1.0
+    for word in hedges:
+        damping *= hedge_modifiers[word]
+        
+    return SentenceFeatures(
+        text=doc.text,
+        tokens=tokens,
+        processed=" ".join(tokens),
+        hedges=frozenset(hedges),
+        damping=damping,
+        certain=certain_count,
+        uncertain=uncertain_count,
+        total_words=total_words,
+        topics=frozenset(topics),
+        keywords=keywords,
+        terms=terms
+    )
 
 def get_sentiment_label(compound_score):
     """
@@ -268,91 +984,159 @@ def analyze_topic_sentiment(text):
     Returns:
         dict: Skor sentimen per topik.
     """
-    topics = {
-        'Inflation': ['inflation', 'price', 'cpi', 'pce', 'cost', 'expensive'],
-        'Labor Market': ['labor', 'job', 'employment', 'unemployment', 'wage', 'hiring', 'worker'],
-        'Growth': ['growth', 'gdp', 'economy', 'spending', 'investment', 'activity', 'expansion']
-    }
-    
+    engine = get_engine()
+    sentences = [sentence for sentence in text.split('.') if sentence.strip()]
+    features_list = [engine.features(doc) for doc in get_nlp('rules').pipe(sentences, batch_size=DEFAULT_BATCH_SIZE)]
+    return topic_scores_from_features(features_list, engine)
+
+def topic_scores_from_features(features_list, engine=None):
+    """
+    Skor sentimen per topik dari record SentenceFeatures (tanpa parsing ulang).
+    Kalimat dengan flag topik digabung lalu di-skor sebagai satu teks.
+    """
+    engine = engine or get_engine()
     results = {}
-    sentences = text.split('.')
-    
-    for topic, keywords in topics.items():
-        topic_sentences = []
-        for sentence in sentences:
-            if any(keyword in sentence.lower() for keyword in keywords):
-                topic_sentences.append(sentence)
-        
-        if topic_sentences:
-            full_topic_text = ". ".join(topic_sentences)
-            score = get_vader_score(full_topic_text)
-            results[topic] = score['compound']
+    for topic in TOPIC_KEYWORDS:
+        topic_features = [features for features in features_list if topic in features.topics]
+        if topic_features:
+            results[topic] = engine.score_combined(topic_features)['compound']
         else:
             results[topic] = 0.0
-            
     return results
 
-def analyze_historical_data(directory):
+def analyze_historical_data(directory, manifest_path=None, workers=1, market_data=None):
     """
     Menganalisis tren sentimen historis dan menghubungkannya dengan data pasar (S&P 500).
+    Hasil per file disimpan di CorpusManifest, sehingga hanya file baru/berubah
+    yang diproses ulang; file yang dihapus dibuang dari dataset.
     
     Args:
         directory (str): Path direktori transkrip.
+        manifest_path (str, optional): Lokasi file manifest (default: di CACHE_DIR).
+        workers (int): Jumlah worker process untuk scoring teks (1 = tanpa paralel).
+            Tiap worker memuat model spaCy sendiri sekali.
+        market_data (MarketData, optional): Sumber data pasar (default: get_market_data()).
+            Gunakan MarketData(offline=True) / fixture untuk berjalan tanpa jaringan.
         
     Returns:
         list: List of dict [{'date': date, 'compound': score, 'market_change': float}, ...]
     """
-    historical_data = []
-    files = [f for f in os.listdir(directory) if f.endswith('.txt')]
-    
-    # Pre-fetch market data optimization?
-    # Untuk simplicitas, kita fetch per tanggal tapi dengan range kecil.
-    # Agar lebih cepat, kita bisa fetch all history sekali saja, tapi itu butuh range min-max date.
-    # Kita pakai pendekatan per file dulu, jika lambat bisa dioptimasi nanti.
+    manifest = CorpusManifest(directory, fingerprint=get_engine().fingerprint, path=manifest_path)
+    pending = manifest.sync()
     
-    print(f"Processing {len(files)} historical files...")
+    if pending:
+        print(f"Processing {len(pending)} new/changed historical files...")
+        
+    paths = [os.path.join(directory, filename) for filename in pending]
+    for filename, record, error in _score_transcript_files(paths, workers):
+        if error is not None:
+            print(f"Error processing {filename}: {error}")
+            continue
+        if record is None:
+            continue
+        record['market_change'] = None
+        manifest.update(filename, record)
+        
+    # Data pasar: satu lookup vektor untuk semua pertemuan yang belum punya market_change
+    missing = manifest.missing_market()
+    if missing:
+        market_data = market_data or get_market_data()
+        try:
+            changes = market_data.close_open_change([date_obj for _, date_obj in missing])
+        except Exception as e:
+            print(f"Error fetching market data: {e}")
+            changes = []
+        for (filename, _), change in zip(missing, changes):
+            if not np.isnan(change):
+                manifest.set_market_change(filename, float(change))
+            
+    manifest.save()
+    return manifest.historical_data()
+
+def _init_worker():
+    # Muat model spaCy sekali per worker process
+    get_nlp('rules')
+
+def _score_transcript_files(paths, workers=1):
+    """
+    Scoring teks banyak file (opsional paralel lewat process pool).
     
-    for filename in files:
-        # Extract date from filename (e.g., FOMCpresconf20200916.txt)
-        match = re.search(r'(\d{8})', filename)
-        if match:
-            date_str = match.group(1)
+    Yields:
+        tuple: (filename, record atau None, exception atau None), urutan sama dengan input.
+    """
+    if workers is None or workers < 1:
+        workers = os.cpu_count() or 1
+        
+    if workers == 1 or len(paths) < 2:
+        for path in paths:
             try:
-                date_obj = datetime.strptime(date_str, '%Y%m%d').date()
-                
-                with open(os.path.join(directory, filename), 'r', encoding='utf-8') as f:
-                    text = f.read()
-                    
-                score = get_vader_score(text)
-                
-                # Fetch Market Data (S&P 500: ^GSPC)
-                # Ambil data H sampai H+5 untuk handle weekend/holiday (ambil first trading day)
-                start_date = date_obj
-                end_date = date_obj + timedelta(days=5)
-                
-                ticker = yf.Ticker("^GSPC")
-                hist = ticker.history(start=start_date, end=end_date)
-                
-                market_change = None
-                
-                if not hist.empty:
-                    # Ambil hari pertama yang tersedia (bisa hari H atau besoknya jika libur)
-                    row = hist.iloc[0]
-                    # Hitung % Change: (Close - Open) / Open
-                    market_change = ((row['Close'] - row['Open']) / row['Open']) * 100
-                
-                historical_data.append({
-                    'date': date_obj,
-                    'compound': score['compound'],
-                    'market_change': market_change,
-                    'filename': filename
-                })
+                yield os.path.basename(path), score_transcript_file(path), None
             except Exception as e:
-                print(f"Error processing {filename}: {e}")
-                
-    # Sort by date
-    historical_data.sort(key=lambda x: x['date'])
-    return historical_data
+                yield os.path.basename(path), None, e
+        return
+        
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths)), initializer=_init_worker) as executor:
+        futures = [executor.submit(score_transcript_file, path) for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                yield os.path.basename(path), future.result(), None
+            except Exception as e:
+                yield os.path.basename(path), None, e
+
+def score_transcript_file(path):
+    """
+    Skor sentimen satu file transkrip historis (tanpa data pasar, aman untuk worker process).
+    
+    Args:
+        path (str): Path file transkrip (nama file mengandung tanggal YYYYMMDD).
+        
+    Returns:
+        dict: {'date': date, 'compound': float, 'filename': str},
+        atau None jika nama file tidak mengandung tanggal.
+    """
+    filename = os.path.basename(path)
+    
+    # Extract date from filename (e.g., FOMCpresconf20200916.txt)
+    match = re.search(r'(\d{8})', filename)
+    if not match:
+        return None
+        
+    date_obj = datetime.strptime(match.group(1), '%Y%m%d').date()
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+        
+    score = get_vader_score(text)
+    
+    return {
+        'date': date_obj,
+        'compound': score['compound'],
+        'filename': filename
+    }
+
+def fetch_market_change(date_obj, market_data=None):
+    """
+    % Change (Close - Open) S&P 500 pada hari perdagangan pertama mulai tanggal pertemuan.
+    
+    Returns:
+        float: Persentase perubahan, atau None jika data tidak tersedia.
+    """
+    market_data = market_data or get_market_data()
+    change = market_data.close_open_change([date_obj])[0]
+    return None if np.isnan(change) else float(change)
+
+def analyze_transcript_file(path):
+    """
+    Menganalisis satu file transkrip historis: skor sentimen + reaksi S&P 500.
+    
+    Returns:
+        dict: {'date': date, 'compound': float, 'market_change': float|None, 'filename': str},
+        atau None jika nama file tidak mengandung tanggal.
+    """
+    record = score_transcript_file(path)
+    if record is not None:
+        record['market_change'] = fetch_market_change(record['date'])
+    return record
 
 def calculate_market_correlation(historical_data):
     """
@@ -410,28 +1194,39 @@ def extract_key_highlights(opening_text, qa_text, num=3):
     Returns:
         dict: {'positive': [{'text': str, 'source': str}, ...], 'negative': [...]}
     """
-    import nltk
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        nltk.download('punkt')
-        
-    from nltk.tokenize import sent_tokenize
-    
-    scored_sentences = []
+    candidates = []
     
     # Process Opening
-    for sent in sent_tokenize(opening_text):
+    for sent in split_sentences(opening_text):
         if len(sent.split()) < 5: continue
-        score = get_vader_score(sent)
-        scored_sentences.append({'text': sent, 'score': score['compound'], 'source': 'Opening Speech'})
+        candidates.append((sent, 'Opening Speech'))
         
     # Process Q&A
-    for sent in sent_tokenize(qa_text):
+    for sent in split_sentences(qa_text):
         if len(sent.split()) < 5: continue
-        score = get_vader_score(sent)
-        scored_sentences.append({'text': sent, 'score': score['compound'], 'source': 'Q&A Session'})
+        candidates.append((sent, 'Q&A Session'))
         
+    # Batch scoring (satu aliran nlp.pipe)
+    scores = score_sentences([sent for sent, _ in candidates])
+    scored_sentences = [
+        {'text': sent, 'score': score['compound'], 'source': source}
+        for (sent, source), score in zip(candidates, scores)
+    ]
+    return select_highlights(scored_sentences, num)
+
+def select_highlights(scored_sentences, num=3):
+    """
+    Memilih kalimat paling positif dan paling negatif dari kalimat yang sudah di-skor.
+    
+    Args:
+        scored_sentences (list): List of dict [{'text': str, 'score': float, 'source': str}, ...]
+        num (int): Jumlah kalimat per kategori.
+        
+    Returns:
+        dict: {'positive': [...], 'negative': [...]}
+    """
+    scored_sentences = list(scored_sentences)
+    
     # Sort by score
     scored_sentences.sort(key=lambda x: x['score'], reverse=True)
     
@@ -459,20 +1254,13 @@ def get_sentence_scores(text):
     Returns:
         list: List of dict [{'text': str, 'compound': float, 'seq': int}, ...]
     """
-    import nltk
-    from nltk.tokenize import sent_tokenize
+    sentences = split_sentences(text)
+    # Skip kalimat terlalu pendek
+    selected = [(i, sent) for i, sent in enumerate(sentences) if len(sent.split()) >= 3]
+    scores = score_sentences([sent for _, sent in selected])
     
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        nltk.download('punkt')
-        
-    sentences = sent_tokenize(text)
     results = []
-    
-    for i, sent in enumerate(sentences):
-        if len(sent.split()) < 3: continue # Skip kalimat terlalu pendek
-        score = get_vader_score(sent)
+    for (i, sent), score in zip(selected, scores):
         results.append({
             'seq': i + 1,
             'text': sent,
@@ -492,24 +1280,17 @@ def analyze_certainty(text):
         dict: {'score': float, 'label': str}
         Score range: 0.0 (Sangat Tidak Pasti) - 1.0 (Sangat Pasti)
     """
-    doc = NLP(text.lower())
-    
-    # Modal Verbs Categorization
-    certainty_words = {'will', 'must', 'shall', 'definitely', 'certainly', 'clearly', 'undoubtedly', 'always', 'never'}
-    uncertainty_words = {'may', 'might', 'could', 'possibly', 'probably', 'perhaps', 'unlikely', 'likely', 'seems', 'appears'}
-    
-    certain_count = 0
-    uncertain_count = 0
-    total_words = 0
+    doc = get_nlp('tokenizer')(text.lower())
+    features = extract_sentence_features(doc)
+    return certainty_from_counts(features.certain, features.uncertain, features.total_words)
+
+def certainty_from_counts(certain_count, uncertain_count, total_words):
+    """
+    Mengubah hitungan modal verbs menjadi Certainty Index.
     
-    for token in doc:
-        if token.is_alpha:
-            total_words += 1
-            if token.text in certainty_words:
-                certain_count += 1
-            elif token.text in uncertainty_words:
-                uncertain_count += 1
-                
+    Returns:
+        dict: {'score': float, 'label': str}
+    """
     if total_words == 0:
         return {'score': 0.5, 'label': 'Netral'}
         
@@ -585,93 +1366,46 @@ def generate_smart_conclusion(opening_score, qa_score):
 def get_top_keywords(text, n=20):
     """
     Ekstrak kata-kata kunci paling sering muncul (selain stopwords).
-    Menggunakan logika yang sama dengan WordCloud (POS Tagging: Noun & Adj).
+    Menggunakan logika yang sama dengan WordCloud (POS Tagging: Noun & Adj),
+    diturunkan dari Doc spaCy yang sama dengan skor sentimen (lihat keyword_counts).
+    """
+    features_list = [features for features, _ in get_engine().analyze_many(split_sentences(text))]
+    return [word for word, count in keyword_counts(features_list).most_common(n)]
+
+def keyword_counts(features_list):
     """
-    from collections import Counter
-    import nltk
-    from nltk.corpus import stopwords
-    from nltk.tokenize import word_tokenize
-    from nltk.tag import pos_tag
+    Frekuensi kata kunci (Noun & Adjective, tanpa stopwords) dari record SentenceFeatures.
     
-    # Download NLTK resources if not present
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        nltk.download('punkt')
-    try:
-        nltk.data.find('taggers/averaged_perceptron_tagger')
-    except LookupError:
-        nltk.download('averaged_perceptron_tagger')
-    try:
-        nltk.data.find('corpora/stopwords')
-    except LookupError:
-        nltk.download('stopwords')
-
-    # 1. Tokenisasi & POS Tagging
-    tokens = word_tokenize(text.lower())
-    tagged_tokens = pos_tag(tokens)
-    
-    # 2. Whitelist Filter: Hanya ambil Noun (NN*) dan Adjective (JJ*)
-    allowed_tags = {'NN', 'NNS', 'JJ', 'JJR', 'JJS'}
-    
-    # 3. Custom Blacklist (Sama dengan visualizer.py)
-    custom_stopwords = set([
-        'percent', 'year', 'month', 'today', 'term', 'point', 'number', 'million', 'billion',
-        'thing', 'way', 'part', 'lot', 'bit', 'side', 'type', 'kind', 'sort', 'sense',
-        'question', 'answer', 'mr', 'ms', 'chair', 'powell', 'chairman', 'operator',
-        'meeting', 'committee', 'reserve', 'federal', 'fed', 'bank', 'system',
-        'program', 'statement', 'guidance', 'tool', 'support', 'policy', 'rate', 
-        'time', 'period', 'level', 'range', 'goal', 'objective', 'mandate',
-        'michelle', 'smith', 'hi', 'hello', 'thanks', 'thank', 'please',
-        'quarter', 'half', 'basis', 'pace', 'outlook', 'projection', 'view',
-        'participant', 'member', 'colleague', 'staff', 'governor', 'president',
-        'morning', 'afternoon', 'evening', 'everyone', 'everybody', 'people',
-        'think', 'going', 'see', 'say', 'know', 'look', 'come', 'make', 'take', 'get' # Common verbs often tagged as nouns in some contexts
-    ])
-    
-    # Gabungkan dengan stopwords bawaan NLTK
-    final_stopwords = set(stopwords.words('english')).union(custom_stopwords)
-    
-    # Important Economic Terms to KEEP (Remove from stopwords if present)
-    # Meskipun ada di custom_stopwords visualizer (misal 'rate'), user mungkin ingin melihatnya di sini.
-    # Tapi user minta "sesuaikan dengan filter wordcloud", jadi saya akan ikuti visualizer.py dulu.
-    # Namun, 'inflation', 'jobs', 'growth' tidak ada di blacklist visualizer, jadi aman.
-    
-    # Filter token
-    meaningful_words = []
-    for word, tag in tagged_tokens:
-        if tag in allowed_tags and word.isalpha() and word not in final_stopwords and len(word) > 2:
-            meaningful_words.append(word)
-    
-    # Count
-    counter = Counter(meaningful_words)
-    return [word for word, count in counter.most_common(n)]
+    Args:
+        features_list (list): List SentenceFeatures.
+        
+    Returns:
+        collections.Counter: {kata: jumlah}
+    """
+    counter = Counter()
+    for features in features_list:
+        counter.update(features.keywords)
+    return counter
 
 def analyze_keyword_context(text, keyword):
     """
-    Menganalisis sentimen kalimat-kalimat yang mengandung keyword tertentu.
+    Menganalisis sentimen kalimat-kalimat yang mengandung keyword tertentu (kata utuh).
     """
-    import nltk
-    from nltk.tokenize import sent_tokenize
+    sentences = split_sentences(text)
     
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        nltk.download('punkt')
-        
-    sentences = sent_tokenize(text)
-    results = []
+    # Kata utuh, bukan substring (sama dengan TranscriptAnalysis.keyword_context)
+    pattern = re.compile(rf"\b{re.escape(keyword.lower())}\b")
     
-    keyword = keyword.lower()
+    selected = [(i, sent) for i, sent in enumerate(sentences) if pattern.search(sent.lower())]
+    scores = score_sentences([sent for _, sent in selected])
     
-    for i, sent in enumerate(sentences):
-        if keyword in sent.lower():
-            score = get_vader_score(sent)
-            results.append({
-                'seq': i + 1,
-                'text': sent,
-                'compound': score['compound']
-            })
+    results = []
+    for (i, sent), score in zip(selected, scores):
+        results.append({
+            'seq': i + 1,
+            'text': sent,
+            'compound': score['compound']
+        })
             
     return results
 
@@ -747,6 +1481,15 @@ def perform_statistical_test(opening_sentences, qa_sentences):
         'narrative': narrative
     }
 
+# Auto-K clustering
+CLUSTER_SEED = 42
+SILHOUETTE_SAMPLE_SIZE = 2000 # Di atas ini silhouette dihitung pada sampel
+MINIBATCH_THRESHOLD = 5000    # Di atas ini pakai MiniBatchKMeans
+CLUSTER_CACHE_SIZE = 32
+
+_CLUSTER_CACHE = OrderedDict()
+_CLUSTER_LOCK = threading.Lock()
+
 def perform_topic_clustering(text, n_clusters=5):
     """
     Wrapper legacy untuk backward compatibility (jika ada pemanggil lama).
@@ -766,81 +1509,145 @@ def perform_optimized_clustering(text):
     Returns:
         tuple: (cluster_results, optimal_n, best_silhouette)
     """
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        nltk.download('punkt')
-        
     # 1. Split Sentences
-    sentences = sent_tokenize(text)
+    sentences = split_sentences(text)
     # Filter short sentences (min words > 5) to ensure meaningful clustering
     valid_sentences = [s for s in sentences if len(s.split()) > 5]
     
-    # Minimum data requirement: at least 15 sentences to try clustering up to 5-8 groups
-    if len(valid_sentences) < 15:
-        return [], 0, 0.0
-        
+    return cluster_sentences(valid_sentences)
+
+def _fit_k(tfidf_matrix, k, seed=CLUSTER_SEED):
+    """
+    Fit satu kandidat k dan hitung silhouette (sampel jika data besar).
+    
+    Returns:
+        tuple: (k, model, silhouette)
+    """
+    n_samples = tfidf_matrix.shape[0]
+    if n_samples >= MINIBATCH_THRESHOLD:
+        model = MiniBatchKMeans(n_clusters=k, random_state=seed, n_init=3, batch_size=1024)
+    else:
+        model = KMeans(n_clusters=k, random_state=seed, n_init=10)
+    labels = model.fit_predict(tfidf_matrix)
+    sample_size = SILHOUETTE_SAMPLE_SIZE if n_samples > SILHOUETTE_SAMPLE_SIZE else None
+    score = silhouette_score(tfidf_matrix, labels, sample_size=sample_size, random_state=seed)
+    return k, model, score
+
+def _auto_k(valid_sentences, seed=CLUSTER_SEED, n_jobs=None):
+    """
+    TF-IDF + pencarian k terbaik (Silhouette) secara paralel. Model pemenang dipakai
+    langsung (tanpa refit). Hasil di-cache berdasarkan hash input.
+    
+    Returns:
+        tuple: (best_k, best_score, labels, top_terms per cluster) atau None jika data tidak cukup.
+    """
+    key = make_fingerprint(valid_sentences, seed)
+    with _CLUSTER_LOCK:
+        if key in _CLUSTER_CACHE:
+            _CLUSTER_CACHE.move_to_end(key)
+            return _CLUSTER_CACHE[key]
+            
     # 2. Vectorization (TF-IDF)
     vectorizer = TfidfVectorizer(stop_words='english', max_df=0.8, min_df=2)
     try:
         tfidf_matrix = vectorizer.fit_transform(valid_sentences)
     except ValueError:
-        return [], 0, 0.0
+        return None
+        
+    # Needs at least 2 samples for silhouette
+    if tfidf_matrix.shape[0] < 2:
+        return None
         
     # 3. Find Optimal K (Silhouette Score)
-    # Range K: 2 to 8 (or less if data is small)
+    # Range K: 2 to 8 (or less if data is small); kandidat di-fit paralel
     max_k = min(8, len(valid_sentences) // 2)
-    best_k = 2
-    best_score = -1.0
+    candidates = list(range(2, max_k + 1))
     
-    # Needs at least 2 samples for silhouette
-    if tfidf_matrix.shape[0] < 2:
-         return [], 0, 0.0
-
     print("Optimizing Clusters (Silhouette Score)...")
     
-    for k in range(2, max_k + 1):
+    n_jobs = n_jobs or min(len(candidates), os.cpu_count() or 1)
+    with ThreadPoolExecutor(max_workers=max(1, n_jobs)) as executor:
+        futures = [executor.submit(_fit_k, tfidf_matrix, k, seed) for k in candidates]
+        
+    best_k = 2
+    best_score = -1.0
+    best_model = None
+    for k, future in zip(candidates, futures): # Urutan k tetap: hasil deterministik
         try:
-            kmeans = KMeans(n_clusters=k, random_state=42, n_init=10)
-            labels = kmeans.fit_predict(tfidf_matrix)
-            score = silhouette_score(tfidf_matrix, labels)
-            
-            if score > best_score:
-                best_score = score
-                best_k = k
+            _, model, score = future.result()
         except Exception as e:
             print(f"Error at k={k}: {e}")
             continue
+        if score > best_score:
+            best_score = score
+            best_k = k
+            best_model = model
             
+    if best_model is None:
+        return None
+        
     print(f"Optimal Clusters: {best_k} (Silhouette: {best_score:.4f})")
     
-    # 4. Final Clustering with Best K
-    final_kmeans = KMeans(n_clusters=best_k, random_state=42, n_init=10)
-    final_kmeans.fit(tfidf_matrix)
+    # 4. Top Terms per cluster dari model pemenang
+    feature_names = vectorizer.get_feature_names_out()
+    top_terms = []
+    for centroid in best_model.cluster_centers_:
+        top_indices = centroid.argsort()[-3:][::-1] # Top 3
+        top_terms.append([feature_names[ind] for ind in top_indices])
+        
+    result = (best_k, float(best_score), best_model.labels_.copy(), top_terms)
+    with _CLUSTER_LOCK:
+        _CLUSTER_CACHE[key] = result
+        while len(_CLUSTER_CACHE) > CLUSTER_CACHE_SIZE:
+            _CLUSTER_CACHE.popitem(last=False)
+    return result
+
+def cluster_sentences(valid_sentences, compounds=None, seed=CLUSTER_SEED, n_jobs=None):
+    """
+    Auto-K clustering atas kalimat yang sudah difilter.
+    
+    Args:
+        valid_sentences (list): Kalimat (sudah difilter minimal 6 kata).
+        compounds (list, optional): Skor compound per kalimat yang sudah dihitung.
+            Jika None, kalimat akan di-skor ulang lewat score_sentences.
+        seed (int): Random seed K-Means (hasil deterministik untuk seed yang sama).
+        n_jobs (int, optional): Jumlah thread untuk fit kandidat k (default: jumlah kandidat/core).
+            
+    Returns:
+        tuple: (cluster_results, optimal_n, best_silhouette)
+    """
+    # Minimum data requirement: at least 15 sentences to try clustering up to 5-8 groups
+    if len(valid_sentences) < 15:
+        return [], 0, 0.0
+        
+    fitted = _auto_k(valid_sentences, seed, n_jobs)
+    if fitted is None:
+        return [], 0, 0.0
+    best_k, best_score, labels, top_terms_list = fitted
     
     # 5. Extract Results
-    feature_names = vectorizer.get_feature_names_out()
     cluster_results = []
     
+    # Batch scoring semua kalimat sekali saja (kecuali sudah tersedia)
+    if compounds is None:
+        compounds = [score['compound'] for score in score_sentences(valid_sentences)]
+    compounds = np.asarray(compounds, dtype=float)
+    
     for i in range(best_k):
-        indices = np.where(final_kmeans.labels_ == i)[0]
-        cluster_sentences = [valid_sentences[idx] for idx in indices]
+        indices = np.where(labels == i)[0]
         
         # Calculate Average Sentiment
-        sentiment_scores = [get_vader_score(s)['compound'] for s in cluster_sentences]
-        avg_score = np.mean(sentiment_scores) if sentiment_scores else 0.0
+        sentiment_scores = compounds[indices]
+        avg_score = float(np.mean(sentiment_scores)) if len(sentiment_scores) else 0.0
         
         # Get Top Terms
-        centroid = final_kmeans.cluster_centers_[i]
-        top_indices = centroid.argsort()[-3:][::-1] # Top 3
-        top_terms = [feature_names[ind] for ind in top_indices]
-        
+        top_terms = top_terms_list[i]
         label = ", ".join([t.title() for t in top_terms])
         
         cluster_results.append({
             'cluster_id': i,
             'label': label,
-            'count': len(cluster_sentences),
+            'count': len(indices),
             'avg_sentiment': avg_score,
             'top_terms': top_terms,
             'optimal_n': best_k,
@@ -851,3 +1658,182 @@ def perform_optimized_clustering(text):
     cluster_results.sort(key=lambda x: x['avg_sentiment'], reverse=True)
         
     return cluster_results, best_k, best_score
+
+
+SECTION_LABELS = {'opening': 'Opening Speech', 'qa': 'Q&A Session'}
+
+class TranscriptAnalysis:
+    """
+    Analisis satu transkrip dari satu kali parsing.
+    
+    Setiap kalimat Opening dan Q&A di-parse sekali (nlp.pipe) dan di-skor sekali.
+    Semua metrik (skor section, sentence flow, certainty, topik, highlights,
+    keyword context, input clustering) diturunkan secara lazy dari state tersebut.
+    """
+    
+    def __init__(self, opening, qa, batch_size=DEFAULT_BATCH_SIZE, n_process=1, engine=None):
+        """
+        Args:
+            opening (str): Opening Speech yang sudah dibersihkan (preprocessor.clean_text).
+            qa (str): Q&A Powell yang sudah difilter & dibersihkan.
+            batch_size (int): Jumlah kalimat per batch spaCy.
+            n_process (int): Jumlah proses spaCy.
+            engine (FomcSentimentEngine, optional): Default: engine global.
+        """
+        self.opening = opening
+        self.qa = qa
+        self.text = opening + " " + qa
+        self.engine = engine or get_engine()
+        
+        # Record per kalimat: text, section, features (fused token pass), scores
+        self.sentences = []
+        for section, section_text in (('opening', opening), ('qa', qa)):
+            for sent in split_sentences(section_text):
+                self.sentences.append({'text': sent, 'section': section})
+                
+        records = self.engine.analyze_many([item['text'] for item in self.sentences], batch_size=batch_size, n_process=n_process)
+        for item, (features, scores) in zip(self.sentences, records):
+            item['features'] = features
+            item['scores'] = scores
+            
+        self._keyword_cache = {}
+        
+    def _section(self, section):
+        return [item for item in self.sentences if item['section'] == section]
+        
+    def _combined_score(self, items):
+        """Skor VADER dari gabungan kalimat (tanpa parsing ulang)."""
+        return self.engine.score_combined([item['features'] for item in items])
+        
+    @cached_property
+    def opening_scores(self):
+        """Skor VADER Opening Speech (setara get_vader_score(opening))."""
+        return self._combined_score(self._section('opening'))
+        
+    @cached_property
+    def qa_scores(self):
+        """Skor VADER Q&A Session (setara get_vader_score(qa))."""
+        return self._combined_score(self._section('qa'))
+        
+    @cached_property
+    def overall_scores(self):
+        """Skor VADER transkrip gabungan (Opening + Q&A)."""
+        return self._combined_score(self.sentences)
+        
+    def sentence_scores(self, section):
+        """
+        Sentence flow per section (setara get_sentence_scores).
+        
+        Args:
+            section (str): 'opening' atau 'qa'.
+            
+        Returns:
+            list: List of dict [{'seq': int, 'text': str, 'compound': float}, ...]
+        """
+        results = []
+        for i, item in enumerate(self._section(section)):
+            if len(item['text'].split()) < 3: continue # Skip kalimat terlalu pendek
+            results.append({
+                'seq': i + 1,
+                'text': item['text'],
+                'compound': item['scores']['compound']
+            })
+        return results
+        
+    @cached_property
+    def opening_sentences(self):
+        return self.sentence_scores('opening')
+        
+    @cached_property
+    def qa_sentences(self):
+        return self.sentence_scores('qa')
+        
+    def certainty(self, section):
+        """
+        Certainty Index per section (setara analyze_certainty).
+        """
+        certain_count = uncertain_count = total_words = 0
+        for item in self._section(section):
+            features = item['features']
+            certain_count += features.certain
+            uncertain_count += features.uncertain
+            total_words += features.total_words
+        return certainty_from_counts(certain_count, uncertain_count, total_words)
+        
+    @cached_property
+    def certainty_opening(self):
+        return self.certainty('opening')
+        
+    @cached_property
+    def certainty_qa(self):
+        return self.certainty('qa')
+        
+    @cached_property
+    def topic_scores(self):
+        """Skor sentimen per topik (setara analyze_topic_sentiment)."""
+        return topic_scores_from_features([item['features'] for item in self.sentences], self.engine)
+        
+    def highlights(self, num=3):
+        """Kalimat paling positif & negatif (setara extract_key_highlights)."""
+        return select_highlights(
+            (
+                {'text': item['text'], 'score': item['scores']['compound'], 'source': SECTION_LABELS[item['section']]}
+                for item in self.sentences if len(item['text'].split()) >= 5
+            ),
+            num
+        )
+        
+    @cached_property
+    def keyword_frequencies(self):
+        """Frekuensi kata kunci Noun & Adjective dari Doc yang sudah di-parse (input Word Cloud)."""
+        return keyword_counts(item['features'] for item in self.sentences)
+        
+    def top_keywords(self, n=20):
+        """Kata kunci dominan (setara get_top_keywords)."""
+        return [word for word, count in self.keyword_frequencies.most_common(n)]
+        
+    def keyword_context(self, keyword):
+        """
+        Kalimat yang mengandung keyword (kata utuh, bukan substring) beserta skornya.
+        Hasil di-cache per keyword. Untuk query lintas pertemuan lihat keyword_index.KeywordIndex.
+        """
+        keyword = keyword.lower()
+        if keyword not in self._keyword_cache:
+            pattern = re.compile(rf"\b{re.escape(keyword)}\b")
+            self._keyword_cache[keyword] = [
+                {'seq': i + 1, 'text': item['text'], 'compound': item['scores']['compound']}
+                for i, item in enumerate(self.sentences)
+                if pattern.search(item['text'].lower())
+            ]
+        return self._keyword_cache[keyword]
+        
+    @cached_property
+    def cluster_input(self):
+        """
+        Kalimat panjang (> 5 kata) dan skor compound-nya, untuk clustering & validasi.
+        
+        Returns:
+            tuple: (sentences, compounds)
+        """
+        items = [item for item in self.sentences if len(item['text'].split()) > 5]
+        return [item['text'] for item in items], [item['scores']['compound'] for item in items]
+        
+    def clusters(self):
+        """Auto-K clustering (setara perform_optimized_clustering) tanpa scoring ulang."""
+        sentences, compounds = self.cluster_input
+        return cluster_sentences(sentences, compounds)
+
+def transcript_sentences(path, target_speaker="CHAIR POWELL", engine=None):
+    """
+    Kalimat panjang (> 5 kata) + skor compound dari satu file transkrip
+    (sama dengan TranscriptAnalysis.cluster_input).
+    
+    Returns:
+        tuple: (sentences, compounds), atau ([], []) jika separator tidak ditemukan.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    opening, qa, _ = prepare_transcript(text, target_speaker)
+    if opening is None:
+        return [], []
+    return TranscriptAnalysis(opening, qa, engine=engine).cluster_input
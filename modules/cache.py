@@ -0,0 +1,215 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# Lokasi default cache di disk (bisa di-override lewat environment variable)
+CACHE_DIR = os.environ.get('FOMC_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache'))
+
+# SQLite membatasi jumlah parameter per query
+_SQL_CHUNK = 500
+
+# Granularitas LRU: last_used hanya diperbarui jika lebih tua dari ini (detik),
+# sehingga lookup yang hit (warm run) praktis tidak menulis ke SQLite
+TOUCH_INTERVAL = 3600
+
+# Jumlah entry dihitung ulang (COUNT(*)) paling lambat setiap N batch put,
+# untuk menampung insert dari proses lain yang tidak tercatat di counter lokal
+RECOUNT_INTERVAL = 100
+
+def text_hash(text):
+    """Hash konten (SHA-1) dari sebuah kalimat/teks."""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+def make_fingerprint(*parts):
+    """
+    Membuat fingerprint pendek dari objek-objek yang menentukan hasil skor
+    (lexicon, tabel hedge, kode aturan, versi model, dst).
+    """
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+def cache_path(filename):
+    """Path file cache di dalam CACHE_DIR (direktori dibuat jika belum ada)."""
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return os.path.join(CACHE_DIR, filename)
+
+class ScoreCache:
+    """
+    Cache skor per kalimat di disk (SQLite, WAL mode), content-addressed.
+
+    Key = fingerprint + hash(kalimat), sehingga perubahan lexicon/aturan otomatis
+    membuat entry lama tidak terpakai. Value disimpan sebagai JSON.
+    Mendukung bulk get/put, eviction berbasis ukuran (LRU, granularitas TOUCH_INTERVAL)
+    dan counter hit/miss.
+    """
+
+    def __init__(self, path, fingerprint='', max_entries=500000):
+        """
+        Args:
+            path (str): Lokasi file SQLite.
+            fingerprint (str): Fingerprint konfigurasi skor (lihat make_fingerprint).
+            max_entries (int): Jumlah entry maksimum sebelum entry terlama dibuang.
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+        self._entries = None
+        self._puts = 0
+
+    def _connection(self):
+        # Koneksi dibuka ulang di proses anak (fork) agar tidak berbagi handle SQLite
+        if self._conn is None or self._pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS scores ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_scores_last_used ON scores(last_used)")
+            conn.commit()
+            self._conn = conn
+            self._pid = os.getpid()
+            self._entries = None
+        return self._conn
+
+    def _key(self, text):
+        return f"{self.fingerprint}:{text_hash(text)}"
+
+    def get_many(self, texts):
+        """
+        Bulk lookup.
+
+        Args:
+            texts (list): List kalimat.
+
+        Returns:
+            list: Value (hasil json.loads) per kalimat, atau None jika tidak ada di cache.
+        """
+        keys = [self._key(text) for text in texts]
+        found = {}
+        stale = []
+        now = time.time()
+        stale_before = now - TOUCH_INTERVAL
+        with self._lock:
+            conn = self._connection()
+            unique_keys = list(dict.fromkeys(keys))
+            for start in range(0, len(unique_keys), _SQL_CHUNK):
+                chunk = unique_keys[start:start + _SQL_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(f"SELECT key, value, last_used FROM scores WHERE key IN ({placeholders})", chunk)
+                for key, value, last_used in rows:
+                    found[key] = value
+                    if last_used < stale_before:
+                        stale.append(key)
+            if stale:
+                conn.executemany("UPDATE scores SET last_used = ? WHERE key = ?", [(now, key) for key in stale])
+                conn.commit()
+
+        results = []
+        for key in keys:
+            value = found.get(key)
+            results.append(None if value is None else json.loads(value))
+        # Counter dibagi antar thread (sesi Streamlit, clustering ThreadPool): update di bawah lock
+        hits = len(keys) - results.count(None)
+        with self._lock:
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return results
+
+    def put_many(self, texts, values):
+        """
+        Bulk insert/update.
+
+        Args:
+            texts (list): List kalimat.
+            values (list): Value JSON-serializable per kalimat.
+        """
+        now = time.time()
+        rows = [(self._key(text), json.dumps(value), now) for text, value in zip(texts, values)]
+        if not rows:
+            return
+        with self._lock:
+            conn = self._connection()
+            conn.executemany("INSERT OR REPLACE INTO scores (key, value, last_used) VALUES (?, ?, ?)", rows)
+            self._evict(conn, len(rows))
+            conn.commit()
+
+    def get(self, text):
+        return self.get_many([text])[0]
+
+    def put(self, text, value):
+        self.put_many([text], [value])
+
+    def _evict(self, conn, inserted):
+        # Counter lokal = batas atas jumlah entry (INSERT OR REPLACE dihitung sebagai entry baru);
+        # COUNT(*) hanya dijalankan saat batas mungkin terlampaui atau setiap RECOUNT_INTERVAL batch
+        self._puts += 1
+        if self._entries is not None:
+            self._entries += inserted
+        if self._entries is None or self._entries > self.max_entries or self._puts % RECOUNT_INTERVAL == 0:
+            (self._entries,) = conn.execute("SELECT COUNT(*) FROM scores").fetchone()
+
+        # Buang entry yang paling lama tidak dipakai jika melebihi batas
+        excess = self._entries - self.max_entries
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM scores WHERE key IN (SELECT key FROM scores ORDER BY last_used ASC LIMIT ?)",
+                (excess,)
+            )
+            self._entries = self.max_entries
+
+    def stats(self):
+        """
+        Returns:
+            dict: {'hits': int, 'misses': int, 'hit_rate': float, 'entries': int}
+        """
+        with self._lock:
+            (entries,) = self._connection().execute("SELECT COUNT(*) FROM scores").fetchone()
+            hits, misses = self.hits, self.misses
+        total = hits + misses
+        return {
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': hits / total if total else 0.0,
+            'entries': entries
+        }
+
+    def clear(self):
+        """Menghapus semua entry cache."""
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM scores")
+            conn.commit()
+            self._entries = 0
+            self.hits = 0
+            self.misses = 0
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def __getstate__(self):
+        # Koneksi SQLite tidak bisa di-pickle (mis. dikirim ke worker process)
+        state = self.__dict__.copy()
+        state['_conn'] = None
+        state['_pid'] = None
+        state['_lock'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -0,0 +1,478 @@
+"""
+Headless batch CLI untuk menjalankan pipeline FOMC VADER tanpa Streamlit.
+
+Contoh:
+    python -m modules.cli analyze fomc-transcript --workers 4 --out output --format parquet --reports html
+    python -m modules.cli reports fomc-transcript --format html pdf
+    python -m modules.cli validate fomc-transcript --backend int8
+"""
+import argparse
+import glob
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+OUTPUT_FORMATS = ('parquet', 'csv', 'json')
+REPORT_FORMATS = ('html', 'pdf')
+REPORT_MANIFEST = 'reports_manifest.json'
+
+def expand_inputs(inputs):
+    """
+    Mengubah daftar direktori / glob / file menjadi daftar path transkrip (.txt) unik & terurut.
+    """
+    paths = []
+    for item in inputs:
+        if os.path.isdir(item):
+            paths.extend(os.path.join(item, f) for f in os.listdir(item) if f.endswith('.txt'))
+        else:
+            paths.extend(glob.glob(item))
+    return sorted(set(paths))
+
+def _meeting_date(filename):
+    match = re.search(r'(\d{8})', filename)
+    if not match:
+        return None
+    try:
+        return datetime.strptime(match.group(1), '%Y%m%d').date()
+    except ValueError:
+        return None
+
+def _init_worker():
+    from modules.nlp import get_nlp
+    get_nlp('rules')
+
+def write_reports(analysis, filename, report_dir, report_formats, plotlyjs='cdn', section=False):
+    """
+    Menulis laporan HTML/PDF satu transkrip.
+
+    Args:
+        plotlyjs (str): Sumber plotly.js laporan HTML (lihat reporter.generate_html_report).
+        section (bool): Juga kembalikan fragmen HTML untuk laporan gabungan.
+
+    Returns:
+        dict: {'reports': list path file laporan yang ditulis, 'section': str atau None}
+    """
+    from modules import analyzer, reporter, visualizer
+
+    base = os.path.splitext(filename)[0]
+    fig_comparison = visualizer.plot_comparison(analysis.opening_scores, analysis.qa_scores)
+    fig_flow = visualizer.plot_sentiment_flow(analysis.opening_sentences, analysis.qa_sentences)
+    highlights = analysis.highlights()
+    written = []
+
+    if 'html' in report_formats:
+        html = reporter.generate_html_report(
+            filename, analysis.opening_scores, analysis.qa_scores, analysis.topic_scores,
+            fig_comparison, fig_flow, highlights, plotlyjs=plotlyjs
+        )
+        path = os.path.join(report_dir, f"laporan_{base}.html")
+        with open(path, 'wb') as f:
+            f.write(html)
+        written.append(path)
+
+    if 'pdf' in report_formats:
+        conclusion = analyzer.generate_smart_conclusion(
+            analysis.opening_scores['compound'], analysis.qa_scores['compound']
+        )
+        pdf = reporter.generate_pdf_report(
+            filename, analysis.opening_scores, analysis.qa_scores, analysis.topic_scores,
+            fig_comparison, fig_flow, highlights, conclusion,
+            analysis.certainty_opening, analysis.certainty_qa
+        )
+        if pdf is None:
+            raise RuntimeError("PDF generation failed")
+        path = os.path.join(report_dir, f"laporan_{base}.pdf")
+        with open(path, 'wb') as f:
+            f.write(pdf)
+        written.append(path)
+
+    fragment = None
+    if section:
+        fragment = reporter.render_meeting_section(
+            filename, analysis.opening_scores, analysis.qa_scores, analysis.topic_scores,
+            fig_comparison, fig_flow, highlights
+        )
+    return {'reports': written, 'section': fragment}
+
+def process_file(path, report_dir=None, report_formats=(), target_speaker="CHAIR POWELL", plotlyjs='cdn', section=False):
+    """
+    Menjalankan pipeline preprocessor -> analyzer untuk satu file transkrip.
+
+    Returns:
+        dict: {'meeting': dict, 'sentences': list, 'reports': list, 'section': str atau None, 'seconds': float}
+    """
+    from modules import analyzer, preprocessor
+
+    start = time.perf_counter()
+    filename = os.path.basename(path)
+
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    opening, qa, _ = preprocessor.prepare_transcript(text, target_speaker)
+    if opening is None:
+        raise ValueError("Separator Opening/Q&A tidak ditemukan")
+
+    analysis = analyzer.TranscriptAnalysis(opening, qa)
+
+    meeting = {
+        'filename': filename,
+        'date': _meeting_date(filename),
+        'opening_compound': analysis.opening_scores['compound'],
+        'qa_compound': analysis.qa_scores['compound'],
+        'overall_compound': analysis.overall_scores['compound'],
+        'certainty_opening': analysis.certainty_opening['score'],
+        'certainty_qa': analysis.certainty_qa['score'],
+        'n_sentences': len(analysis.sentences),
+    }
+    for topic, score in analysis.topic_scores.items():
+        meeting[f"topic_{topic.lower().replace(' ', '_')}"] = score
+
+    sentences = []
+    for section in analyzer.SECTION_LABELS:
+        for item in analysis.sentence_scores(section):
+            sentences.append({
+                'filename': filename,
+                'section': analyzer.SECTION_LABELS[section],
+                'seq': item['seq'],
+                'text': item['text'],
+                'compound': item['compound'],
+            })
+
+    written = {'reports': [], 'section': None}
+    if report_formats or section:
+        written = write_reports(analysis, filename, report_dir, report_formats, plotlyjs, section)
+
+    return {
+        'meeting': meeting,
+        'sentences': sentences,
+        'reports': written['reports'],
+        'section': written['section'],
+        'seconds': time.perf_counter() - start,
+    }
+
+def _run_all(paths, workers, report_dir, report_formats, **options):
+    """
+    Yields (path, result atau None, exception atau None) dalam urutan input.
+    `options` diteruskan ke process_file (mis. plotlyjs, section).
+    """
+    if workers <= 1 or len(paths) < 2:
+        for path in paths:
+            try:
+                yield path, process_file(path, report_dir, report_formats, **options), None
+            except Exception as e:
+                yield path, None, e
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(paths)), initializer=_init_worker) as executor:
+        futures = [executor.submit(process_file, path, report_dir, report_formats, **options) for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                yield path, future.result(), None
+            except Exception as e:
+                yield path, None, e
+
+def parquet_engine_available():
+    """True jika engine parquet pandas (pyarrow atau fastparquet) terinstal."""
+    import importlib.util
+    return any(importlib.util.find_spec(engine) is not None for engine in ('pyarrow', 'fastparquet'))
+
+def write_table(df, out_dir, name, fmt):
+    """Menulis DataFrame ke out_dir/name.fmt (parquet/csv/json)."""
+    path = os.path.join(out_dir, f"{name}.{fmt}")
+    if fmt == 'parquet':
+        df.to_parquet(path, index=False)
+    elif fmt == 'csv':
+        df.to_csv(path, index=False)
+    else:
+        df.to_json(path, orient='records', date_format='iso', indent=1)
+    return path
+
+def cmd_analyze(args):
+    import pandas as pd
+
+    # Cek engine parquet sebelum memproses transkrip (bukan gagal setelah semua selesai)
+    if 'parquet' in args.format and not parquet_engine_available():
+        print("Format parquet membutuhkan pyarrow (pip install pyarrow) atau fastparquet.", file=sys.stderr)
+        return 1
+
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        print("Tidak ada file transkrip ditemukan.", file=sys.stderr)
+        return 1
+
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    report_formats = tuple(args.reports or ())
+    report_dir = os.path.join(args.out, 'reports')
+    os.makedirs(args.out, exist_ok=True)
+    if report_formats:
+        os.makedirs(report_dir, exist_ok=True)
+
+    print(f"Processing {len(paths)} transcripts with {workers} worker(s)...")
+    start = time.perf_counter()
+
+    meetings = []
+    sentences = []
+    failed = 0
+    for path, result, error in _run_all(paths, workers, report_dir, report_formats):
+        filename = os.path.basename(path)
+        if error is not None:
+            failed += 1
+            print(f"Error processing {filename}: {error}")
+            continue
+        meetings.append(result['meeting'])
+        sentences.extend(result['sentences'])
+        print(f"  {filename}: {len(result['sentences'])} sentences in {result['seconds']:.2f}s")
+
+    df_meetings = pd.DataFrame(meetings)
+    df_sentences = pd.DataFrame(sentences)
+
+    if args.market and not df_meetings.empty:
+        from modules.market import MarketData
+        market_data = MarketData(offline=args.offline)
+        dated = df_meetings['date'].notna()
+        changes = market_data.close_open_change(list(df_meetings.loc[dated, 'date']))
+        df_meetings.loc[dated, 'market_change'] = changes
+
+    if not df_meetings.empty:
+        df_meetings = df_meetings.sort_values(['date', 'filename'], na_position='last')
+
+    for name, df in (('meetings', df_meetings), ('sentences', df_sentences)):
+        for fmt in args.format:
+            print(f"Wrote {write_table(df, args.out, name, fmt)}")
+
+    elapsed = time.perf_counter() - start
+    n_docs = len(meetings)
+    n_sents = len(sentences)
+    print(
+        f"Done: {n_docs} docs ({failed} failed), {n_sents} sentences in {elapsed:.2f}s "
+        f"-> {n_docs / elapsed:.2f} docs/s, {n_sents / elapsed:.1f} sentences/s"
+    )
+    return 1 if failed and not n_docs else 0
+
+def _load_report_manifest(path, fingerprint):
+    import json
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    # Laporan dari lexicon/versi laporan/format berbeda dibuat ulang
+    return data.get('entries', {}) if data.get('fingerprint') == fingerprint else {}
+
+def _save_report_manifest(path, fingerprint, entries):
+    import json
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'fingerprint': fingerprint, 'entries': entries}, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def cmd_reports(args):
+    from modules import analyzer, reporter
+    from modules.cache import make_fingerprint
+    from modules.corpus import file_sha256
+
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        print("Tidak ada file transkrip ditemukan.", file=sys.stderr)
+        return 1
+
+    os.makedirs(args.out, exist_ok=True)
+    report_formats = tuple(sorted(set(args.format)))
+    fingerprint = make_fingerprint(reporter.REPORT_VERSION, analyzer.get_engine().fingerprint, report_formats, args.plotlyjs)
+    manifest_path = os.path.join(args.out, REPORT_MANIFEST)
+    entries = {} if args.force else _load_report_manifest(manifest_path, fingerprint)
+
+    hashes = {path: file_sha256(path) for path in paths}
+
+    # plotly.js: satu bundle lokal bersama untuk semua laporan (viewer offline), CDN, atau disematkan per file
+    plotlyjs = reporter.write_plotly_bundle(args.out) if args.plotlyjs == 'shared' else args.plotlyjs
+    # Fragmen per pertemuan untuk laporan gabungan ikut di-cache agar pertemuan yang dilewati tetap masuk
+    section_dir = os.path.join(args.out, 'sections')
+    if args.combined:
+        os.makedirs(section_dir, exist_ok=True)
+
+    def section_path(filename):
+        return os.path.join(section_dir, os.path.splitext(os.path.basename(filename))[0] + '.html')
+
+    def up_to_date(path):
+        entry = entries.get(os.path.basename(path))
+        return (
+            entry is not None and entry['sha256'] == hashes[path]
+            and all(os.path.exists(os.path.join(args.out, name)) for name in entry['reports'])
+            and (not args.combined or os.path.exists(section_path(path)))
+        )
+
+    pending = [path for path in paths if not up_to_date(path)]
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+    print(
+        f"{len(paths)} transcripts: {len(paths) - len(pending)} up to date, "
+        f"{len(pending)} to render with {workers} worker(s)..."
+    )
+    start = time.perf_counter()
+
+    failed = 0
+    results = _run_all(pending, workers, args.out, report_formats, plotlyjs=plotlyjs, section=args.combined)
+    for path, result, error in results:
+        filename = os.path.basename(path)
+        if error is not None:
+            failed += 1
+            entries.pop(filename, None)
+            print(f"Error processing {filename}: {error}")
+            continue
+        if result['section'] is not None:
+            with open(section_path(path), 'w', encoding='utf-8') as f:
+                f.write(result['section'])
+        meeting = result['meeting']
+        entries[filename] = {
+            'sha256': hashes[path],
+            'date': meeting['date'].isoformat() if meeting['date'] else None,
+            'opening_compound': meeting['opening_compound'],
+            'qa_compound': meeting['qa_compound'],
+            'overall_compound': meeting['overall_compound'],
+            'reports': [os.path.basename(report) for report in result['reports']],
+            'seconds': result['seconds'],
+        }
+        # Simpan setelah setiap file agar job yang terhenti tidak mengulang laporan yang sudah selesai
+        _save_report_manifest(manifest_path, fingerprint, entries)
+        print(f"  {filename}: {', '.join(entries[filename]['reports'])} in {result['seconds']:.2f}s")
+
+    index = [
+        {'filename': os.path.basename(path), **entries[os.path.basename(path)]}
+        for path in paths if os.path.basename(path) in entries
+    ]
+    index_path = os.path.join(args.out, 'index.html')
+    with open(index_path, 'wb') as f:
+        f.write(reporter.generate_index_page(index))
+    print(f"Wrote {index_path}")
+
+    if args.combined:
+        sections = []
+        for entry in sorted(index, key=lambda e: (e['date'] or '', e['filename'])):
+            with open(section_path(entry['filename']), 'r', encoding='utf-8') as f:
+                sections.append((entry['filename'], f.read()))
+        combined_path = os.path.join(args.out, 'all_meetings.html')
+        with open(combined_path, 'wb') as f:
+            f.write(reporter.generate_combined_report(sections, plotlyjs='inline'))
+        print(f"Wrote {combined_path}")
+
+    elapsed = time.perf_counter() - start
+    rendered = len(pending) - failed
+    print(
+        f"Done: {rendered} rendered ({failed} failed), {len(paths) - len(pending)} skipped in {elapsed:.2f}s"
+        + (f" -> {elapsed / rendered:.2f}s per meeting" if rendered else "")
+    )
+    return 1 if failed else 0
+
+def cmd_parity(args):
+    from modules import analyzer
+
+    tolerance = analyzer.PARITY_TOLERANCE if args.tolerance is None else args.tolerance
+    report = analyzer.check_vectorized_parity(args.directory, tolerance=tolerance)
+    for sent, ref, out in report['examples']:
+        print(f"MISMATCH {sent[:80]!r}: vader={ref} vectorized={out}")
+    print(
+        f"{report['sentences']} sentences, {report['mismatches']} mismatches "
+        f"(max |diff| {report['max_abs_diff']:.2e}, tolerance {tolerance:.0e}); "
+        f"VADER {report['vader_seconds']:.2f}s, vectorized {report['vectorized_seconds']:.2f}s"
+    )
+    return 0 if report['passed'] else 1
+
+def cmd_validate(args):
+    import json
+    from modules import corpus_validation, validator
+
+    scorer = validator.get_finbert(args.model, args.backend)
+    job = corpus_validation.CorpusValidation(
+        args.directory, checkpoint=args.checkpoint, scorer=scorer, n_boot=args.bootstrap
+    )
+    if args.restart:
+        job.reset()
+    done = len(job.meetings)
+    if done:
+        print(f"Resuming from checkpoint: {done} meeting(s) already validated.")
+
+    def report(filename, entry):
+        print(
+            f"  {filename}: n={entry['n']} pearson={entry['pearson']:+.3f} "
+            f"[{entry['pearson_ci_low']:+.3f}, {entry['pearson_ci_high']:+.3f}] "
+            f"spearman={entry['spearman']:+.3f} [{entry['spearman_ci_low']:+.3f}, {entry['spearman_ci_high']:+.3f}]"
+        )
+
+    start = time.perf_counter()
+    processed = job.run(batch_size=args.batch_size, progress=report)
+    elapsed = time.perf_counter() - start
+
+    os.makedirs(args.out, exist_ok=True)
+    print(f"Wrote {write_table(job.meeting_table(), args.out, 'validation_meetings', 'csv')}")
+    pooled = job.pooled()
+    path = os.path.join(args.out, 'validation_pooled.json')
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(pooled, f, indent=1)
+    print(f"Wrote {path}")
+
+    print(
+        f"Pooled ({pooled['meetings']} meetings, {pooled['n']} sentences): "
+        f"pearson={pooled['pearson']:+.3f} [{pooled['pearson_ci_low']:+.3f}, {pooled['pearson_ci_high']:+.3f}], "
+        f"spearman={pooled['spearman']:+.3f} [{pooled['spearman_ci_low']:+.3f}, {pooled['spearman_ci_high']:+.3f}]"
+        + ("" if pooled['exact_rank_stats'] else f" (rank stats & CIs from a {pooled['sample_size']}-sentence sample)")
+    )
+    n_sents = sum(job.meetings[f]['n'] for f in processed)
+    print(f"Validated {len(processed)} new meeting(s), {n_sents} sentences in {elapsed:.2f}s")
+    return 0
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='python -m modules.cli', description="FOMC VADER batch pipeline (headless).")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    p_analyze = subparsers.add_parser('analyze', help="Analisis korpus transkrip dan tulis hasil per pertemuan & per kalimat.")
+    p_analyze.add_argument('inputs', nargs='+', help="Direktori, glob, atau file transkrip (.txt).")
+    p_analyze.add_argument('--workers', type=int, default=1, help="Jumlah worker process (0 = semua core).")
+    p_analyze.add_argument('--out', default='output', help="Direktori output.")
+    p_analyze.add_argument('--format', nargs='+', choices=OUTPUT_FORMATS, default=['csv'], help="Format tabel output.")
+    p_analyze.add_argument('--reports', nargs='*', choices=REPORT_FORMATS, help="Tulis laporan per pertemuan (html/pdf).")
+    p_analyze.add_argument('--market', action='store_true', help="Tambahkan % perubahan S&P 500 per pertemuan.")
+    p_analyze.add_argument('--offline', action='store_true', help="Data pasar hanya dari cache lokal (tanpa jaringan).")
+    p_analyze.set_defaults(func=cmd_analyze)
+
+    p_reports = subparsers.add_parser('reports', help="Buat laporan HTML/PDF per pertemuan + halaman indeks (lewati yang tidak berubah).")
+    p_reports.add_argument('inputs', nargs='*', default=['fomc-transcript'], help="Direktori, glob, atau file transkrip (.txt).")
+    p_reports.add_argument('--out', default=os.path.join('output', 'reports'), help="Direktori laporan.")
+    p_reports.add_argument('--format', nargs='+', choices=REPORT_FORMATS, default=['html', 'pdf'], help="Format laporan.")
+    p_reports.add_argument('--workers', type=int, default=0, help="Jumlah worker process (0 = semua core).")
+    p_reports.add_argument('--plotlyjs', choices=('shared', 'cdn', 'inline'), default='shared',
+                           help="plotly.js laporan HTML: satu bundle lokal bersama (default), CDN, atau disematkan per file.")
+    p_reports.add_argument('--combined', action='store_true',
+                           help="Tulis juga all_meetings.html: satu laporan mandiri semua pertemuan (plotly.js disematkan sekali).")
+    p_reports.add_argument('--force', action='store_true', help="Buat ulang semua laporan.")
+    p_reports.set_defaults(func=cmd_reports)
+
+    p_parity = subparsers.add_parser('parity', help="Cek parity scorer vectorized vs VADER pada seluruh kalimat korpus.")
+    p_parity.add_argument('directory', nargs='?', default='fomc-transcript', help="Direktori transkrip (.txt).")
+    p_parity.add_argument('--tolerance', type=float, default=None, help="Selisih absolut maksimum per skor (default: analyzer.PARITY_TOLERANCE).")
+    p_parity.set_defaults(func=cmd_parity)
+
+    p_validate = subparsers.add_parser('validate', help="Validasi VADER vs FinBERT pada seluruh korpus (bisa dilanjutkan dari checkpoint).")
+    p_validate.add_argument('directory', nargs='?', default='fomc-transcript', help="Direktori transkrip (.txt).")
+    p_validate.add_argument('--out', default='output', help="Direktori output.")
+    p_validate.add_argument('--model', default=None, help="Nama/path model FinBERT (default: env FOMC_FINBERT_MODEL).")
+    p_validate.add_argument('--backend', choices=('torch', 'int8', 'onnx'), default=None, help="Backend inferensi FinBERT.")
+    p_validate.add_argument('--batch-size', type=int, default=None, help="Ukuran batch inferensi FinBERT.")
+    p_validate.add_argument('--bootstrap', type=int, default=1000, help="Jumlah resample bootstrap.")
+    p_validate.add_argument('--checkpoint', default=None, help="File checkpoint (default: di direktori cache).")
+    p_validate.add_argument('--restart', action='store_true', help="Abaikan checkpoint dan mulai dari awal.")
+    p_validate.set_defaults(func=cmd_validate)
+
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,149 @@
+import hashlib
+import json
+import os
+from datetime import date
+
+from modules.cache import cache_path
+
+MANIFEST_VERSION = 1
+
+def file_sha256(path):
+    """Hash konten file (SHA-256)."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def manifest_path(directory):
+    """Lokasi default manifest untuk sebuah direktori korpus (di CACHE_DIR)."""
+    key = hashlib.sha1(os.path.abspath(directory).encode('utf-8')).hexdigest()[:12]
+    return cache_path(f"corpus_{key}.json")
+
+class CorpusManifest:
+    """
+    Manifest korpus historis yang tersimpan di disk.
+
+    Mencatat size, mtime, hash konten, skor sentimen, dan data pasar per file,
+    sehingga analisis historis hanya memproses file baru/berubah dan membuang
+    file yang sudah dihapus.
+    """
+
+    def __init__(self, directory, fingerprint='', path=None):
+        """
+        Args:
+            directory (str): Direktori transkrip (.txt).
+            fingerprint (str): Fingerprint engine skor; jika berbeda, semua file diproses ulang.
+            path (str, optional): Lokasi file manifest (default: manifest_path(directory)).
+        """
+        self.directory = directory
+        self.fingerprint = fingerprint
+        self.path = path or manifest_path(directory)
+        self.entries = {}
+        self._hashes = {}
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        # Manifest dari versi/lexicon berbeda tidak dipakai ulang
+        if data.get('version') == MANIFEST_VERSION and data.get('fingerprint') == self.fingerprint:
+            self.entries = data.get('entries', {})
+
+    def save(self):
+        """Menyimpan manifest secara atomik."""
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': MANIFEST_VERSION,
+                'fingerprint': self.fingerprint,
+                'entries': self.entries
+            }, f, indent=1, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def sync(self):
+        """
+        Membandingkan manifest dengan isi direktori.
+        File yang dihapus dibuang dari manifest; file dengan size/mtime berubah
+        dicek hash-nya sebelum dianggap berubah.
+
+        Returns:
+            list: Nama file yang perlu (di)proses ulang.
+        """
+        files = sorted(f for f in os.listdir(self.directory) if f.endswith('.txt'))
+
+        for filename in set(self.entries) - set(files):
+            del self.entries[filename]
+
+        pending = []
+        for filename in files:
+            path = os.path.join(self.directory, filename)
+            stat = os.stat(path)
+            entry = self.entries.get(filename)
+
+            if entry and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime:
+                continue
+
+            sha256 = file_sha256(path)
+            if entry and entry['sha256'] == sha256:
+                # Konten sama (mis. file di-touch): cukup perbarui stat
+                entry['size'] = stat.st_size
+                entry['mtime'] = stat.st_mtime
+                continue
+
+            self.entries.pop(filename, None)
+            self._hashes[filename] = sha256
+            pending.append(filename)
+
+        return pending
+
+    def update(self, filename, record):
+        """
+        Menyimpan hasil analisis satu file.
+
+        Args:
+            filename (str): Nama file di direktori korpus.
+            record (dict): {'date': date, 'compound': float, 'market_change': float|None, ...}
+        """
+        path = os.path.join(self.directory, filename)
+        stat = os.stat(path)
+        entry = dict(record)
+        entry['date'] = record['date'].isoformat()
+        entry['size'] = stat.st_size
+        entry['mtime'] = stat.st_mtime
+        entry['sha256'] = self._hashes.pop(filename, None) or file_sha256(path)
+        self.entries[filename] = entry
+
+    def missing_market(self):
+        """
+        Returns:
+            list: List tuple (filename, date) untuk entry yang belum punya market_change.
+        """
+        return sorted(
+            (filename, date.fromisoformat(entry['date']))
+            for filename, entry in self.entries.items()
+            if entry.get('market_change') is None
+        )
+
+    def set_market_change(self, filename, market_change):
+        self.entries[filename]['market_change'] = market_change
+
+    def historical_data(self):
+        """
+        Returns:
+            list: List of dict [{'date': date, 'compound': float, 'market_change': float, 'filename': str}, ...]
+            terurut berdasarkan tanggal.
+        """
+        data = []
+        for filename, entry in self.entries.items():
+            data.append({
+                'date': date.fromisoformat(entry['date']),
+                'compound': entry['compound'],
+                'market_change': entry['market_change'],
+                'filename': filename
+            })
+        data.sort(key=lambda x: x['date'])
+        return data
@@ -0,0 +1,306 @@
+"""
+Validasi VADER vs FinBERT pada seluruh korpus (job headless yang bisa dilanjutkan).
+
+Semua kalimat yang memenuhi syarat (> 5 kata, sama dengan TranscriptAnalysis.cluster_input)
+dari setiap transkrip di-skor FinBERT dalam batch, memakai konvensi ScientificValidator
+(Positive Prob - Negative Prob) dan cache probabilitas FinBERT yang sama.
+
+Memori tetap terbatas berapa pun ukuran korpus:
+- Per pertemuan hanya kalimat pertemuan itu yang ada di memori.
+- Pearson gabungan dihitung persis dari jumlah berjalan (n, sum x, sum y, sum x^2, sum y^2, sum xy).
+- Spearman gabungan dan interval bootstrap gabungan dihitung dari reservoir sample
+  berukuran tetap (persis selama jumlah kalimat <= ukuran reservoir).
+
+Checkpoint (JSON) ditulis secara atomik setelah setiap pertemuan, termasuk state RNG,
+sehingga job yang terhenti dapat dilanjutkan dengan hasil yang sama seperti job tanpa interupsi.
+"""
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from modules import analyzer
+from modules.cache import cache_path, make_fingerprint
+from modules.corpus import file_sha256
+
+CHECKPOINT_VERSION = 1
+RESERVOIR_SIZE = 20000
+N_BOOTSTRAP = 1000
+CONFIDENCE = 0.95
+VALIDATION_SEED = 42
+# Jumlah elemen maksimum per blok resample bootstrap (resample x kalimat)
+BOOTSTRAP_BLOCK_ELEMENTS = 2_000_000
+
+def _meeting_date(filename):
+    match = re.search(r'(\d{8})', filename)
+    if not match:
+        return None
+    try:
+        return datetime.strptime(match.group(1), '%Y%m%d').date().isoformat()
+    except ValueError:
+        return None
+
+def checkpoint_path(directory):
+    """Lokasi default checkpoint untuk sebuah direktori korpus (di CACHE_DIR)."""
+    key = hashlib.sha1(os.path.abspath(directory).encode('utf-8')).hexdigest()[:12]
+    return cache_path(f"validation_{key}.json")
+
+def _rowwise_pearson(x, y):
+    xc = x - x.mean(axis=1, keepdims=True)
+    yc = y - y.mean(axis=1, keepdims=True)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return (xc * yc).sum(axis=1) / np.sqrt((xc ** 2).sum(axis=1) * (yc ** 2).sum(axis=1))
+
+def bootstrap_ci(x, y, n_boot=N_BOOTSTRAP, confidence=CONFIDENCE, rng=None):
+    """
+    Interval kepercayaan bootstrap (persentil) untuk Pearson dan Spearman.
+    Resample diproses per blok agar memori tetap kecil.
+
+    Returns:
+        dict: {'pearson': (low, high), 'spearman': (low, high)}
+    """
+    rng = rng if rng is not None else np.random.default_rng(VALIDATION_SEED)
+    n = len(x)
+    block = max(1, BOOTSTRAP_BLOCK_ELEMENTS // n)
+    pearson, spearman = [], []
+    for start in range(0, n_boot, block):
+        idx = rng.integers(0, n, size=(min(block, n_boot - start), n))
+        xs, ys = x[idx], y[idx]
+        pearson.append(_rowwise_pearson(xs, ys))
+        spearman.append(_rowwise_pearson(stats.rankdata(xs, axis=1), stats.rankdata(ys, axis=1)))
+
+    alpha = (1 - confidence) / 2 * 100
+    result = {}
+    for name, values in (('pearson', pearson), ('spearman', spearman)):
+        values = np.concatenate(values)
+        values = values[~np.isnan(values)]
+        if len(values):
+            result[name] = (float(np.percentile(values, alpha)), float(np.percentile(values, 100 - alpha)))
+        else:
+            result[name] = (float('nan'), float('nan'))
+    return result
+
+def correlation_stats(vader, finbert, n_boot=N_BOOTSTRAP, confidence=CONFIDENCE, rng=None):
+    """
+    Pearson & Spearman VADER vs FinBERT beserta interval bootstrap.
+
+    Returns:
+        dict: {'n', 'pearson', 'pearson_p', 'pearson_ci_low', 'pearson_ci_high',
+               'spearman', 'spearman_p', 'spearman_ci_low', 'spearman_ci_high'} (NaN jika n < 3 atau konstan).
+    """
+    x = np.asarray(vader, dtype=float)
+    y = np.asarray(finbert, dtype=float)
+    result = {'n': int(len(x))}
+    keys = ('pearson', 'pearson_p', 'pearson_ci_low', 'pearson_ci_high',
+            'spearman', 'spearman_p', 'spearman_ci_low', 'spearman_ci_high')
+    if len(x) < 3 or np.ptp(x) == 0 or np.ptp(y) == 0:
+        result.update(dict.fromkeys(keys, float('nan')))
+        return result
+
+    pearson, pearson_p = stats.pearsonr(x, y)
+    spearman, spearman_p = stats.spearmanr(x, y)
+    ci = bootstrap_ci(x, y, n_boot, confidence, rng)
+    result.update({
+        'pearson': float(pearson), 'pearson_p': float(pearson_p),
+        'pearson_ci_low': ci['pearson'][0], 'pearson_ci_high': ci['pearson'][1],
+        'spearman': float(spearman), 'spearman_p': float(spearman_p),
+        'spearman_ci_low': ci['spearman'][0], 'spearman_ci_high': ci['spearman'][1],
+    })
+    return result
+
+class CorpusValidation:
+    """
+    Job validasi korpus VADER vs FinBERT dengan checkpoint per pertemuan.
+
+    Pertemuan yang sudah tercatat di checkpoint (hash konten sama) dilewati saat job dijalankan ulang.
+    Jika file yang sudah diproses berubah atau dihapus, statistik gabungan tidak bisa dikoreksi
+    secara incremental sehingga job dimulai ulang dari awal.
+    """
+
+    def __init__(self, directory="fomc-transcript", checkpoint=None, target_speaker="CHAIR POWELL",
+                 scorer=None, engine=None, n_boot=N_BOOTSTRAP, reservoir_size=RESERVOIR_SIZE, seed=VALIDATION_SEED):
+        """
+        Args:
+            directory (str): Direktori transkrip (.txt).
+            checkpoint (str, optional): File checkpoint (default: checkpoint_path(directory)).
+            target_speaker (str): Pembicara yang diambil dari sesi Q&A.
+            scorer (FinbertScorer, optional): Default: validator.get_finbert().
+            engine (FomcSentimentEngine, optional): Default: engine global.
+            n_boot (int): Jumlah resample bootstrap.
+            reservoir_size (int): Ukuran reservoir sample untuk statistik gabungan.
+            seed (int): Random seed (bootstrap & reservoir).
+        """
+        if scorer is None:
+            from modules.validator import get_finbert
+            scorer = get_finbert()
+        self.directory = directory
+        self.path = checkpoint or checkpoint_path(directory)
+        self.target_speaker = target_speaker
+        self.scorer = scorer
+        self.engine = engine or analyzer.get_engine()
+        self.n_boot = n_boot
+        self.reservoir_size = reservoir_size
+        self.seed = seed
+        self.fingerprint = make_fingerprint(
+            CHECKPOINT_VERSION, self.engine.fingerprint, scorer.model_id, scorer.max_length,
+            target_speaker, n_boot, reservoir_size, seed
+        )
+        self.reset()
+        self._load()
+
+    # --- Checkpoint ---
+
+    def reset(self):
+        """Mengosongkan state (checkpoint di disk baru tertimpa pada save berikutnya)."""
+        self.meetings = {}
+        self.moments = dict.fromkeys(('n', 'sx', 'sy', 'sxx', 'syy', 'sxy'), 0.0)
+        self.reservoir = []
+        self.rng = np.random.default_rng(self.seed)
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get('version') != CHECKPOINT_VERSION or data.get('fingerprint') != self.fingerprint:
+            return
+        self.meetings = data['meetings']
+        self.moments = data['moments']
+        self.reservoir = data['reservoir']
+        self.rng.bit_generator.state = data['rng_state']
+
+    def save(self):
+        """Menyimpan checkpoint secara atomik."""
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': CHECKPOINT_VERSION,
+                'fingerprint': self.fingerprint,
+                'meetings': self.meetings,
+                'moments': self.moments,
+                'reservoir': self.reservoir,
+                'rng_state': self.rng.bit_generator.state
+            }, f, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    # --- Job ---
+
+    def _update_pooled(self, vader, finbert):
+        x = np.asarray(vader, dtype=float)
+        y = np.asarray(finbert, dtype=float)
+        seen = int(self.moments['n'])
+        self.moments['n'] += len(x)
+        self.moments['sx'] += float(x.sum())
+        self.moments['sy'] += float(y.sum())
+        self.moments['sxx'] += float((x * x).sum())
+        self.moments['syy'] += float((y * y).sum())
+        self.moments['sxy'] += float((x * y).sum())
+
+        # Reservoir sampling (Algorithm R): item ke-t menggantikan slot acak dengan peluang K / (t + 1)
+        free = max(0, min(self.reservoir_size - len(self.reservoir), len(x)))
+        self.reservoir.extend([float(v), float(f)] for v, f in zip(x[:free], y[:free]))
+        if free < len(x):
+            positions = np.arange(seen + free, seen + len(x))
+            slots = self.rng.integers(0, positions + 1)
+            for i in np.flatnonzero(slots < self.reservoir_size):
+                self.reservoir[slots[i]] = [float(x[free + i]), float(y[free + i])]
+
+    def run(self, batch_size=None, progress=None):
+        """
+        Memproses semua pertemuan yang belum ada di checkpoint.
+
+        Args:
+            batch_size (int, optional): Ukuran batch inferensi FinBERT.
+            progress (callable, optional): Dipanggil sebagai progress(filename, stats) setelah tiap pertemuan.
+
+        Returns:
+            list: Nama file yang diproses pada pemanggilan ini.
+        """
+        files = sorted(f for f in os.listdir(self.directory) if f.endswith('.txt'))
+        hashes = {f: file_sha256(os.path.join(self.directory, f)) for f in files}
+
+        stale = [f for f, entry in self.meetings.items() if hashes.get(f) != entry['sha256']]
+        if stale:
+            print(f"{len(stale)} validated transcript(s) changed or removed; restarting corpus validation.")
+            self.reset()
+
+        processed = []
+        for filename in files:
+            if filename in self.meetings:
+                continue
+            sentences, compounds = analyzer.transcript_sentences(
+                os.path.join(self.directory, filename), self.target_speaker, self.engine
+            )
+            finbert = self.scorer.score_many(sentences, batch_size) if sentences else []
+
+            entry = correlation_stats(compounds, finbert, self.n_boot, rng=self.rng)
+            entry.update({
+                'date': _meeting_date(filename),
+                'sha256': hashes[filename],
+                'vader_mean': float(np.mean(compounds)) if compounds else float('nan'),
+                'finbert_mean': float(np.mean(finbert)) if finbert else float('nan'),
+            })
+            self._update_pooled(compounds, finbert)
+            self.meetings[filename] = entry
+            self.save()
+
+            processed.append(filename)
+            if progress is not None:
+                progress(filename, entry)
+        return processed
+
+    # --- Hasil ---
+
+    def meeting_table(self):
+        """
+        Returns:
+            pandas.DataFrame: Statistik per pertemuan (urut tanggal).
+        """
+        columns = ['filename', 'date', 'n', 'vader_mean', 'finbert_mean', 'pearson', 'pearson_p',
+                   'pearson_ci_low', 'pearson_ci_high', 'spearman', 'spearman_p', 'spearman_ci_low', 'spearman_ci_high']
+        rows = [{'filename': filename, **entry} for filename, entry in self.meetings.items()]
+        df = pd.DataFrame(rows, columns=columns)
+        return df.sort_values(['date', 'filename'], na_position='last').reset_index(drop=True)
+
+    def pooled(self, confidence=CONFIDENCE):
+        """
+        Statistik gabungan seluruh korpus.
+
+        Pearson dihitung persis dari jumlah berjalan; Spearman dan interval bootstrap
+        dari reservoir sample ('sample_size').
+
+        Returns:
+            dict: Format correlation_stats ditambah 'sample_size' dan 'exact_rank_stats'.
+        """
+        sample = np.asarray(self.reservoir, dtype=float).reshape(-1, 2)
+        result = correlation_stats(
+            sample[:, 0], sample[:, 1], self.n_boot, confidence, rng=np.random.default_rng(self.seed)
+        )
+
+        m = self.moments
+        n = m['n']
+        cov = m['sxy'] - m['sx'] * m['sy'] / n if n else 0.0
+        var_x = m['sxx'] - m['sx'] ** 2 / n if n else 0.0
+        var_y = m['syy'] - m['sy'] ** 2 / n if n else 0.0
+        if n >= 3 and var_x > 0 and var_y > 0:
+            r = float(np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0))
+            if abs(r) < 1:
+                t = r * np.sqrt((n - 2) / (1 - r ** 2))
+                p = float(2 * stats.t.sf(abs(t), n - 2))
+            else:
+                p = 0.0
+            result['pearson'], result['pearson_p'] = r, p
+
+        result.update({
+            'n': int(n),
+            'meetings': len(self.meetings),
+            'sample_size': len(sample),
+            'exact_rank_stats': len(sample) == n
+        })
+        return result
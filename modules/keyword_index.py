@@ -0,0 +1,280 @@
+"""
+Inverted index lemma -> kalimat untuk seluruh korpus transkrip (SQLite).
+
+Setiap lemma (token alfabet, bukan stopword) dipetakan ke (pertemuan, id kalimat, offset karakter),
+dan setiap kalimat menyimpan skor compound yang sudah dihitung. Query kata kunci per pertemuan
+atau lintas waktu cukup membaca index (tanpa tokenisasi atau scoring ulang).
+Pencocokan berbasis kata utuh (lemma atau bentuk permukaan), bukan substring: "rate" cocok
+dengan "rates", tetapi "labor" tidak cocok dengan "laboratory".
+Frekuensi kata kunci Noun/Adjective per pertemuan juga disimpan untuk Word Cloud korpus.
+"""
+import functools
+import os
+import re
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime
+
+import pandas as pd
+
+from modules import analyzer
+from modules.cache import cache_path, make_fingerprint
+from modules.corpus import file_sha256
+from modules.nlp import MODEL_NAME, get_nlp
+from modules.preprocessor import prepare_transcript
+
+INDEX_VERSION = 3
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS meetings (meeting TEXT PRIMARY KEY, date TEXT, sha256 TEXT NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS sentences ("
+    "meeting TEXT NOT NULL, sid INTEGER NOT NULL, section TEXT NOT NULL, text TEXT NOT NULL, compound REAL NOT NULL, "
+    "PRIMARY KEY (meeting, sid))",
+    "CREATE TABLE IF NOT EXISTS postings ("
+    "term TEXT NOT NULL, surface TEXT NOT NULL, meeting TEXT NOT NULL, sid INTEGER NOT NULL, offset INTEGER NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS idx_postings_term ON postings(term, meeting, sid)",
+    "CREATE INDEX IF NOT EXISTS idx_postings_surface ON postings(surface, meeting, sid)",
+    "CREATE INDEX IF NOT EXISTS idx_postings_meeting ON postings(meeting)",
+    "CREATE TABLE IF NOT EXISTS keywords ("
+    "meeting TEXT NOT NULL, term TEXT NOT NULL, count INTEGER NOT NULL, PRIMARY KEY (meeting, term))",
+)
+
+_TABLES = ('meetings', 'sentences', 'postings', 'keywords')
+
+def _meeting_date(filename):
+    match = re.search(r'(\d{8})', filename)
+    if not match:
+        return None
+    try:
+        return datetime.strptime(match.group(1), '%Y%m%d').date().isoformat()
+    except ValueError:
+        return None
+
+def _lemma(token):
+    # Pipeline tanpa lemmatizer (mis. spacy.blank) memberi lemma kosong
+    return (token.lemma_ or token.text).lower()
+
+class KeywordIndex:
+    """
+    Inverted index lemma korpus yang tersimpan di disk (SQLite, WAL mode).
+
+    Diperbarui secara incremental berdasarkan hash konten file: hanya transkrip baru/berubah
+    yang di-parse; transkrip yang dihapus dibuang dari index. Perubahan lexicon/aturan
+    (fingerprint engine) atau model spaCy membuat index dibangun ulang.
+    """
+
+    def __init__(self, path=None, engine=None, target_speaker="CHAIR POWELL"):
+        """
+        Args:
+            path (str, optional): File SQLite (default: CACHE_DIR/keyword_index.sqlite).
+            engine (FomcSentimentEngine, optional): Default: engine global.
+            target_speaker (str): Pembicara yang diambil dari sesi Q&A.
+        """
+        self.path = path or cache_path('keyword_index.sqlite')
+        self.engine = engine or analyzer.get_engine()
+        self.target_speaker = target_speaker
+        self.fingerprint = make_fingerprint(INDEX_VERSION, self.engine.fingerprint, MODEL_NAME, target_speaker)
+        self._lock = threading.Lock()
+        self._conn = None
+        self._pid = None
+
+    def _connection(self):
+        # Koneksi dibuka ulang di proses anak (fork) agar tidak berbagi handle SQLite
+        if self._conn is None or self._pid != os.getpid():
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA[0])
+            row = conn.execute("SELECT value FROM meta WHERE key = 'fingerprint'").fetchone()
+            if row is None or row[0] != self.fingerprint:
+                # Index dari lexicon/aturan/model/versi berbeda: skor, lemma & skema tabel tidak valid lagi
+                for table in _TABLES:
+                    conn.execute(f"DROP TABLE IF EXISTS {table}")
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('fingerprint', ?)", (self.fingerprint,))
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            conn.commit()
+            self._conn = conn
+            self._pid = os.getpid()
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    # --- Build ---
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def query_terms(keyword):
+        """
+        (lemma, bentuk permukaan) per kata query (kata alfabet saja; stopword tetap dipakai jika hanya itu isinya).
+
+        Kata query di-parse tanpa konteks kalimat, sehingga lemma-nya bisa berbeda dari token
+        yang diindeks (mis. "spending" sendirian -> VBG "spend", di kalimat -> NN "spending");
+        karena itu satu kata query cocok dengan lemma ATAU bentuk permukaan yang sama.
+        """
+        doc = get_nlp('rules')(keyword.lower())
+        terms = [(_lemma(token), token.lower_) for token in doc if token.is_alpha and not token.is_stop]
+        return tuple(terms or [(_lemma(token), token.lower_) for token in doc if token.is_alpha])
+
+    def _index_meeting(self, conn, filename, sha256, path):
+        with open(path, 'r', encoding='utf-8') as f:
+            text = f.read()
+        opening, qa, _ = prepare_transcript(text, self.target_speaker)
+        items = []
+        if opening is not None:
+            items = analyzer.TranscriptAnalysis(opening, qa, engine=self.engine).sentences
+
+        sentences = []
+        postings = []
+        # Frekuensi kata kunci Noun/Adjective dari fused token pass (input Word Cloud korpus)
+        keywords = analyzer.keyword_counts(item['features'] for item in items)
+        # sid = urutan kalimat dalam transkrip (sama dengan 'seq' di TranscriptAnalysis.keyword_context).
+        # Lemma & offset berasal dari fused token pass (SentenceFeatures.terms): tidak ada parsing ulang
+        for sid, item in enumerate(items, start=1):
+            sentences.append((filename, sid, item['section'], item['text'], item['scores']['compound']))
+            postings.extend((term, surface, filename, sid, offset) for term, surface, offset in item['features'].terms)
+
+        for table in ('sentences', 'postings', 'keywords'):
+            conn.execute(f"DELETE FROM {table} WHERE meeting = ?", (filename,))
+        conn.executemany("INSERT INTO sentences VALUES (?, ?, ?, ?, ?)", sentences)
+        conn.executemany("INSERT INTO postings VALUES (?, ?, ?, ?, ?)", postings)
+        conn.executemany("INSERT INTO keywords VALUES (?, ?, ?)", [(filename, term, count) for term, count in keywords.items()])
+        conn.execute(
+            "INSERT OR REPLACE INTO meetings (meeting, date, sha256) VALUES (?, ?, ?)",
+            (filename, _meeting_date(filename), sha256)
+        )
+        conn.commit()
+
+    def update(self, directory):
+        """
+        Sinkronisasi index dengan direktori korpus.
+
+        Args:
+            directory (str): Direktori transkrip (.txt).
+
+        Returns:
+            list: Nama file yang (di)indeks.
+        """
+        files = sorted(f for f in os.listdir(directory) if f.endswith('.txt'))
+        hashes = {f: file_sha256(os.path.join(directory, f)) for f in files}
+        with self._lock:
+            conn = self._connection()
+            indexed = dict(conn.execute("SELECT meeting, sha256 FROM meetings"))
+            for filename in set(indexed) - set(files):
+                for table in _TABLES:
+                    conn.execute(f"DELETE FROM {table} WHERE meeting = ?", (filename,))
+            conn.commit()
+
+            pending = [f for f in files if indexed.get(f) != hashes[f]]
+            for filename in pending:
+                self._index_meeting(conn, filename, hashes[filename], os.path.join(directory, filename))
+        return pending
+
+    # --- Query ---
+
+    def _query(self, keyword, meeting=None, since=None):
+        terms = list(dict.fromkeys(self.query_terms(keyword)))
+        if not terms:
+            return []
+        # Kalimat harus memuat semua kata query (AND); tiap kata cocok lewat lemma atau bentuk permukaan.
+        # offset = kemunculan pertama kata pertama
+        sql = (
+            "SELECT p0.meeting, m.date, p0.sid, s.section, s.text, s.compound, MIN(p0.offset) "
+            # CROSS JOIN memaksa urutan join: mulai dari posting kata pertama (index term/surface)
+            "FROM postings p0 "
+            "CROSS JOIN sentences s ON s.meeting = p0.meeting AND s.sid = p0.sid "
+            "CROSS JOIN meetings m ON m.meeting = p0.meeting "
+            "WHERE (p0.term = ? OR p0.surface = ?)"
+        )
+        sql += " AND (p0.meeting, p0.sid) IN (SELECT meeting, sid FROM postings WHERE term = ? OR surface = ?)" * (len(terms) - 1)
+        params = [value for term in terms for value in term]
+        if meeting is not None:
+            sql += " AND p0.meeting = ?"
+            params.append(meeting)
+        if since is not None:
+            sql += " AND m.date >= ?"
+            params.append(str(since))
+        sql += " GROUP BY p0.meeting, p0.sid ORDER BY m.date, p0.meeting, p0.sid"
+        with self._lock:
+            return self._connection().execute(sql, params).fetchall()
+
+    def context(self, keyword, meeting=None, since=None):
+        """
+        Kalimat yang memuat kata kunci (kata utuh, lemma atau bentuk permukaan) beserta skor tersimpan.
+
+        Args:
+            keyword (str): Kata kunci (satu kata atau frasa; frasa = semua kata harus ada).
+            meeting (str, optional): Nama file pertemuan (None = seluruh korpus).
+            since (str|date, optional): Tanggal awal (ISO) untuk query lintas waktu.
+
+        Returns:
+            list: List dict {'meeting', 'date', 'seq', 'section', 'text', 'offset', 'compound'}
+                (format kompatibel dengan TranscriptAnalysis.keyword_context / plot_keyword_trend).
+        """
+        return [
+            {
+                'meeting': meeting_name, 'date': date, 'seq': sid,
+                'section': analyzer.SECTION_LABELS.get(section, section),
+                'text': text, 'offset': offset, 'compound': compound
+            }
+            for meeting_name, date, sid, section, text, compound, offset in self._query(keyword, meeting, since)
+        ]
+
+    def trend(self, keyword, since=None):
+        """
+        Nada per pertemuan untuk satu kata kunci (mis. "labor" sejak 2020).
+
+        Returns:
+            pandas.DataFrame: Index tanggal pertemuan; kolom 'meeting', 'count', 'avg_compound'.
+        """
+        rows = self._query(keyword, since=since)
+        df = pd.DataFrame(rows, columns=['meeting', 'date', 'seq', 'section', 'text', 'compound', 'offset'])
+        if df.empty:
+            return pd.DataFrame(columns=['meeting', 'count', 'avg_compound'], index=pd.Index([], name='date'))
+        trend = df.groupby(['date', 'meeting'], sort=True).agg(
+            count=('compound', 'size'), avg_compound=('compound', 'mean')
+        ).reset_index('meeting')
+        trend.index = pd.to_datetime(trend.index).date
+        trend.index.name = 'date'
+        return trend
+
+    def keyword_frequencies(self, since=None):
+        """
+        Frekuensi kata kunci (Noun & Adjective, tanpa stopwords) teragregasi lintas pertemuan,
+        input Word Cloud korpus (visualizer.wordcloud_png).
+
+        Args:
+            since (str|date, optional): Tanggal awal (ISO); None = seluruh korpus.
+
+        Returns:
+            collections.Counter: {kata: jumlah}
+        """
+        sql = "SELECT k.term, SUM(k.count) FROM keywords k JOIN meetings m ON m.meeting = k.meeting"
+        params = []
+        if since is not None:
+            sql += " WHERE m.date >= ?"
+            params.append(str(since))
+        sql += " GROUP BY k.term"
+        with self._lock:
+            return Counter(dict(self._connection().execute(sql, params).fetchall()))
+
+    def meeting_for(self, sha256):
+        """Nama pertemuan di index dengan hash konten ini (mis. file yang di-upload), atau None."""
+        with self._lock:
+            row = self._connection().execute("SELECT meeting FROM meetings WHERE sha256 = ?", (sha256,)).fetchone()
+        return row[0] if row else None
+
+def build_keyword_index(directory="fomc-transcript", path=None):
+    """
+    Memuat keyword index korpus dan menyinkronkannya dengan direktori
+    (parse penuh hanya pada pemanggilan pertama atau saat transkrip berubah).
+    """
+    index = KeywordIndex(path=path)
+    index.update(directory)
+    return index
@@ -0,0 +1,238 @@
+import json
+import os
+import re
+import threading
+import time
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from modules.cache import CACHE_DIR
+
+DEFAULT_TICKER = "^GSPC"
+PRICE_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+# Jendela pencarian hari perdagangan pertama (H sampai H+5, untuk weekend/holiday)
+ALIGN_WINDOW_DAYS = 5
+
+# Data lokal dianggap basi setelah ini (hanya relevan untuk tanggal yang belum tercakup)
+REFRESH_AFTER_SECONDS = 12 * 60 * 60
+
+def _safe_name(ticker):
+    return re.sub(r'[^A-Za-z0-9_.-]', '_', ticker)
+
+def _normalize_bars(df):
+    """Index tanggal (naive, tanpa jam) + kolom OHLC saja, terurut & unik."""
+    if df is None or df.empty:
+        return pd.DataFrame(columns=PRICE_COLUMNS, index=pd.DatetimeIndex([], name='Date'))
+    index = pd.to_datetime(df.index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    df = df.copy()
+    df.index = index.normalize()
+    df.index.name = 'Date'
+    df = df[[c for c in PRICE_COLUMNS if c in df.columns]].astype(float)
+    df = df[~df.index.duplicated(keep='last')].sort_index()
+    return df
+
+def read_price_file(path, ticker=None):
+    """
+    Membaca file harga lokal (CSV atau Parquet) berisi kolom Date + OHLC.
+    File fixture boleh berisi banyak ticker dengan kolom 'Ticker'.
+    """
+    if path.endswith('.parquet'):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+    if 'Ticker' in df.columns:
+        if ticker is None:
+            raise ValueError(f"Price file {path} contains several tickers; pass ticker=")
+        df = df[df['Ticker'] == ticker]
+    df = df.set_index('Date')
+    return _normalize_bars(df)
+
+class MarketData:
+    """
+    Layer data pasar dengan cache harga harian (OHLC) di disk.
+
+    Seluruh rentang tanggal diambil sekali per ticker (yfinance), disimpan ke file lokal,
+    lalu lookup per pertemuan dijawab dari memori dengan alignment vektor
+    (hari perdagangan pertama pada/sesudah tanggal pertemuan).
+    Dapat berjalan tanpa jaringan dari cache lokal atau file fixture.
+    """
+
+    def __init__(self, cache_dir=None, offline=None, fixture=None):
+        """
+        Args:
+            cache_dir (str, optional): Direktori file harga (default: CACHE_DIR/market).
+            offline (bool, optional): True = tidak pernah mengakses jaringan
+                (default: env FOMC_MARKET_OFFLINE=1).
+            fixture (str, optional): File CSV/Parquet harga yang dipakai apa adanya
+                (default: env FOMC_MARKET_FIXTURE). Mengimplikasikan offline.
+        """
+        self.cache_dir = cache_dir or os.path.join(CACHE_DIR, 'market')
+        self.fixture = fixture or os.environ.get('FOMC_MARKET_FIXTURE') or None
+        if offline is None:
+            offline = os.environ.get('FOMC_MARKET_OFFLINE', '0') == '1'
+        self.offline = offline or self.fixture is not None
+        self._bars = {}
+        self._coverage = {}
+        self._lock = threading.Lock()
+
+    def _path(self, ticker):
+        return os.path.join(self.cache_dir, f"prices_{_safe_name(ticker)}.csv")
+
+    def _coverage_path(self, ticker):
+        return os.path.join(self.cache_dir, f"prices_{_safe_name(ticker)}.range.json")
+
+    def _load_coverage(self, ticker, bars):
+        """
+        Rentang tanggal yang sudah pernah diminta ke sumber data (sidecar JSON).
+        Bar pertama bisa lebih lambat dari tanggal yang diminta (hari libur, ticker belum ada),
+        jadi rentang request yang dicatat, bukan tanggal bar. Tanpa sidecar: rentang bar lokal.
+        """
+        try:
+            with open(self._coverage_path(ticker), 'r', encoding='utf-8') as f:
+                coverage = json.load(f)
+            return date.fromisoformat(coverage['start']), date.fromisoformat(coverage['end'])
+        except (OSError, KeyError, ValueError):
+            if bars.empty:
+                return None
+            return bars.index[0].date(), bars.index[-1].date()
+
+    def _save_coverage(self, ticker, coverage):
+        path = self._coverage_path(ticker)
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'start': coverage[0].isoformat(), 'end': coverage[1].isoformat()}, f)
+        os.replace(tmp_path, path)
+
+    def _load_local(self, ticker):
+        if self.fixture:
+            return read_price_file(self.fixture, ticker)
+        path = self._path(ticker)
+        if os.path.exists(path):
+            return read_price_file(path)
+        return _normalize_bars(None)
+
+    def _save_local(self, ticker, bars):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(ticker)
+        tmp_path = path + '.tmp'
+        bars.to_csv(tmp_path, index_label='Date')
+        os.replace(tmp_path, path)
+
+    def _fetch(self, ticker, start, end):
+        import yfinance as yf
+        hist = yf.Ticker(ticker).history(start=start, end=end, auto_adjust=False)
+        return _normalize_bars(hist)
+
+    def _needs_fetch(self, ticker, coverage, start, end):
+        if self.offline:
+            return False
+        if coverage is None:
+            return True
+        covered_start, covered_end = coverage
+        if covered_start > start:
+            return True
+        if covered_end < min(end, date.today() - timedelta(days=1)):
+            # Tanggal terbaru belum tercakup: ambil ulang jika file lokal sudah basi
+            path = self._path(ticker)
+            return not os.path.exists(path) or time.time() - os.path.getmtime(path) > REFRESH_AFTER_SECONDS
+        return False
+
+    def bars(self, ticker=DEFAULT_TICKER, start=None, end=None):
+        """
+        Bar harian (OHLC) untuk ticker, memastikan rentang [start, end] tersedia di cache.
+
+        Args:
+            ticker (str): Simbol (mis. '^GSPC').
+            start (date, optional): Tanggal awal yang dibutuhkan.
+            end (date, optional): Tanggal akhir yang dibutuhkan.
+
+        Returns:
+            pandas.DataFrame: Index Date, kolom Open/High/Low/Close.
+        """
+        with self._lock:
+            bars = self._bars.get(ticker)
+            if bars is None:
+                bars = self._load_local(ticker)
+                self._coverage[ticker] = self._load_coverage(ticker, bars)
+            coverage = self._coverage.get(ticker)
+
+            if start is not None and end is not None and self._needs_fetch(ticker, coverage, start, end):
+                # Satu request untuk seluruh rentang (digabung dengan data lokal)
+                fetch_start = min(start, coverage[0]) if coverage is not None else start
+                try:
+                    fetched = self._fetch(ticker, fetch_start, end + timedelta(days=1))
+                    bars = _normalize_bars(pd.concat([bars, fetched]))
+                    # Hari ini/ke depan belum final: hanya tercakup sampai kemarin
+                    covered_end = min(end, date.today() - timedelta(days=1))
+                    if coverage is not None:
+                        covered_end = max(covered_end, coverage[1])
+                    coverage = (fetch_start, covered_end)
+                    self._save_local(ticker, bars)
+                    self._save_coverage(ticker, coverage)
+                except Exception as e:
+                    print(f"Error fetching market data for {ticker}: {e}")
+
+            self._bars[ticker] = bars
+            self._coverage[ticker] = coverage
+            return bars
+
+    def align(self, dates, ticker=DEFAULT_TICKER):
+        """
+        Posisi bar hari perdagangan pertama pada/sesudah setiap tanggal (dalam ALIGN_WINDOW_DAYS).
+
+        Args:
+            dates (list): List date pertemuan.
+            ticker (str): Simbol.
+
+        Returns:
+            tuple: (bars DataFrame, numpy array posisi; -1 jika tidak ada bar)
+        """
+        if len(dates) == 0:
+            return self.bars(ticker), np.array([], dtype=int)
+        targets = pd.to_datetime(pd.Series(list(dates))).values.astype('datetime64[D]')
+        bars = self.bars(
+            ticker,
+            start=pd.Timestamp(targets.min()).date(),
+            end=pd.Timestamp(targets.max()).date() + timedelta(days=ALIGN_WINDOW_DAYS)
+        )
+        bar_days = bars.index.values.astype('datetime64[D]')
+        positions = np.searchsorted(bar_days, targets, side='left')
+        in_range = positions < len(bar_days)
+        safe = np.where(in_range, positions, 0)
+        valid = in_range & (len(bar_days) > 0)
+        if len(bar_days):
+            valid &= (bar_days[safe] - targets) < np.timedelta64(ALIGN_WINDOW_DAYS, 'D')
+        return bars, np.where(valid, positions, -1)
+
+    def close_open_change(self, dates, ticker=DEFAULT_TICKER):
+        """
+        % Change (Close - Open) / Open pada hari perdagangan pertama mulai tiap tanggal.
+
+        Returns:
+            numpy.ndarray: Persentase perubahan per tanggal (NaN jika tidak ada data).
+        """
+        bars, positions = self.align(dates, ticker)
+        result = np.full(len(positions), np.nan)
+        valid = positions >= 0
+        if valid.any():
+            opens = bars['Open'].values[positions[valid]]
+            closes = bars['Close'].values[positions[valid]]
+            result[valid] = (closes - opens) / opens * 100
+        return result
+
+_MARKET = None
+_MARKET_LOCK = threading.Lock()
+
+def get_market_data():
+    """Instance MarketData global (cache harga di memori dibagi dalam satu proses)."""
+    global _MARKET
+    if _MARKET is None:
+        with _MARKET_LOCK:
+            if _MARKET is None:
+                _MARKET = MarketData()
+    return _MARKET
@@ -0,0 +1,130 @@
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+from modules.market import get_market_data
+
+# Aset default: S&P 500, Yield US 10Y, Dollar Index, VIX
+DEFAULT_TICKERS = ('^GSPC', '^TNX', 'DX-Y.NYB', '^VIX')
+
+# Horizon dalam hari perdagangan setelah pertemuan (0 = hari yang sama, Close vs Open)
+DEFAULT_HORIZONS = (0, 1, 3, 5)
+
+def horizon_label(horizon):
+    return "t0" if horizon == 0 else f"t+{horizon}"
+
+def reaction_returns(dates, tickers=DEFAULT_TICKERS, horizons=DEFAULT_HORIZONS, market_data=None):
+    """
+    Matriks return (%) per pertemuan untuk setiap aset x horizon.
+
+    Return horizon h diukur dari Open hari perdagangan pertama (pada/sesudah tanggal
+    pertemuan) sampai Close h hari perdagangan kemudian. h=0 setara dengan
+    market_change di analyze_historical_data.
+
+    Args:
+        dates (list): List date pertemuan.
+        tickers (tuple): Simbol aset.
+        horizons (tuple): Horizon hari perdagangan.
+        market_data (MarketData, optional): Default: get_market_data().
+
+    Returns:
+        numpy.ndarray: Array shape (len(dates), len(tickers), len(horizons)), NaN jika tidak ada data.
+    """
+    market_data = market_data or get_market_data()
+    horizons = np.asarray(horizons, dtype=int)
+    returns = np.full((len(dates), len(tickers), len(horizons)), np.nan)
+
+    for t, ticker in enumerate(tickers):
+        bars, positions = market_data.align(dates, ticker)
+        if bars.empty:
+            continue
+        opens = bars['Open'].values
+        closes = bars['Close'].values
+
+        # Indeks bar akhir per (pertemuan, horizon) sekaligus
+        end = positions[:, None] + horizons[None, :]
+        valid = (positions[:, None] >= 0) & (end < len(closes))
+        start_open = opens[np.clip(positions, 0, None)][:, None]
+        end_close = closes[np.clip(end, 0, len(closes) - 1)]
+        returns[:, t, :] = np.where(valid, (end_close - start_open) / start_open * 100, np.nan)
+
+    return returns
+
+def correlation_grid(sentiment, returns):
+    """
+    Korelasi Pearson + p-value antara sentimen dan setiap kolom return, sekaligus.
+    Nilai NaN diabaikan per kolom (pairwise).
+
+    Args:
+        sentiment (array): Skor sentimen per pertemuan, shape (n,).
+        returns (array): Return, shape (n, ...) (mis. (n, aset, horizon)).
+
+    Returns:
+        tuple: (correlation, p_value, n_obs), masing-masing shape returns.shape[1:].
+    """
+    sentiment = np.asarray(sentiment, dtype=float)
+    returns = np.asarray(returns, dtype=float)
+    shape = returns.shape[1:]
+    y = returns.reshape(len(sentiment), -1)
+    x = np.broadcast_to(sentiment[:, None], y.shape)
+
+    mask = ~np.isnan(y) & ~np.isnan(x)
+    n_obs = mask.sum(axis=0)
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_x = np.where(mask, x, 0).sum(axis=0) / n_obs
+        mean_y = np.where(mask, y, 0).sum(axis=0) / n_obs
+        dx = np.where(mask, x - mean_x, 0)
+        dy = np.where(mask, y - mean_y, 0)
+        r = (dx * dy).sum(axis=0) / np.sqrt((dx ** 2).sum(axis=0) * (dy ** 2).sum(axis=0))
+        r = np.clip(r, -1.0, 1.0)
+
+        # Uji t dua sisi (sama dengan scipy.stats.pearsonr)
+        dof = n_obs - 2
+        t_stat = r * np.sqrt(dof / (1 - r ** 2))
+        p_value = 2 * stats.t.sf(np.abs(t_stat), dof)
+
+    p_value = np.where(np.abs(r) == 1.0, 0.0, p_value)
+    insufficient = n_obs < 3
+    r = np.where(insufficient, np.nan, r)
+    p_value = np.where(insufficient, np.nan, p_value)
+
+    return r.reshape(shape), p_value.reshape(shape), n_obs.reshape(shape)
+
+def market_reaction_table(historical_data, tickers=DEFAULT_TICKERS, horizons=DEFAULT_HORIZONS, market_data=None):
+    """
+    Tabel reaksi pasar multi-aset, multi-horizon untuk data historis.
+
+    Args:
+        historical_data (list): Output analyze_historical_data.
+        tickers (tuple): Simbol aset.
+        horizons (tuple): Horizon hari perdagangan.
+        market_data (MarketData, optional): Default: get_market_data().
+
+    Returns:
+        dict: {
+            'returns': DataFrame (index tanggal, kolom MultiIndex (ticker, horizon)),
+            'correlation': DataFrame (ticker x horizon),
+            'p_value': DataFrame (ticker x horizon),
+            'n_obs': DataFrame (ticker x horizon)
+        }
+    """
+    dates = [item['date'] for item in historical_data]
+    sentiment = np.array([item['compound'] for item in historical_data], dtype=float)
+    returns = reaction_returns(dates, tickers, horizons, market_data)
+
+    labels = [horizon_label(h) for h in horizons]
+    columns = pd.MultiIndex.from_product([list(tickers), labels], names=['ticker', 'horizon'])
+    returns_df = pd.DataFrame(returns.reshape(len(dates), -1), index=pd.Index(dates, name='date'), columns=columns)
+
+    r, p_value, n_obs = correlation_grid(sentiment, returns)
+
+    def grid(values):
+        return pd.DataFrame(values, index=pd.Index(list(tickers), name='ticker'), columns=labels)
+
+    return {
+        'returns': returns_df,
+        'correlation': grid(r),
+        'p_value': grid(p_value),
+        'n_obs': grid(n_obs)
+    }
@@ -0,0 +1,102 @@
+import threading
+import spacy
+
+# Model spaCy yang dipakai oleh aturan ekonomi
+MODEL_NAME = "en_core_web_sm"
+
+# Pipeline Profiles
+# - 'tokenizer': tokenisasi + batas kalimat rule-based (sentencizer). Tidak butuh model terlatih.
+# - 'rules'    : tagger + lemmatizer + dependency parser untuk logika ekonomi & kata kunci. NER tidak dimuat.
+PROFILES = {
+    'tokenizer': None,
+    'rules': {'exclude': ['ner']},
+}
+
+_PIPELINES = {}
+_LOCK = threading.Lock()
+
+def _load_profile(profile):
+    if profile not in PROFILES:
+        raise ValueError(f"Unknown pipeline profile '{profile}'. Available: {', '.join(PROFILES)}")
+
+    options = PROFILES[profile]
+    if options is None:
+        # Tokenizer bahasa Inggris saja (aturan tokenisasi sama dengan en_core_web_sm)
+        nlp = spacy.blank("en")
+        nlp.add_pipe("sentencizer")
+        return nlp
+
+    try:
+        return spacy.load(MODEL_NAME, **options)
+    except OSError as e:
+        raise OSError(
+            f"spaCy model '{MODEL_NAME}' is not installed. "
+            f"Install it with: python -m spacy download {MODEL_NAME}"
+        ) from e
+
+def get_nlp(profile='rules'):
+    """
+    Mengembalikan pipeline spaCy untuk profil tertentu (dimuat saat pertama kali dipakai).
+
+    Args:
+        profile (str): Nama profil di PROFILES ('tokenizer' atau 'rules').
+
+    Returns:
+        spacy.language.Language: Pipeline yang sudah dimuat (dibagi dalam satu proses).
+
+    Raises:
+        OSError: Jika model spaCy belum terinstal (tidak ada download otomatis).
+    """
+    nlp = _PIPELINES.get(profile)
+    if nlp is None:
+        with _LOCK:
+            nlp = _PIPELINES.get(profile)
+            if nlp is None:
+                nlp = _load_profile(profile)
+                _PIPELINES[profile] = nlp
+    return nlp
+
+# --- Lapisan tokenisasi bersama ---
+
+# Kata kunci (Word Cloud & Top Keywords): hanya Noun (NN, NNS) dan Adjective (JJ, JJR, JJS)
+KEYWORD_TAGS = {'NN', 'NNS', 'JJ', 'JJR', 'JJS'}
+
+# Blacklist kata benda umum yang tidak informatif (ditambah stopword bawaan spaCy, token.is_stop)
+KEYWORD_STOPWORDS = frozenset([
+    'percent', 'year', 'month', 'today', 'term', 'point', 'number', 'million', 'billion',
+    'thing', 'way', 'part', 'lot', 'bit', 'side', 'type', 'kind', 'sort', 'sense',
+    'question', 'answer', 'mr', 'ms', 'chair', 'powell', 'chairman', 'operator',
+    'meeting', 'committee', 'reserve', 'federal', 'fed', 'bank', 'system',
+    'program', 'statement', 'guidance', 'tool', 'support', 'policy', 'rate',
+    'time', 'period', 'level', 'range', 'goal', 'objective', 'mandate',
+    'michelle', 'smith', 'hi', 'hello', 'thanks', 'thank', 'please',
+    'quarter', 'half', 'basis', 'pace', 'outlook', 'projection', 'view',
+    'participant', 'member', 'colleague', 'staff', 'governor', 'president',
+    'morning', 'afternoon', 'evening', 'everyone', 'everybody', 'people',
+    'think', 'going', 'see', 'say', 'know', 'look', 'come', 'make', 'take', 'get'
+])
+
+def split_sentences(text):
+    """
+    Memecah teks menjadi kalimat (sentencizer spaCy, tanpa model terlatih & tanpa download data).
+
+    Args:
+        text (str): Teks input.
+
+    Returns:
+        list: List kalimat (string, tanpa spasi di ujung).
+    """
+    if not text or not text.strip():
+        return []
+    doc = get_nlp('tokenizer')(text)
+    return [sent.text.strip() for sent in doc.sents if sent.text.strip()]
+
+def is_keyword_token(token):
+    """Token kata kunci: Noun/Adjective (tag PTB), alfabet, > 2 huruf, bukan stopword/blacklist."""
+    return (
+        token.tag_ in KEYWORD_TAGS
+        and token.is_alpha
+        and len(token) > 2
+        and not token.is_stop
+        and token.lower_ not in KEYWORD_STOPWORDS
+    )
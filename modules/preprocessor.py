@@ -1,4 +1,41 @@
 import re
+from collections import namedtuple
+
+# Regex Patterns yang lebih spesifik dan ketat untuk menghindari false positive
+# Masalah sebelumnya: "prepared to adjust" dianggap sebagai closing karena ada kata "prepared" ... "questions"
+# Solusi: Enforce kedekatan kata kerja (phrase-based matching)
+SPLIT_PATTERNS = [
+    # Pola 1: "I look forward to your questions"
+    re.compile(r"look\s+forward\s+to\s+(?:taking|answering|your)?\s*questions", re.IGNORECASE),
+    
+    # Pola 2: "happy/glad/prepared to take/answer your questions"
+    # HARUS diikuti "to take" atau "to answer" agar tidak match dengan "prepared to adjust"
+    re.compile(r"(?:glad|happy|prepared)\s+to\s+(?:take|answer)\s+(?:your)?\s*questions", re.IGNORECASE),
+    
+    # Pola 3: "questions, please" (Fallback pendek, tapi cukup spesifik di akhir paragraf)
+    re.compile(r"questions\s*,?\s*please", re.IGNORECASE)
+]
+
+# Fallback: Nama moderator (Biasanya: <NAME>MICHELLE SMITH</NAME>)
+MODERATOR_NAME = "MICHELLE SMITH"
+MODERATOR_PATTERN = re.compile(r"<NAME>[^<]*MICHELLE SMITH[^<]*</NAME>", re.IGNORECASE)
+
+# Tag pembicara: <NAME>...</NAME>
+SPEAKER_TAG_PATTERN = re.compile(r"<NAME>(.*?)</NAME>", re.IGNORECASE | re.DOTALL)
+
+# Satu regex gabungan untuk segmentasi satu kali scan: separator (split_0..2) + tag pembicara
+SPLIT_KEYS = [f"split_{i}" for i in range(len(SPLIT_PATTERNS))]
+SEGMENT_PATTERN = re.compile(
+    "|".join(
+        [f"(?P<{key}>{pattern.pattern})" for key, pattern in zip(SPLIT_KEYS, SPLIT_PATTERNS)]
+        + [r"(?P<tag><NAME>(?P<speaker>.*?)</NAME>)"]
+    ),
+    re.IGNORECASE | re.DOTALL
+)
+
+# Satu giliran bicara: offset [start, end) menunjuk ke string transkrip asli
+# speaker: nama (uppercase) atau None jika tidak ada tag; section: 'opening' / 'qa'
+Turn = namedtuple('Turn', ['speaker', 'section', 'start', 'end'])
 
 def clean_text(text):
     """
@@ -20,63 +57,125 @@ def clean_text(text):
     
     return text
 
-def split_transcript(text):
+def _speaker_turns(tags, start, end, section='qa'):
     """
-    Memisahkan transkrip menjadi Pidato Pembuka dan Sesi Tanya Jawab.
+    Membentuk Turn dari daftar tag (speaker, tag_start, content_start) di dalam rentang [start, end).
+    Teks sebelum tag pertama menjadi Turn tanpa speaker.
+    """
+    turns = []
+    first_tag = tags[0][1] if tags else end
+    if first_tag > start:
+        turns.append(Turn(None, section, start, first_tag))
+    for i, (speaker, _, content_start) in enumerate(tags):
+        content_end = tags[i + 1][1] if i + 1 < len(tags) else end
+        turns.append(Turn(speaker, section, content_start, content_end))
+    return turns
+
+def segment_transcript(text):
+    """
+    Segmentasi transkrip dalam satu kali scan menjadi daftar Turn.
+    
+    Separator Opening/Q&A mengikuti aturan split_transcript (prioritas SPLIT_PATTERNS,
+    fallback tag moderator). Turn pertama selalu Opening Speech (seluruh teks sebelum separator);
+    sisanya adalah giliran bicara Q&A per tag <NAME>.
     
     Args:
         text (str): Teks transkrip lengkap.
         
     Returns:
-        tuple: (opening_speech, qa_session) atau (None, None) jika separator tidak ditemukan.
+        list: List of Turn, atau None jika separator tidak ditemukan.
     """
-    # Regex Patterns yang lebih spesifik dan ketat untuk menghindari false positive
-    # Masalah sebelumnya: "prepared to adjust" dianggap sebagai closing karena ada kata "prepared" ... "questions"
-    # Solusi: Enforce kedekatan kata kerja (phrase-based matching)
+    first_match = {}
+    tags = []
+    for match in SEGMENT_PATTERN.finditer(text):
+        kind = match.lastgroup
+        if kind == 'tag':
+            tags.append((match.group('speaker').strip().upper(), match.start(), match.end()))
+        else:
+            first_match.setdefault(kind, match.start())
     
-    patterns = [
-        # Pola 1: "I look forward to your questions"
-        r"look\s+forward\s+to\s+(?:taking|answering|your)?\s*questions",
-        
-        # Pola 2: "happy/glad/prepared to take/answer your questions"
-        # HARUS diikuti "to take" atau "to answer" agar tidak match dengan "prepared to adjust"
-        r"(?:glad|happy|prepared)\s+to\s+(?:take|answer)\s+(?:your)?\s*questions",
+    boundary = next((first_match[key] for key in SPLIT_KEYS if key in first_match), None)
+    if boundary is None:
+        boundary = next((tag_start for speaker, tag_start, _ in tags if MODERATOR_NAME in speaker), None)
+    if boundary is None:
+        return None
+    
+    opening_tags = [tag for tag in tags if tag[1] < boundary]
+    opening_speaker = opening_tags[0][0] if opening_tags else None
+    turns = [Turn(opening_speaker, 'opening', 0, boundary)]
+    turns.extend(_speaker_turns([tag for tag in tags if tag[1] >= boundary], boundary, len(text)))
+    return turns
+
+def select_turns(turns, speaker=None, section=None):
+    """
+    Memilih Turn berdasarkan pembicara dan/atau section (tanpa scan ulang teks).
+    
+    Args:
+        turns (list): Output segment_transcript.
+        speaker (str, optional): Nama pembicara (substring, case-insensitive). None = semua pembicara.
+        section (str, optional): 'opening' atau 'qa'. None = semua section.
         
-        # Pola 3: "questions, please" (Fallback pendek, tapi cukup spesifik di akhir paragraf)
-        r"questions\s*,?\s*please"
+    Returns:
+        list: List of Turn yang cocok.
+    """
+    # Hanya None = semua pembicara; '' tetap hanya Turn bertag (sama dengan filter_speaker lama)
+    speaker = speaker.upper() if speaker is not None else None
+    return [
+        turn for turn in turns
+        if (section is None or turn.section == section)
+        and (speaker is None or (turn.speaker is not None and speaker in turn.speaker))
     ]
+
+def turns_text(text, turns):
+    """Menggabungkan isi beberapa Turn (masing-masing di-strip) dengan spasi."""
+    return " ".join(text[turn.start:turn.end].strip() for turn in turns)
+
+def speaker_text(text, turns, target_speaker="CHAIR POWELL"):
+    """
+    Teks Q&A dari satu pembicara berdasarkan Turn (semantik sama dengan filter_speaker).
     
-    match = None
-    for pattern in patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
-        if match:
-            break # Ambil match pertama yang valid
-    
-    if match:
-        # Split di posisi match
-        split_index = match.start()
-        opening_speech = text[:split_index].strip()
-        qa_session = text[split_index:].strip()
-        return opening_speech, qa_session
+    Args:
+        text (str): Teks transkrip asli (yang di-segmentasi).
+        turns (list): Output segment_transcript.
+        target_speaker (str): Nama pembicara (case-insensitive).
         
-    # Fallback: Cari nama moderator jika kalimat penutup tidak ketemu
-    # Biasanya: <NAME>MICHELLE SMITH</NAME>
-    pattern_moderator = r"<NAME>.*?MICHELLE SMITH.*?</NAME>"
-    match_mod = re.search(pattern_moderator, text, re.IGNORECASE)
-    
-    if match_mod:
-        split_index = match_mod.start()
-        opening_speech = text[:split_index].strip()
-        qa_session = text[split_index:].strip()
-        return opening_speech, qa_session
-            
-    return None, None
+    Returns:
+        str: Teks gabungan dari pembicara target.
+    """
+    qa_turns = select_turns(turns, section='qa')
+    selected = select_turns(qa_turns, speaker=target_speaker)
+    if not selected:
+        # Fallback: Q&A tanpa tag <NAME> sama sekali dikembalikan apa adanya
+        if all(turn.speaker is None for turn in qa_turns):
+            return turns_text(text, qa_turns)
+        return ""
+    return turns_text(text, selected)
+
+def split_transcript(text):
+    """
+    Memisahkan transkrip menjadi Pidato Pembuka dan Sesi Tanya Jawab.
+    
+    Args:
+        text (str): Teks transkrip lengkap.
+        
+    Returns:
+        tuple: (opening_speech, qa_session) atau (None, None) jika separator tidak ditemukan.
+    """
+    turns = segment_transcript(text)
+    if turns is None:
+        return None, None
+    
+    split_index = turns[0].end
+    return text[:split_index].strip(), text[split_index:].strip()
 
 def filter_speaker(text, target_speaker="CHAIR POWELL"):
     """
     Memfilter teks Q&A untuk hanya mengambil ucapan dari pembicara tertentu.
     Menggunakan regex untuk mendeteksi tag <NAME>...</NAME>.
     
+    Untuk beberapa pembicara pada transkrip yang sama, gunakan segment_transcript
+    sekali lalu speaker_text per pembicara.
+    
     Args:
         text (str): Teks Q&A mentah (masih ada tag <NAME>).
         target_speaker (str): Nama pembicara yang ingin diambil (case-insensitive).
@@ -84,29 +183,42 @@ def filter_speaker(text, target_speaker="CHAIR POWELL"):
     Returns:
         str: Teks gabungan dari pembicara target.
     """
-    # Regex penjelasan:
-    # <NAME>(.*?)</NAME> : Menangkap nama pembicara di dalam tag
-    # (.*?)              : Menangkap isi ucapan (non-greedy)
-    # (?=<NAME>|$)       : Lookahead positif, berhenti saat ketemu tag <NAME> berikutnya atau akhir string
-    pattern = r'<NAME>(.*?)</NAME>(.*?)(?=<NAME>|$)'
+    tags = [
+        (match.group(1).strip().upper(), match.start(), match.end())
+        for match in SPEAKER_TAG_PATTERN.finditer(text)
+    ]
+    return speaker_text(text, _speaker_turns(tags, 0, len(text)), target_speaker)
+
+def prepare_transcript(text, target_speaker="CHAIR POWELL", turns=None):
+    """
+    Pipeline preprocessing lengkap: split -> filter speaker (Q&A) -> clean.
+    
+    Args:
+        text (str): Teks transkrip mentah.
+        target_speaker (str): Pembicara yang diambil dari sesi Q&A.
+        turns (list, optional): Output segment_transcript(text), agar beberapa
+            pembicara dapat diproses tanpa segmentasi ulang.
+        
+    Returns:
+        tuple: (opening, qa, cleaned_text) atau (None, None, None) jika separator tidak ditemukan.
+    """
+    # 1. Split (segmentasi satu kali scan)
+    if turns is None:
+        turns = segment_transcript(text)
     
-    matches = re.findall(pattern, text, re.DOTALL | re.IGNORECASE)
+    if turns is None:
+        return None, None, None
     
-    filtered_text = []
+    opening_raw = turns_text(text, select_turns(turns, section='opening'))
     
-    for speaker, content in matches:
-        # Bersihkan nama speaker dari spasi berlebih
-        speaker = speaker.strip().upper()
-        
-        # Cek apakah speaker sesuai target
-        if target_speaker.upper() in speaker:
-            filtered_text.append(content.strip())
-            
-    if not filtered_text:
-        # Fallback jika tidak ada match (mungkin format beda atau tidak ada tag)
-        # Kembalikan teks asli jika tidak ada tag <NAME> ditemukan sama sekali
-        if "<NAME>" not in text:
-            return text
-        return ""
-        
-    return " ".join(filtered_text)
+    # 2. Filter Q&A
+    qa_filtered = speaker_text(text, turns, target_speaker)
+    
+    # 3. Clean
+    opening = clean_text(opening_raw)
+    qa = clean_text(qa_filtered)
+    
+    # Gabungkan
+    cleaned_text = opening + " " + qa
+    
+    return opening, qa, cleaned_text
@@ -0,0 +1,233 @@
+"""
+Rasterisasi grafik Plotly (PNG) dengan cache dan render paralel.
+
+Hasil render di-cache berdasarkan hash JSON figure + format, ukuran, dan scale:
+di memori (LRU) dan di disk (CACHE_DIR/charts), sehingga grafik yang sama
+(mis. unduh PDF berulang untuk transkrip yang sama, atau job laporan batch)
+tidak di-render ulang lewat kaleido.
+"""
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import plotly
+import plotly.io as pio
+
+from modules.cache import cache_path
+
+DEFAULT_WIDTH = 800
+DEFAULT_HEIGHT = 400
+DEFAULT_SCALE = 1
+MEMORY_CACHE_SIZE = 64
+DISK_CACHE_SIZE = 1000
+
+class ChartRasterizer:
+    """
+    Renderer grafik statis bersama (satu per proses, lihat get_rasterizer).
+
+    - Cache dua tingkat: LRU di memori + file di disk (dibatasi DISK_CACHE_SIZE file, yang tertua dibuang).
+    - Figure yang belum ada di cache di-render bersamaan lewat thread pool ke satu renderer kaleido
+      yang tetap hidup (kaleido >= 1: sync server dijalankan sekali; kaleido lama: subprocess plotly
+      sudah persisten).
+    """
+
+    def __init__(self, cache_dir=None, max_workers=2, memory_size=MEMORY_CACHE_SIZE, disk_size=DISK_CACHE_SIZE):
+        """
+        Args:
+            cache_dir (str, optional): Direktori cache disk (default: CACHE_DIR/charts; '' = tanpa cache disk).
+            max_workers (int): Jumlah render bersamaan.
+            memory_size (int): Jumlah gambar di cache memori.
+            disk_size (int): Jumlah file maksimum di cache disk.
+        """
+        self.cache_dir = cache_path('charts') if cache_dir is None else cache_dir
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        self.max_workers = max_workers
+        self.memory_size = memory_size
+        self.disk_size = disk_size
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='raster')
+        self._warm = False
+        self.hits = 0
+        self.misses = 0
+
+    # --- Cache ---
+
+    @staticmethod
+    def figure_key(fig, fmt='png', width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT, scale=DEFAULT_SCALE):
+        """Key cache: hash JSON figure + parameter render + versi plotly."""
+        digest = hashlib.sha1(fig.to_json().encode('utf-8'))
+        digest.update(f"|{fmt}|{width}|{height}|{scale}|{plotly.__version__}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def _disk_path(self, key, fmt):
+        return os.path.join(self.cache_dir, f"{key}.{fmt}")
+
+    def _get(self, key, fmt):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        if not self.cache_dir:
+            return None
+        try:
+            with open(self._disk_path(key, fmt), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        self._remember(key, data)
+        return data
+
+    def _remember(self, key, data):
+        with self._lock:
+            self._memory[key] = data
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.memory_size:
+                self._memory.popitem(last=False)
+
+    def _put(self, key, fmt, data):
+        self._remember(key, data)
+        if not self.cache_dir:
+            return
+        path = self._disk_path(key, fmt)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self._prune()
+
+    def _prune(self):
+        entries = [entry for entry in os.scandir(self.cache_dir) if entry.is_file() and not entry.name.endswith('.tmp')]
+        if len(entries) <= self.disk_size:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime)
+        for entry in entries[:len(entries) - self.disk_size]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+    def stats(self):
+        """
+        Returns:
+            dict: {'hits', 'misses', 'hit_rate', 'memory_entries'}
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'memory_entries': len(self._memory)
+        }
+
+    # --- Render ---
+
+    def _warm_up(self):
+        # kaleido >= 1 meluncurkan browser baru di setiap to_image kecuali sync server sudah berjalan
+        with self._lock:
+            if self._warm:
+                return
+            self._warm = True
+        try:
+            import kaleido
+        except ImportError:
+            return
+        start_server = getattr(kaleido, 'start_sync_server', None)
+        if start_server is None:
+            return
+        try:
+            start_server(n=self.max_workers, silence_warnings=True)
+        except TypeError:
+            start_server()
+        except RuntimeError:
+            # Server sudah berjalan
+            pass
+
+    def _render(self, fig, fmt, width, height, scale):
+        return pio.to_image(fig, format=fmt, width=width, height=height, scale=scale)
+
+    def render_many(self, figures, fmt='png', width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT, scale=DEFAULT_SCALE):
+        """
+        Render banyak figure sekaligus; hanya figure yang belum ada di cache yang di-render (bersamaan).
+
+        Args:
+            figures (list): List plotly.graph_objects.Figure.
+            fmt (str): Format gambar ('png', 'jpeg', 'svg', ...).
+            width (int), height (int), scale (float): Parameter render.
+
+        Returns:
+            list: Bytes gambar per figure (urutan sama dengan input).
+        """
+        keys = [self.figure_key(fig, fmt, width, height, scale) for fig in figures]
+        results = {}
+        pending = {}
+        for key, fig in zip(keys, figures):
+            if key in results or key in pending:
+                continue
+            data = self._get(key, fmt)
+            if data is not None:
+                results[key] = data
+            else:
+                pending[key] = fig
+        with self._lock:
+            self.hits += len(figures) - len(pending)
+            self.misses += len(pending)
+
+        if pending:
+            self._warm_up()
+            futures = {
+                key: self._executor.submit(self._render, fig, fmt, width, height, scale)
+                for key, fig in pending.items()
+            }
+            for key, future in futures.items():
+                results[key] = future.result()
+                self._put(key, fmt, results[key])
+
+        return [results[key] for key in keys]
+
+    def render(self, fig, fmt='png', width=DEFAULT_WIDTH, height=DEFAULT_HEIGHT, scale=DEFAULT_SCALE):
+        """Render satu figure (lihat render_many)."""
+        return self.render_many([fig], fmt, width, height, scale)[0]
+
+    def render_cached(self, key, fmt, render):
+        """
+        Gambar non-Plotly (mis. Word Cloud) lewat cache yang sama.
+
+        Args:
+            key (str): Key cache (hash input render, ditentukan pemanggil).
+            fmt (str): Ekstensi file cache ('png', ...).
+            render (callable): Fungsi tanpa argumen yang mengembalikan bytes gambar (dipanggil saat cache miss).
+
+        Returns:
+            bytes: Data gambar.
+        """
+        data = self._get(key, fmt)
+        with self._lock:
+            if data is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if data is None:
+            data = render()
+            self._put(key, fmt, data)
+        return data
+
+_RASTERIZER = None
+_RASTERIZER_LOCK = threading.Lock()
+
+def get_rasterizer():
+    """
+    ChartRasterizer global (dibuat sekali per proses), dipakai laporan PDF di Streamlit
+    maupun job laporan batch. Cache disk aktif kecuali dimatikan lewat FOMC_CHART_CACHE=0.
+    """
+    global _RASTERIZER
+    if _RASTERIZER is None:
+        with _RASTERIZER_LOCK:
+            if _RASTERIZER is None:
+                use_disk = os.environ.get('FOMC_CHART_CACHE', '1') != '0'
+                _RASTERIZER = ChartRasterizer(cache_dir=None if use_disk else '')
+    return _RASTERIZER
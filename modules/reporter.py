@@ -1,203 +1,170 @@
+import base64
+import functools
+import html
+import json
+import os
+import re
+from string import Template
 
+import numpy as np
 import plotly.io as pio
+from plotly.offline import get_plotlyjs, get_plotlyjs_version
 
-def generate_html_report(filename, opening_scores, qa_scores, topic_scores, fig_comparison, fig_flow, highlights):
-    """
-    Generates a standalone HTML report with embedded Plotly charts.
-    """
-    
-    # Convert Plotly figures to HTML divs
-    # include_plotlyjs='cdn' ensures the file is smaller but requires internet to render charts.
-    # If offline usage is critical, we can use 'include_plotlyjs=True' but file size increases (3MB+).
-    # For now, CDN is standard for web apps.
-    div_comparison = pio.to_html(fig_comparison, full_html=False, include_plotlyjs='cdn')
-    div_flow = pio.to_html(fig_flow, full_html=False, include_plotlyjs=False) # JS already included by first chart
-    
-    # Calculate difference
-    diff = qa_scores['compound'] - opening_scores['compound']
-    diff_text = "Lebih Positif" if diff > 0 else "Lebih Negatif"
-    diff_color = "green" if diff > 0 else "red"
-    
-    # Highlights HTML
-    pos_highlights = ""
-    if highlights['positive']:
-        for item in highlights['positive']:
-             pos_highlights += f"<li class='highlight-pos'><b>{item['source']}:</b> \"{item['text']}\"</li>"
-    else:
-        pos_highlights = "<li>Tidak ada kalimat yang sangat positif.</li>"
-        
-    neg_highlights = ""
-    if highlights['negative']:
-        for item in highlights['negative']:
-             neg_highlights += f"<li class='highlight-neg'><b>{item['source']}:</b> \"{item['text']}\"</li>"
-    else:
-        neg_highlights = "<li>Tidak ada kalimat yang sangat negatif.</li>"
+# Naikkan jika isi/format laporan berubah (laporan batch lama dibuat ulang)
+REPORT_VERSION = 2
 
-    html_content = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <title>Laporan Analisis Sentimen FOMC</title>
-        <style>
-            body {{ font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; max_width: 1000px; margin: 0 auto; padding: 20px; }}
-            h1 {{ color: #2c3e50; text-align: center; border-bottom: 2px solid #eee; padding-bottom: 10px; }}
-            h2 {{ color: #2980b9; margin-top: 30px; border-left: 5px solid #2980b9; padding-left: 10px; }}
-            .metric-container {{ display: flex; justify-content: space-between; margin: 20px 0; background: #f8f9fa; padding: 20px; border-radius: 8px; }}
-            .metric {{ text-align: center; }}
-            .metric-value {{ font-size: 24px; font-weight: bold; color: #2c3e50; }}
-            .metric-label {{ font-size: 14px; color: #7f8c8d; }}
-            .diff-val {{ color: {diff_color}; }}
-            .chart-container {{ margin: 20px 0; border: 1px solid #eee; padding: 10px; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.05); }}
-            ul {{ list-style-type: none; padding: 0; }}
-            li {{ margin-bottom: 10px; padding: 10px; border-radius: 5px; }}
-            .highlight-pos {{ background-color: #e8f5e9; border-left: 4px solid #4caf50; }}
-            .highlight-neg {{ background-color: #ffebee; border-left: 4px solid #f44336; }}
-            .footer {{ margin-top: 50px; text-align: center; font-size: 12px; color: #95a5a6; border-top: 1px solid #eee; padding-top: 20px; }}
-            @media print {{
-                .chart-container {{ break-inside: avoid; }}
-                body {{ padding: 0; }}
-            }}
-        </style>
-    </head>
-    <body>
+# Jumlah desimal angka float di data grafik (skor sentimen tidak butuh presisi penuh)
+FIGURE_DECIMALS = 4
+
+# Template dikompilasi sekali saat modul dimuat dan dipakai ulang untuk setiap laporan.
+# Placeholder memakai sintaks string.Template ($nama) sehingga kurung kurawal CSS tidak perlu di-escape.
+
+_HTML_STYLE = """
+            body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; max_width: 1000px; margin: 0 auto; padding: 20px; }
+            h1 { color: #2c3e50; text-align: center; border-bottom: 2px solid #eee; padding-bottom: 10px; }
+            h2 { color: #2980b9; margin-top: 30px; border-left: 5px solid #2980b9; padding-left: 10px; }
+            .metric-container { display: flex; justify-content: space-between; margin: 20px 0; background: #f8f9fa; padding: 20px; border-radius: 8px; }
+            .metric { text-align: center; }
+            .metric-value { font-size: 24px; font-weight: bold; color: #2c3e50; }
+            .metric-label { font-size: 14px; color: #7f8c8d; }
+            .diff-pos { color: green; }
+            .diff-neg { color: red; }
+            .chart-container { margin: 20px 0; border: 1px solid #eee; padding: 10px; border-radius: 5px; box-shadow: 0 2px 5px rgba(0,0,0,0.05); }
+            ul { list-style-type: none; padding: 0; }
+            li { margin-bottom: 10px; padding: 10px; border-radius: 5px; }
+            .highlight-pos { background-color: #e8f5e9; border-left: 4px solid #4caf50; }
+            .highlight-neg { background-color: #ffebee; border-left: 4px solid #f44336; }
+            .toc li { margin-bottom: 2px; padding: 2px; }
+            .meeting { margin-bottom: 60px; }
+            .footer { margin-top: 50px; text-align: center; font-size: 12px; color: #95a5a6; border-top: 1px solid #eee; padding-top: 20px; }
+            @media print {
+                .chart-container { break-inside: avoid; }
+                .meeting { break-after: page; }
+                body { padding: 0; }
+            }
+"""
+
+_HTML_PAGE = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>$title</title>
+    <style>$style</style>
+    $plotlyjs
+</head>
+<body>
+$toc$sections
+    <div class="footer">
+        <p>Dibuat dengan FOMC VADER Analyzer. Laporan ini digenerate secara otomatis.</p>
+        <p><i>Disclaimer: Analisis ini menggunakan metode VADER dengan leksikon finansial khusus. Hasil analisis adalah indikasi, bukan nasihat investasi mutlak.</i></p>
+    </div>
+</body>
+</html>
+""")
+
+_HTML_SECTION = Template("""
+    <div class="meeting" id="$anchor">
         <h1>Laporan Analisis Sentimen FOMC</h1>
-        <p style="text-align: center;">File: <b>{filename}</b></p>
-        
+        <p style="text-align: center;">File: <b>$filename</b></p>
+
         <h2>1. Ringkasan Eksekutif</h2>
         <div class="metric-container">
             <div class="metric">
                 <div class="metric-label">Opening Speech</div>
-                <div class="metric-value">{opening_scores['compound']:.4f}</div>
+                <div class="metric-value">$opening</div>
             </div>
             <div class="metric">
-                <div class="metric-label">Q&A Session</div>
-                <div class="metric-value">{qa_scores['compound']:.4f}</div>
+                <div class="metric-label">Q&amp;A Session</div>
+                <div class="metric-value">$qa</div>
             </div>
             <div class="metric">
                 <div class="metric-label">Selisih</div>
-                <div class="metric-value diff-val">{diff:+.4f} ({diff_text})</div>
+                <div class="metric-value $diff_class">$diff ($diff_text)</div>
             </div>
         </div>
-        
+
         <h2>2. Sorotan Penting (Key Highlights)</h2>
         <h3>Kalimat Paling Optimis</h3>
-        <ul>{pos_highlights}</ul>
-        
+        <ul>$pos_highlights</ul>
+
         <h3>Kalimat Paling Pesimis/Waspada</h3>
-        <ul>{neg_highlights}</ul>
-        
+        <ul>$neg_highlights</ul>
+
         <h2>3. Visualisasi Perbandingan</h2>
         <div class="chart-container">
-            {div_comparison}
+            $chart_comparison
         </div>
-        
+
         <h2>4. Alur Sentimen (Sentiment Flow)</h2>
         <div class="chart-container">
-            {div_flow}
-        </div>
-        
-        <div class="footer">
-            <p>Dibuat dengan FOMC VADER Analyzer. Laporan ini digenerate secara otomatis.</p>
-            <p><i>Disclaimer: Analisis ini menggunakan metode VADER dengan leksikon finansial khusus. Hasil analisis adalah indikasi, bukan nasihat investasi mutlak.</i></p>
+            $chart_flow
         </div>
-    </body>
-    </html>
-    """
-    
-    return html_content.encode('utf-8')
+    </div>
+""")
 
-def generate_pdf_report(filename, opening_scores, qa_scores, topic_scores, fig_comparison, fig_flow, highlights, conclusion_data, certainty_op, certainty_qa):
-    """
-    Generates a PDF report by converting Plotly charts to images and using xhtml2pdf.
-    """
-    import base64
-    from xhtml2pdf import pisa
-    from io import BytesIO
-    
-    # 1. Convert Plotly Figures to Static Images (Base64)
-    # Requires 'kaleido' package
-    # Optimization: Reduced scale from 2 to 1 for faster generation
-    img_bytes_comp = fig_comparison.to_image(format="png", width=800, height=400, scale=1)
-    img_base64_comp = base64.b64encode(img_bytes_comp).decode('utf-8')
-    
-    img_bytes_flow = fig_flow.to_image(format="png", width=800, height=400, scale=1)
-    img_base64_flow = base64.b64encode(img_bytes_flow).decode('utf-8')
-    
-    # 2. Prepare HTML Content for PDF (Simpler CSS than web version)
-    diff = qa_scores['compound'] - opening_scores['compound']
-    diff_text = "Lebih Positif" if diff > 0 else "Lebih Negatif"
-    diff_color = "green" if diff > 0 else "red"
-    
-    pos_highlights = ""
-    if highlights['positive']:
-        for item in highlights['positive']:
-             pos_highlights += f"<li class='highlight-pos'><b>{item['source']}:</b> \"{item['text']}\"</li>"
-    else:
-        pos_highlights = "<li>Tidak ada kalimat yang sangat positif.</li>"
-        
-    neg_highlights = ""
-    if highlights['negative']:
-        for item in highlights['negative']:
-             neg_highlights += f"<li class='highlight-neg'><b>{item['source']}:</b> \"{item['text']}\"</li>"
-    else:
-        neg_highlights = "<li>Tidak ada kalimat yang sangat negatif.</li>"
+_HTML_TOC = Template("""
+    <h1>$title</h1>
+    <ul class="toc">$items</ul>
+""")
+_TOC_ITEM = Template("<li><a href=\"#$anchor\">$filename</a></li>")
+
+# Div + pemanggilan Plotly.newPlot dengan JSON ringkas (setara pio.to_html full_html=False)
+_CHART = Template("""<div id="$div_id" class="plotly-graph-div" style="height:100%; width:100%;"></div>
+            <script>Plotly.newPlot("$div_id", $data, $layout, {"responsive": true});</script>""")
 
-    # Topic Rows
-    topic_rows = ""
-    for topic, score in topic_scores.items():
-        topic_rows += f"<tr><td>{topic.capitalize()}</td><td>{score:.4f}</td></tr>"
+_HIGHLIGHT_ITEM = Template("<li class='$css_class'><b>$source:</b> \"$text\"</li>")
 
-    html_content = f"""
+_PDF_PAGE = Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <style>
-            @page {{ size: A4; margin: 2cm; }}
-            body {{ font-family: Helvetica, sans-serif; line-height: 1.5; color: #333; }}
-            h1 {{ color: #2c3e50; text-align: center; border-bottom: 1px solid #eee; padding-bottom: 10px; }}
-            h2 {{ color: #2980b9; margin-top: 20px; border-left: 4px solid #2980b9; padding-left: 10px; }}
-            h3 {{ color: #34495e; margin-top: 15px; }}
-            .metric-table {{ width: 100%; margin: 20px 0; border-collapse: collapse; }}
-            .metric-table td, .metric-table th {{ padding: 10px; text-align: center; border: 1px solid #ddd; }}
-            .metric-value {{ font-size: 18px; font-weight: bold; color: #2c3e50; }}
-            .metric-label {{ font-size: 12px; color: #7f8c8d; }}
-            .diff-val {{ color: {diff_color}; }}
-            .chart-img {{ width: 100%; margin: 10px 0; }}
-            ul {{ list-style-type: none; padding: 0; }}
-            li {{ margin-bottom: 8px; padding: 8px; background-color: #f9f9f9; }}
-            .highlight-pos {{ border-left: 4px solid #4caf50; }}
-            .highlight-neg {{ border-left: 4px solid #f44336; }}
-            .narrative-box {{ background-color: #f0f8ff; padding: 15px; border-radius: 5px; border-left: 5px solid {conclusion_data['color']}; }}
-            .footer {{ margin-top: 30px; text-align: center; font-size: 10px; color: #95a5a6; }}
+            @page { size: A4; margin: 2cm; }
+            body { font-family: Helvetica, sans-serif; line-height: 1.5; color: #333; }
+            h1 { color: #2c3e50; text-align: center; border-bottom: 1px solid #eee; padding-bottom: 10px; }
+            h2 { color: #2980b9; margin-top: 20px; border-left: 4px solid #2980b9; padding-left: 10px; }
+            h3 { color: #34495e; margin-top: 15px; }
+            .metric-table { width: 100%; margin: 20px 0; border-collapse: collapse; }
+            .metric-table td, .metric-table th { padding: 10px; text-align: center; border: 1px solid #ddd; }
+            .metric-value { font-size: 18px; font-weight: bold; color: #2c3e50; }
+            .metric-label { font-size: 12px; color: #7f8c8d; }
+            .diff-val { color: $diff_color; }
+            .chart-img { width: 100%; margin: 10px 0; }
+            ul { list-style-type: none; padding: 0; }
+            li { margin-bottom: 8px; padding: 8px; background-color: #f9f9f9; }
+            .highlight-pos { border-left: 4px solid #4caf50; }
+            .highlight-neg { border-left: 4px solid #f44336; }
+            .narrative-box { background-color: #f0f8ff; padding: 15px; border-radius: 5px; border-left: 5px solid $conclusion_color; }
+            .footer { margin-top: 30px; text-align: center; font-size: 10px; color: #95a5a6; }
         </style>
     </head>
     <body>
         <h1>Laporan Analisis Sentimen FOMC</h1>
-        <p style="text-align: center;">File: <b>{filename}</b></p>
-        
+        <p style="text-align: center;">File: <b>$filename</b></p>
+
         <h2>1. Ringkasan Eksekutif</h2>
         <div class="narrative-box">
-            <p><b>Status: {conclusion_data['status']}</b></p>
-            <p>{conclusion_data['narrative']}</p>
+            <p><b>Status: $conclusion_status</b></p>
+            <p>$conclusion_narrative</p>
         </div>
-        
+
         <table class="metric-table">
             <tr>
                 <td>
                     <div class="metric-label">Opening Speech</div>
-                    <div class="metric-value">{opening_scores['compound']:.4f}</div>
+                    <div class="metric-value">$opening</div>
                 </td>
                 <td>
-                    <div class="metric-label">Q&A Session</div>
-                    <div class="metric-value">{qa_scores['compound']:.4f}</div>
+                    <div class="metric-label">Q&amp;A Session</div>
+                    <div class="metric-value">$qa</div>
                 </td>
                 <td>
                     <div class="metric-label">Selisih</div>
-                    <div class="metric-value diff-val">{diff:+.4f}</div>
+                    <div class="metric-value diff-val">$diff</div>
                 </td>
             </tr>
         </table>
-        
+
         <h2>2. Analisis Mendalam</h2>
         <h3>Tingkat Keyakinan (Certainty Index)</h3>
         <table class="metric-table">
@@ -208,50 +175,304 @@ def generate_pdf_report(filename, opening_scores, qa_scores, topic_scores, fig_c
             </tr>
             <tr>
                 <td>Opening Speech</td>
-                <td>{certainty_op['score']:.2f}</td>
-                <td>{certainty_op['label']}</td>
+                <td>$certainty_op_score</td>
+                <td>$certainty_op_label</td>
             </tr>
             <tr>
-                <td>Q&A Session</td>
-                <td>{certainty_qa['score']:.2f}</td>
-                <td>{certainty_qa['label']}</td>
+                <td>Q&amp;A Session</td>
+                <td>$certainty_qa_score</td>
+                <td>$certainty_qa_label</td>
             </tr>
         </table>
-        
+
         <h3>Sentimen per Topik</h3>
         <table class="metric-table">
             <tr>
                 <th>Topik</th>
                 <th>Skor Sentimen</th>
             </tr>
-            {topic_rows}
+            $topic_rows
         </table>
-        
+
         <h2>3. Sorotan Penting</h2>
         <h3>Kalimat Paling Optimis</h3>
-        <ul>{pos_highlights}</ul>
-        
+        <ul>$pos_highlights</ul>
+
         <h3>Kalimat Paling Pesimis</h3>
-        <ul>{neg_highlights}</ul>
-        
+        <ul>$neg_highlights</ul>
+
         <h2>4. Visualisasi Perbandingan</h2>
-        <img class="chart-img" src="data:image/png;base64,{img_base64_comp}" />
-        
+        <img class="chart-img" src="data:image/png;base64,$img_comparison" />
+
         <h2>5. Alur Sentimen</h2>
-        <img class="chart-img" src="data:image/png;base64,{img_base64_flow}" />
-        
+        <img class="chart-img" src="data:image/png;base64,$img_flow" />
+
         <div class="footer">
             <p>Dibuat dengan FOMC VADER Analyzer.</p>
         </div>
     </body>
     </html>
+""")
+_TOPIC_ROW = Template("<tr><td>$topic</td><td>$score</td></tr>")
+
+_INDEX_PAGE = Template("""<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <title>$title</title>
+    <style>
+        body { font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; line-height: 1.6; color: #333; max-width: 1000px; margin: 0 auto; padding: 20px; }
+        h1 { color: #2c3e50; border-bottom: 2px solid #eee; padding-bottom: 10px; }
+        table { width: 100%; border-collapse: collapse; }
+        th, td { padding: 8px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background-color: #f8f9fa; }
+    </style>
+</head>
+<body>
+    <h1>$title</h1>
+    <p>$count pertemuan.</p>
+    <table>
+        <tr><th>Tanggal</th><th>File</th><th>Opening</th><th>Q&amp;A</th><th>Overall</th><th>Laporan</th></tr>
+        $rows
+    </table>
+</body>
+</html>
+""")
+_INDEX_ROW = Template(
+    "<tr><td>$date</td><td>$filename</td><td>$opening</td><td>$qa</td><td>$overall</td><td>$links</td></tr>"
+)
+_INDEX_LINK = Template("<a href='$href'>$label</a>")
+
+# --- Helper ---
+
+def _highlight_items(items, css_class, empty_text):
+    if not items:
+        return f"<li>{empty_text}</li>"
+    return "".join(
+        _HIGHLIGHT_ITEM.substitute(css_class=css_class, source=html.escape(item['source']), text=html.escape(item['text']))
+        for item in items
+    )
+
+def _anchor(filename):
+    return "meeting-" + re.sub(r'[^A-Za-z0-9]+', '-', os.path.splitext(filename)[0]).strip('-')
+
+def _round_typed_arrays(obj, decimals):
+    # Plotly >= 6 menyerialisasi array numpy sebagai base64 ({'dtype', 'bdata'}); array float
+    # di-decode lalu dibulatkan (list desimal pendek lebih kecil dari base64 float64)
+    if isinstance(obj, dict):
+        if 'bdata' in obj and str(obj.get('dtype', '')).startswith('f'):
+            values = np.frombuffer(base64.b64decode(obj['bdata']), dtype=obj['dtype'])
+            if 'shape' in obj:
+                values = values.reshape([int(n) for n in str(obj['shape']).split(',')])
+            values = np.round(values.astype(float), decimals)
+            return np.where(np.isfinite(values), values, None).tolist()
+        return {key: _round_typed_arrays(value, decimals) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_round_typed_arrays(value, decimals) for value in obj]
+    return obj
+
+def figure_json(fig, decimals=FIGURE_DECIMALS):
     """
-    
+    Serialisasi figure Plotly ke JSON ringkas: float dibulatkan ke `decimals` desimal, tanpa spasi.
+
+    Returns:
+        tuple: (data_json, layout_json) siap disisipkan ke <script>.
+    """
+    payload = json.loads(pio.to_json(fig, validate=False), parse_float=lambda value: round(float(value), decimals))
+    payload = _round_typed_arrays(payload, decimals)
+
+    def dump(obj):
+        # '</' di teks hover tidak boleh menutup tag <script>
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).replace('</', '<\\/')
+    return dump(payload.get('data', [])), dump(payload.get('layout', {}))
+
+def _chart_div(fig, div_id):
+    data, layout = figure_json(fig)
+    return _CHART.substitute(div_id=div_id, data=data, layout=layout)
+
+@functools.lru_cache(maxsize=1)
+def _inline_plotlyjs():
+    return get_plotlyjs()
+
+def plotly_bundle_name():
+    """Nama file bundle plotly.js lokal (mengandung versi, sehingga aman di-cache browser)."""
+    return f"plotly-{get_plotlyjs_version()}.min.js"
+
+def write_plotly_bundle(directory):
+    """
+    Menulis bundle plotly.js bersama ke `directory` (sekali; dilewati jika sudah ada).
+
+    Returns:
+        str: Nama file bundle (relatif terhadap directory), untuk argumen plotlyjs.
+    """
+    name = plotly_bundle_name()
+    path = os.path.join(directory, name)
+    if not os.path.exists(path):
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(_inline_plotlyjs())
+        os.replace(tmp_path, path)
+    return name
+
+def _plotlyjs_tag(plotlyjs):
+    """
+    plotlyjs: 'cdn' (cdn.plot.ly), 'inline' (disematkan penuh, ~3MB+), atau path/URL bundle
+    lokal bersama (mis. hasil write_plotly_bundle).
+    """
+    if plotlyjs == 'inline':
+        return f"<script>{_inline_plotlyjs()}</script>"
+    if plotlyjs == 'cdn':
+        src = f"https://cdn.plot.ly/plotly-{get_plotlyjs_version()}.min.js"
+    else:
+        src = plotlyjs
+    return f"<script charset=\"utf-8\" src=\"{html.escape(src)}\"></script>"
+
+# --- Laporan HTML ---
+
+def render_meeting_section(filename, opening_scores, qa_scores, topic_scores, fig_comparison, fig_flow, highlights):
+    """
+    Bagian HTML satu pertemuan (tanpa <head> dan plotly.js), untuk generate_html_report
+    atau digabung lewat generate_combined_report.
+
+    Returns:
+        str: Fragmen HTML.
+    """
+    anchor = _anchor(filename)
+    diff = qa_scores['compound'] - opening_scores['compound']
+    return _HTML_SECTION.substitute(
+        anchor=anchor,
+        filename=html.escape(filename),
+        opening=f"{opening_scores['compound']:.4f}",
+        qa=f"{qa_scores['compound']:.4f}",
+        diff=f"{diff:+.4f}",
+        diff_text="Lebih Positif" if diff > 0 else "Lebih Negatif",
+        diff_class="diff-pos" if diff > 0 else "diff-neg",
+        pos_highlights=_highlight_items(highlights['positive'], 'highlight-pos', "Tidak ada kalimat yang sangat positif."),
+        neg_highlights=_highlight_items(highlights['negative'], 'highlight-neg', "Tidak ada kalimat yang sangat negatif."),
+        chart_comparison=_chart_div(fig_comparison, f"{anchor}-comparison"),
+        chart_flow=_chart_div(fig_flow, f"{anchor}-flow"),
+    )
+
+def generate_html_report(filename, opening_scores, qa_scores, topic_scores, fig_comparison, fig_flow, highlights, plotlyjs='cdn'):
+    """
+    Generates a standalone HTML report with embedded Plotly charts.
+
+    Args:
+        plotlyjs (str): Sumber plotly.js: 'cdn' (default, butuh internet), 'inline' (file mandiri ~3MB+),
+            atau path/URL bundle lokal bersama (lihat write_plotly_bundle) untuk viewer offline.
+    """
+    section = render_meeting_section(filename, opening_scores, qa_scores, topic_scores, fig_comparison, fig_flow, highlights)
+    page = _HTML_PAGE.substitute(
+        title="Laporan Analisis Sentimen FOMC",
+        style=_HTML_STYLE,
+        plotlyjs=_plotlyjs_tag(plotlyjs),
+        toc="",
+        sections=section
+    )
+    return page.encode('utf-8')
+
+def generate_combined_report(sections, title="Laporan Analisis Sentimen FOMC", plotlyjs='inline'):
+    """
+    Satu laporan HTML berisi banyak pertemuan; plotly.js hanya disematkan sekali.
+
+    Args:
+        sections (list): List tuple (filename, fragmen dari render_meeting_section).
+        title (str): Judul halaman / daftar isi.
+        plotlyjs (str): Lihat generate_html_report (default 'inline': satu file mandiri untuk viewer offline).
+
+    Returns:
+        bytes: HTML (utf-8).
+    """
+    toc = _HTML_TOC.substitute(
+        title=html.escape(title),
+        items="".join(_TOC_ITEM.substitute(anchor=_anchor(name), filename=html.escape(name)) for name, _ in sections)
+    )
+    page = _HTML_PAGE.substitute(
+        title=html.escape(title),
+        style=_HTML_STYLE,
+        plotlyjs=_plotlyjs_tag(plotlyjs),
+        toc=toc,
+        sections="".join(section for _, section in sections)
+    )
+    return page.encode('utf-8')
+
+# --- Laporan PDF ---
+
+def generate_pdf_report(filename, opening_scores, qa_scores, topic_scores, fig_comparison, fig_flow, highlights, conclusion_data, certainty_op, certainty_qa):
+    """
+    Generates a PDF report by converting Plotly charts to images and using xhtml2pdf.
+    """
+    from xhtml2pdf import pisa
+    from io import BytesIO
+
+    from modules.raster import get_rasterizer
+
+    # 1. Convert Plotly Figures to Static Images (Base64)
+    # Requires 'kaleido' package
+    # Optimization: Reduced scale from 2 to 1 for faster generation
+    # Kedua grafik di-render bersamaan dan di-cache (PDF ulang untuk transkrip yang sama tidak memanggil kaleido)
+    img_bytes_comp, img_bytes_flow = get_rasterizer().render_many([fig_comparison, fig_flow], width=800, height=400, scale=1)
+
+    # 2. Prepare HTML Content for PDF (Simpler CSS than web version)
+    diff = qa_scores['compound'] - opening_scores['compound']
+
+    html_content = _PDF_PAGE.substitute(
+        filename=html.escape(filename),
+        diff_color="green" if diff > 0 else "red",
+        conclusion_color=conclusion_data['color'],
+        conclusion_status=conclusion_data['status'],
+        conclusion_narrative=conclusion_data['narrative'],
+        opening=f"{opening_scores['compound']:.4f}",
+        qa=f"{qa_scores['compound']:.4f}",
+        diff=f"{diff:+.4f}",
+        certainty_op_score=f"{certainty_op['score']:.2f}",
+        certainty_op_label=certainty_op['label'],
+        certainty_qa_score=f"{certainty_qa['score']:.2f}",
+        certainty_qa_label=certainty_qa['label'],
+        topic_rows="".join(
+            _TOPIC_ROW.substitute(topic=topic.capitalize(), score=f"{score:.4f}") for topic, score in topic_scores.items()
+        ),
+        pos_highlights=_highlight_items(highlights['positive'], 'highlight-pos', "Tidak ada kalimat yang sangat positif."),
+        neg_highlights=_highlight_items(highlights['negative'], 'highlight-neg', "Tidak ada kalimat yang sangat negatif."),
+        img_comparison=base64.b64encode(img_bytes_comp).decode('utf-8'),
+        img_flow=base64.b64encode(img_bytes_flow).decode('utf-8'),
+    )
+
     # 3. Convert HTML to PDF
     pdf_file = BytesIO()
     pisa_status = pisa.CreatePDF(html_content, dest=pdf_file)
-    
+
     if pisa_status.err:
         return None
-        
+
     return pdf_file.getvalue()
+
+# --- Indeks laporan batch ---
+
+def generate_index_page(entries, title="Laporan Sentimen FOMC"):
+    """
+    Halaman indeks untuk laporan batch: satu baris per pertemuan dengan skor dan tautan laporan.
+
+    Args:
+        entries (list): List dict {'filename', 'date', 'opening_compound', 'qa_compound',
+            'overall_compound', 'reports': list path relatif}.
+        title (str): Judul halaman.
+
+    Returns:
+        bytes: HTML (utf-8).
+    """
+    rows = "".join(
+        _INDEX_ROW.substitute(
+            date=entry.get('date') or '-',
+            filename=html.escape(entry['filename']),
+            opening=f"{entry['opening_compound']:.4f}",
+            qa=f"{entry['qa_compound']:.4f}",
+            overall=f"{entry['overall_compound']:.4f}",
+            links=" ".join(
+                _INDEX_LINK.substitute(href=html.escape(path), label=html.escape(path.rsplit('.', 1)[-1].upper()))
+                for path in entry['reports']
+            )
+        )
+        for entry in sorted(entries, key=lambda e: (e.get('date') or '', e['filename']))
+    )
+    return _INDEX_PAGE.substitute(title=html.escape(title), count=len(entries), rows=rows).encode('utf-8')
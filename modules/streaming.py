@@ -0,0 +1,291 @@
+import os
+import re
+import time
+
+from modules import analyzer
+from modules.nlp import split_sentences
+from modules.preprocessor import SPLIT_PATTERNS, MODERATOR_PATTERN
+
+# Teks di ekor buffer yang ditahan sebelum separator ditemukan,
+# agar frasa penutup yang terpotong antar chunk tetap terdeteksi
+BOUNDARY_LOOKBACK = 120
+
+SPEAKER_TAG = re.compile(r'<NAME>(.*?)</NAME>', re.IGNORECASE | re.DOTALL)
+ANY_TAG = re.compile(r'<[^>]+>')
+NAME_OPEN = re.compile(r'<NAME>', re.IGNORECASE)
+NAME_CLOSE = re.compile(r'</NAME>', re.IGNORECASE)
+
+class StreamingIngester:
+    """
+    Ingester transkrip live: menerima teks secara bertahap (chunk atau file yang terus bertambah).
+
+    - Separator Opening/Q&A dideteksi secara incremental memakai pola split_transcript.
+    - Teks Q&A diatribusikan ke pembicara saat tag <NAME> tiba (hanya target speaker yang diambil).
+    - Hanya kalimat yang baru selesai yang di-skor (kalimat terakhir ditahan sampai ada kalimat berikutnya).
+
+    Skor section yang dikirim per chunk adalah rata-rata berjalan skor kalimat;
+    skor gabungan persis seperti get_vader_score tersedia lewat final_scores().
+    """
+
+    def __init__(self, target_speaker="CHAIR POWELL", engine=None, rolling_window=5):
+        """
+        Args:
+            target_speaker (str): Pembicara yang diambil dari sesi Q&A.
+            engine (FomcSentimentEngine, optional): Default: engine global.
+            rolling_window (int): Jendela rata-rata bergerak untuk sentence flow.
+        """
+        self.target_speaker = target_speaker.upper()
+        self.engine = engine or analyzer.get_engine()
+        self.rolling_window = rolling_window
+
+        self.raw = ""
+        self.boundary = None
+        self.finished = False
+        self._consumed = 0
+        self._scanned = 0
+        self._speaker = None
+        self._untagged_qa = ""
+        self._qa_tag_seen = False
+
+        self._pending = {'opening': '', 'qa': ''}
+        self._seq = {'opening': 0, 'qa': 0}
+        self._features = {'opening': [], 'qa': []}
+        self.points = {'opening': [], 'qa': []}
+
+    # --- Input ---
+
+    def feed(self, chunk, final=False):
+        """
+        Memproses potongan teks baru.
+
+        Args:
+            chunk (str): Teks mentah baru (lanjutan dari chunk sebelumnya).
+            final (bool): True jika transkrip sudah selesai (semua sisa buffer di-flush).
+
+        Returns:
+            dict: {
+                'new_points': list titik sentence flow baru
+                    [{'section': str, 'seq': int, 'text': str, 'compound': float, 'rolling': float}, ...],
+                'opening_compound': float|None, 'qa_compound': float|None,
+                'qa_started': bool, 'latency': float (detik)
+            }
+        """
+        start = time.perf_counter()
+        self.raw += chunk
+
+        if self.boundary is None:
+            self._detect_boundary()
+
+        if self.boundary is None:
+            # Tahan ekor buffer: frasa separator mungkin belum lengkap
+            end = len(self.raw) if final else max(self._consumed, len(self.raw) - BOUNDARY_LOOKBACK)
+            self._consume_opening(self._safe_end(end, final))
+        else:
+            self._consume_opening(self.boundary)
+            self._consume_qa(self._safe_end(len(self.raw), final))
+
+        # Opening di-emit per kalimat selesai sejak awal; kalimat terakhir di-flush saat separator ditemukan
+        new_points = self._emit('opening', closed=self.boundary is not None or final)
+        new_points += self._emit('qa', closed=final)
+
+        if final:
+            self.finished = True
+
+        return {
+            'new_points': new_points,
+            'opening_compound': self._running_mean('opening'),
+            'qa_compound': self._running_mean('qa'),
+            'qa_started': self.boundary is not None,
+            'latency': time.perf_counter() - start
+        }
+
+    def finish(self):
+        """Menandai transkrip selesai dan mem-flush kalimat terakhir."""
+        return self.feed("", final=True)
+
+    def tail(self, path, poll_interval=0.5, idle_timeout=None, encoding='utf-8'):
+        """
+        Mengikuti file yang terus bertambah (seperti `tail -f`).
+
+        Args:
+            path (str): File transkrip live.
+            poll_interval (float): Jeda polling (detik).
+            idle_timeout (float, optional): Berhenti jika tidak ada data baru selama ini (None = terus).
+
+        Yields:
+            dict: Hasil feed() untuk setiap potongan data baru (dan finish() di akhir).
+        """
+        last_data = time.monotonic()
+        with open(path, 'r', encoding=encoding) as f:
+            while True:
+                chunk = f.read()
+                if chunk:
+                    last_data = time.monotonic()
+                    yield self.feed(chunk)
+                elif idle_timeout is not None and time.monotonic() - last_data > idle_timeout:
+                    break
+                else:
+                    time.sleep(poll_interval)
+        yield self.finish()
+
+    # --- Segmentasi incremental ---
+
+    def _detect_boundary(self):
+        search_from = max(0, self._scanned - BOUNDARY_LOOKBACK)
+        text = self.raw[search_from:]
+        starts = []
+        for pattern in SPLIT_PATTERNS + [MODERATOR_PATTERN]:
+            match = pattern.search(text)
+            if match:
+                starts.append(search_from + match.start())
+        self._scanned = len(self.raw)
+        if starts:
+            self.boundary = max(min(starts), self._consumed)
+
+    def _safe_end(self, end, final):
+        """Mundurkan batas proses agar tidak memotong tag <...> yang belum lengkap."""
+        if final:
+            return end
+        open_pos = self.raw.rfind('<', self._consumed, end)
+        if open_pos != -1 and self.raw.find('>', open_pos, end) == -1:
+            end = open_pos
+        # Nama pembicara juga belum lengkap sampai </NAME> tiba
+        segment = self.raw[self._consumed:end]
+        name_starts = [m.start() for m in NAME_OPEN.finditer(segment)]
+        if name_starts and not NAME_CLOSE.search(segment, name_starts[-1]):
+            end = self._consumed + name_starts[-1]
+        return end
+
+    def _consume_opening(self, end):
+        if end <= self._consumed:
+            return
+        segment = self.raw[self._consumed:end]
+        self._pending['opening'] += ANY_TAG.sub('', segment)
+        self._consumed = end
+
+    def _consume_qa(self, end):
+        if end <= self._consumed:
+            return
+        segment = self.raw[self._consumed:end]
+        position = 0
+        for match in SPEAKER_TAG.finditer(segment):
+            self._append_qa(segment[position:match.start()])
+            # Ganti pembicara: ucapan pembicara sebelumnya dianggap selesai
+            self._pending['qa'] += " "
+            self._speaker = match.group(1).strip().upper()
+            self._qa_tag_seen = True
+            position = match.end()
+        self._append_qa(segment[position:])
+        self._consumed = end
+
+    def _append_qa(self, text):
+        text = ANY_TAG.sub('', text)
+        if self._speaker is None:
+            # Teks sebelum tag pertama: hanya dipakai jika Q&A tidak punya tag sama sekali
+            self._untagged_qa += text
+        elif self.target_speaker in self._speaker:
+            self._pending['qa'] += text
+
+    # --- Scoring ---
+
+    def _complete_sentences(self, section, closed):
+        pending = self._pending[section]
+        if section == 'qa' and closed and not self._qa_tag_seen:
+            pending = self._untagged_qa + pending
+            self._untagged_qa = ""
+
+        text = re.sub(r'\s+', ' ', pending).strip()
+        if not text:
+            self._pending[section] = ''
+            return []
+
+        sentences = split_sentences(text)
+        if closed:
+            self._pending[section] = ''
+            return sentences
+        # Kalimat terakhir mungkin belum selesai: tahan sampai kalimat berikutnya datang
+        # (spasi di ujung dipertahankan agar kata pada chunk berikutnya tidak tersambung)
+        trailing = ' ' if pending[-1:].isspace() else ''
+        self._pending[section] = sentences[-1] + trailing if sentences else ''
+        return sentences[:-1]
+
+    def _emit(self, section, closed):
+        sentences = self._complete_sentences(section, closed)
+        if not sentences:
+            return []
+
+        records = self.engine.analyze_many(sentences)
+        new_points = []
+        for sent, (features, scores) in zip(sentences, records):
+            self._seq[section] += 1
+            self._features[section].append(features)
+            if len(sent.split()) < 3: continue # Skip kalimat terlalu pendek (sama dengan get_sentence_scores)
+
+            points = self.points[section]
+            window = [p['compound'] for p in points[-(self.rolling_window - 1):]] + [scores['compound']] if self.rolling_window > 1 else [scores['compound']]
+            point = {
+                'section': analyzer.SECTION_LABELS[section],
+                'seq': self._seq[section],
+                'text': sent,
+                'compound': scores['compound'],
+                'rolling': sum(window) / len(window)
+            }
+            points.append(point)
+            new_points.append(point)
+        return new_points
+
+    def _running_mean(self, section):
+        points = self.points[section]
+        if not points:
+            return None
+        return sum(p['compound'] for p in points) / len(points)
+
+    def final_scores(self):
+        """
+        Skor gabungan per section (setara get_vader_score pada Opening / Q&A penuh),
+        dihitung dari record kalimat yang sudah ada tanpa parsing ulang.
+
+        Returns:
+            dict: {'opening': dict skor, 'qa': dict skor}
+        """
+        return {
+            section: self.engine.score_combined(features)
+            for section, features in self._features.items()
+        }
+
+    def sentence_flow(self):
+        """
+        Returns:
+            tuple: (opening_sentences, qa_sentences) kompatibel dengan visualizer.plot_sentiment_flow.
+        """
+        return list(self.points['opening']), list(self.points['qa'])
+
+def main(argv=None):
+    """
+    Mode CLI sederhana: mengikuti file transkrip live dan mencetak skor berjalan.
+    Contoh: python -m modules.streaming live_transcript.txt
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='python -m modules.streaming', description="Skor konferensi pers FOMC secara live.")
+    parser.add_argument('path', help="File transkrip yang terus bertambah.")
+    parser.add_argument('--poll', type=float, default=0.5, help="Interval polling (detik).")
+    parser.add_argument('--idle-timeout', type=float, default=None, help="Berhenti jika tidak ada data baru selama N detik.")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.path):
+        parser.error(f"File not found: {args.path}")
+
+    ingester = StreamingIngester()
+    for update in ingester.tail(args.path, poll_interval=args.poll, idle_timeout=args.idle_timeout):
+        for point in update['new_points']:
+            print(f"[{point['section']} #{point['seq']}] {point['compound']:+.3f} (rolling {point['rolling']:+.3f}) {point['text'][:80]}")
+        opening = update['opening_compound']
+        qa = update['qa_compound']
+        print(
+            f"-- opening={'-' if opening is None else f'{opening:+.4f}'} "
+            f"qa={'-' if qa is None else f'{qa:+.4f}'} latency={update['latency'] * 1000:.0f}ms"
+        )
+
+if __name__ == '__main__':
+    main()
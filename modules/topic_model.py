@@ -0,0 +1,355 @@
+import json
+import os
+import re
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+from modules import analyzer
+from modules.cache import cache_path, make_fingerprint
+from modules.corpus import file_sha256
+
+MODEL_VERSION = 2
+DEFAULT_N_TOPICS = 8
+
+def _meeting_date(filename):
+    match = re.search(r'(\d{8})', filename)
+    if not match:
+        return None
+    try:
+        return datetime.strptime(match.group(1), '%Y%m%d').date().isoformat()
+    except ValueError:
+        return None
+
+class CorpusTopicModel:
+    """
+    Topic model tingkat korpus: satu vocabulary TF-IDF dan satu set centroid untuk semua pertemuan.
+
+    Vocabulary, IDF, centroid, dan statistik topik per pertemuan disimpan di disk (.npz),
+    sehingga transkrip baru cukup di-transform dan di-assign (tanpa fitting ulang),
+    atau dilipat ke model lewat partial_fit (update centroid rata-rata berjalan).
+    Jumlah vektor TF-IDF per topik tiap pertemuan ikut disimpan, sehingga kontribusi
+    transkrip yang berubah/dihapus bisa dikurangkan lagi dari centroid.
+    Vocabulary tetap setelah fit awal; kata baru diabaikan sampai fit ulang.
+    """
+
+    def __init__(self, n_topics=DEFAULT_N_TOPICS, path=None, seed=analyzer.CLUSTER_SEED, engine=None):
+        """
+        Args:
+            n_topics (int): Jumlah topik (centroid).
+            path (str, optional): File model (default: CACHE_DIR/topic_model.npz).
+            seed (int): Random seed MiniBatchKMeans.
+            engine (FomcSentimentEngine, optional): Default: engine global.
+        """
+        self.n_topics = n_topics
+        self.seed = seed
+        self.path = path or cache_path('topic_model.npz')
+        self.engine = engine or analyzer.get_engine()
+        self.fingerprint = make_fingerprint(MODEL_VERSION, n_topics, seed, self.engine.fingerprint)
+
+        self.vocabulary = None
+        self.idf = None
+        self.centroids = None
+        self.counts = None
+        self.meetings = {}
+        self._sums = {}
+        self._counter = None
+        self._load()
+
+    # --- Persistensi ---
+
+    def _load(self):
+        try:
+            with np.load(self.path, allow_pickle=False) as data:
+                meta = json.loads(str(data['meta']))
+                if meta.get('fingerprint') != self.fingerprint:
+                    return
+                self.vocabulary = [str(term) for term in data['vocabulary']]
+                self.idf = data['idf']
+                self.centroids = data['centroids']
+                self.counts = data['counts']
+                sums = sparse.csr_matrix(
+                    (data['sums_data'], data['sums_indices'], data['sums_indptr']),
+                    shape=(len(meta['sum_order']) * self.n_topics, len(self.vocabulary))
+                )
+        except (OSError, KeyError, ValueError):
+            return
+        self.meetings = meta.get('meetings', {})
+        self._sums = {
+            filename: sums[i * self.n_topics:(i + 1) * self.n_topics]
+            for i, filename in enumerate(meta['sum_order'])
+        }
+
+    def save(self):
+        """Menyimpan model secara atomik."""
+        tmp_path = self.path + '.tmp.npz'
+        sum_order = sorted(self._sums)
+        if sum_order:
+            sums = sparse.vstack([self._sums[filename] for filename in sum_order], format='csr')
+        else:
+            sums = sparse.csr_matrix((0, len(self.vocabulary)))
+        meta = {'fingerprint': self.fingerprint, 'meetings': self.meetings, 'sum_order': sum_order}
+        np.savez_compressed(
+            tmp_path,
+            meta=np.array(json.dumps(meta, sort_keys=True)),
+            vocabulary=np.array(self.vocabulary),
+            idf=self.idf,
+            centroids=self.centroids,
+            counts=self.counts,
+            sums_data=sums.data,
+            sums_indices=sums.indices,
+            sums_indptr=sums.indptr
+        )
+        os.replace(tmp_path, self.path)
+
+    @property
+    def fitted(self):
+        return self.centroids is not None
+
+    # --- Model ---
+
+    def fit(self, sentences):
+        """
+        Fit vocabulary/IDF dan centroid dari nol.
+
+        Args:
+            sentences (list): Kalimat korpus.
+
+        Returns:
+            numpy.ndarray: Label topik per kalimat.
+
+        Raises:
+            ValueError: Jika jumlah kalimat kurang dari jumlah topik.
+        """
+        if len(sentences) < self.n_topics:
+            raise ValueError(f"Need at least {self.n_topics} sentences to fit {self.n_topics} topics, got {len(sentences)}")
+        vectorizer = TfidfVectorizer(stop_words='english', max_df=0.8, min_df=2)
+        matrix = vectorizer.fit_transform(sentences)
+        self.vocabulary = list(vectorizer.get_feature_names_out())
+        self.idf = vectorizer.idf_
+        self._counter = None
+
+        model = MiniBatchKMeans(n_clusters=self.n_topics, random_state=self.seed, n_init=3, batch_size=1024)
+        labels = model.fit_predict(matrix)
+        self.centroids = model.cluster_centers_
+        self.counts = np.bincount(labels, minlength=self.n_topics).astype(float)
+        self.meetings = {}
+        self._sums = {}
+        return labels
+
+    def transform(self, sentences):
+        """
+        Matriks TF-IDF (l2) dengan vocabulary & IDF yang tersimpan (setara TfidfVectorizer.transform).
+        """
+        if self._counter is None:
+            self._counter = CountVectorizer(vocabulary=self.vocabulary)
+        counts = self._counter.transform(sentences)
+        return normalize(counts.multiply(self.idf).tocsr())
+
+    def assign(self, sentences):
+        """
+        Label topik (centroid terdekat, jarak Euclidean) untuk kalimat baru.
+
+        Returns:
+            numpy.ndarray: Label topik per kalimat.
+        """
+        if not sentences:
+            return np.array([], dtype=int)
+        return self._assign_matrix(self.transform(sentences))
+
+    def _assign_matrix(self, matrix):
+        # argmin ||x - c||^2 = argmin (||c||^2 - 2 x.c)
+        distances = (self.centroids ** 2).sum(axis=1)[None, :] - 2 * (matrix @ self.centroids.T)
+        return np.asarray(distances).argmin(axis=1)
+
+    def partial_fit(self, sentences):
+        """
+        Melipat kalimat baru ke model: assign lalu update centroid (rata-rata berjalan).
+
+        Returns:
+            numpy.ndarray: Label topik per kalimat.
+        """
+        if not sentences:
+            return np.array([], dtype=int)
+        return self._fold(self.transform(sentences))
+
+    def _fold(self, matrix):
+        labels = self._assign_matrix(matrix)
+        for topic in np.unique(labels):
+            mask = labels == topic
+            n_new = mask.sum()
+            total = self.counts[topic] + n_new
+            batch_sum = np.asarray(matrix[mask].sum(axis=0)).ravel()
+            self.centroids[topic] = (self.centroids[topic] * self.counts[topic] + batch_sum) / total
+            self.counts[topic] = total
+        return labels
+
+    def _unfold(self, filename):
+        """Mengurangkan kontribusi satu pertemuan dari centroid & counts lalu membuangnya dari tabel."""
+        entry = self.meetings.pop(filename, None)
+        sums = self._sums.pop(filename, None)
+        if entry is None or sums is None:
+            return
+        sums = sums.toarray()
+        for topic, n_old in enumerate(entry['counts']):
+            if n_old == 0:
+                continue
+            remaining = self.counts[topic] - n_old
+            if remaining > 0:
+                self.centroids[topic] = (self.centroids[topic] * self.counts[topic] - sums[topic]) / remaining
+            # Topik kosong: centroid lama dipertahankan, batch berikutnya menggantikannya (count 0)
+            self.counts[topic] = max(remaining, 0.0)
+
+    def top_terms(self, topic, n=3):
+        indices = self.centroids[topic].argsort()[-n:][::-1]
+        return [self.vocabulary[i] for i in indices]
+
+    def topic_labels(self):
+        """Label topik dari 3 term teratas tiap centroid (kosong jika model belum di-fit)."""
+        if not self.fitted:
+            return []
+        return [", ".join(t.title() for t in self.top_terms(topic)) for topic in range(self.n_topics)]
+
+    # --- Korpus ---
+
+    def _record_meeting(self, filename, sha256, labels, compounds, matrix):
+        compounds = np.asarray(compounds, dtype=float)
+        # Jumlah vektor TF-IDF per topik (n_topics x vocabulary), untuk _unfold
+        indicator = sparse.csr_matrix(
+            (np.ones(len(labels)), (labels, np.arange(len(labels)))), shape=(self.n_topics, len(labels))
+        )
+        self._sums[filename] = (indicator @ matrix).tocsr()
+        self.meetings[filename] = {
+            'date': _meeting_date(filename),
+            'sha256': sha256,
+            'counts': np.bincount(labels, minlength=self.n_topics).tolist(),
+            'sentiment_sums': np.bincount(labels, weights=compounds, minlength=self.n_topics).tolist()
+        }
+
+    def update(self, directory, target_speaker="CHAIR POWELL"):
+        """
+        Sinkronisasi model dengan direktori korpus. Fit awal jika model belum ada;
+        setelah itu hanya file baru/berubah yang di-assign dan dilipat lewat partial_fit.
+        Kontribusi lama file yang berubah/dihapus dikurangkan dulu dari centroid.
+        Korpus kosong (kalimat < jumlah topik) membiarkan model tetap belum di-fit.
+
+        Args:
+            directory (str): Direktori transkrip (.txt).
+            target_speaker (str): Pembicara yang diambil dari sesi Q&A.
+
+        Returns:
+            list: Nama file yang (di)proses.
+        """
+        files = sorted(f for f in os.listdir(directory) if f.endswith('.txt'))
+        hashes = {f: file_sha256(os.path.join(directory, f)) for f in files}
+
+        changed = False
+        for filename in set(self.meetings) - set(files):
+            self._unfold(filename)
+            changed = True
+
+        pending = [f for f in files if not self.fitted or self.meetings.get(f, {}).get('sha256') != hashes[f]]
+        if not pending:
+            if changed:
+                self.save()
+            return []
+
+        extracted = {f: analyzer.transcript_sentences(os.path.join(directory, f), target_speaker, self.engine) for f in pending}
+
+        if not self.fitted:
+            all_sentences = [s for f in pending for s in extracted[f][0]]
+            if len(all_sentences) < self.n_topics:
+                # Korpus kosong/tidak terbaca: model tetap belum di-fit (tidak disimpan)
+                return []
+            labels = self.fit(all_sentences)
+            matrix = self.transform(all_sentences)
+            offset = 0
+            for filename in pending:
+                sentences, compounds = extracted[filename]
+                end = offset + len(sentences)
+                self._record_meeting(filename, hashes[filename], labels[offset:end], compounds, matrix[offset:end])
+                offset = end
+        else:
+            for filename in pending:
+                sentences, compounds = extracted[filename]
+                self._unfold(filename)
+                matrix = self.transform(sentences)
+                self._record_meeting(filename, hashes[filename], self._fold(matrix), compounds, matrix)
+
+        self.save()
+        return pending
+
+    def topic_summary(self, sentences, compounds):
+        """
+        Distribusi & sentimen topik korpus untuk satu transkrip (tanpa fitting).
+        Format kompatibel dengan visualizer.plot_cluster_sentiment.
+
+        Returns:
+            list: List dict {'cluster_id', 'label', 'count', 'avg_sentiment', 'top_terms'}, urut sentimen.
+        """
+        if not self.fitted:
+            return []
+        labels = self.assign(sentences)
+        compounds = np.asarray(compounds, dtype=float)
+        names = self.topic_labels()
+        results = []
+        for topic in range(self.n_topics):
+            mask = labels == topic
+            if not mask.any():
+                continue
+            results.append({
+                'cluster_id': topic,
+                'label': names[topic],
+                'count': int(mask.sum()),
+                'avg_sentiment': float(compounds[mask].mean()),
+                'top_terms': self.top_terms(topic)
+            })
+        results.sort(key=lambda x: x['avg_sentiment'], reverse=True)
+        return results
+
+    def topic_meeting_table(self, value='sentiment'):
+        """
+        Tabel topik x pertemuan dari statistik tersimpan.
+
+        Args:
+            value (str): 'sentiment' (rata-rata compound per topik), 'share' (porsi kalimat),
+                atau 'count' (jumlah kalimat).
+
+        Returns:
+            pandas.DataFrame: Index tanggal pertemuan, kolom label topik (NaN jika topik tidak muncul).
+        """
+        if not self.fitted:
+            return pd.DataFrame(index=pd.Index([], name='date'))
+        meetings = sorted(
+            (entry for entry in self.meetings.values() if entry['date']),
+            key=lambda entry: entry['date']
+        )
+        counts = np.array([entry['counts'] for entry in meetings], dtype=float).reshape(-1, self.n_topics)
+        sums = np.array([entry['sentiment_sums'] for entry in meetings], dtype=float).reshape(-1, self.n_topics)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            if value == 'sentiment':
+                values = np.where(counts > 0, sums / counts, np.nan)
+            elif value == 'share':
+                values = counts / counts.sum(axis=1, keepdims=True)
+            elif value == 'count':
+                values = counts
+            else:
+                raise ValueError(f"Unknown value: {value}")
+
+        index = pd.Index([datetime.strptime(entry['date'], '%Y-%m-%d').date() for entry in meetings], name='date')
+        return pd.DataFrame(values, index=index, columns=self.topic_labels())
+
+def build_topic_model(directory="fomc-transcript", n_topics=DEFAULT_N_TOPICS, path=None):
+    """
+    Memuat topic model korpus dari disk dan menyinkronkannya dengan direktori
+    (fit penuh hanya pada pemanggilan pertama).
+    """
+    model = CorpusTopicModel(n_topics=n_topics, path=path)
+    model.update(directory)
+    return model
@@ -1,22 +1,233 @@
+import hashlib
+import os
 import random
-from transformers import pipeline
+import threading
 from scipy import stats
 import plotly.graph_objects as go
 import numpy as np
+from modules.cache import ScoreCache, cache_path, make_fingerprint
+
+# SOTA Model: ProsusAI/finbert (Specific for Financial Sentiment)
+# Bisa diganti dengan path model lokal (mis. model kecil untuk pengujian) lewat FOMC_FINBERT_MODEL
+DEFAULT_MODEL = "ProsusAI/finbert"
+DEFAULT_BATCH_SIZE = 32
+BACKENDS = ('torch', 'int8', 'onnx')
+FINBERT_LABELS = ('positive', 'negative', 'neutral')
+
+# File di direktori model lokal yang menentukan hasil inferensi (lihat local_revision)
+_WEIGHT_SUFFIXES = ('.safetensors', '.bin', '.onnx', '.h5', '.msgpack')
+
+def local_revision(path):
+    """
+    Revisi model lokal (tanpa commit hash Hugging Face): hash isi config.json
+    + nama, ukuran, dan mtime file bobot, sehingga dua checkpoint lokal berbeda
+    tidak berbagi entry ScoreCache.
+    
+    Args:
+        path (str): Direktori model lokal.
+        
+    Returns:
+        str: 'local-<fingerprint>'.
+    """
+    parts = []
+    for name in sorted(os.listdir(path)):
+        file_path = os.path.join(path, name)
+        if name == 'config.json':
+            with open(file_path, 'rb') as f:
+                parts.append((name, hashlib.sha1(f.read()).hexdigest()))
+        elif name.endswith(_WEIGHT_SUFFIXES):
+            stat = os.stat(file_path)
+            parts.append((name, stat.st_size, stat.st_mtime_ns))
+    return f"local-{make_fingerprint(parts)}"
+
+class FinbertScorer:
+    """
+    Inferensi FinBERT dalam batch (padding dinamis) untuk CPU.
+    
+    Kalimat diurutkan berdasarkan panjang sebelum di-batch agar padding minimal,
+    lalu hasilnya dikembalikan dalam urutan input. Backend:
+    - 'torch': model PyTorch biasa.
+    - 'int8': dynamic int8 quantization (torch.nn.Linear) untuk CPU.
+    - 'onnx': file model.onnx di direktori model lokal (onnxruntime); fallback ke 'torch' jika tidak ada.
+    
+    Model apa pun dengan label positive/negative/neutral dapat dipakai, termasuk
+    model kecil lokal sebagai pengganti FinBERT saat pengujian.
+    
+    Jika cache_path diberikan, probabilitas per kalimat disimpan di ScoreCache (SQLite)
+    dengan key hash(kalimat) + identitas model (nama, revisi, backend, max_length);
+    hanya kalimat yang belum ada di cache yang di-inferensi.
+    """
+    
+    def __init__(self, model_name=None, backend=None, batch_size=DEFAULT_BATCH_SIZE, num_threads=None, max_length=512,
+                 cache_path=None):
+        """
+        Args:
+            model_name (str, optional): Nama model Hugging Face atau path lokal
+                (default: env FOMC_FINBERT_MODEL atau DEFAULT_MODEL).
+            backend (str, optional): 'torch', 'int8', atau 'onnx' (default: env FOMC_FINBERT_BACKEND atau 'torch').
+            batch_size (int): Jumlah kalimat per batch inferensi.
+            num_threads (int, optional): Jumlah thread torch (default: env FOMC_TORCH_THREADS, atau bawaan torch).
+            max_length (int): Panjang token maksimum (kalimat lebih panjang dipotong).
+            cache_path (str, optional): File SQLite untuk ScoreCache (None = tanpa cache).
+        """
+        import torch
+        from transformers import AutoModelForSequenceClassification, AutoTokenizer
+        
+        self.model_name = model_name or os.environ.get('FOMC_FINBERT_MODEL') or DEFAULT_MODEL
+        self.backend = backend or os.environ.get('FOMC_FINBERT_BACKEND') or 'torch'
+        if self.backend not in BACKENDS:
+            raise ValueError(f"Unknown FinBERT backend: {self.backend} (expected one of {BACKENDS})")
+        self.batch_size = batch_size
+        self.max_length = max_length
+        
+        num_threads = num_threads or int(os.environ.get('FOMC_TORCH_THREADS', '0'))
+        if num_threads > 0:
+            torch.set_num_threads(num_threads)
+            
+        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        self._session = None
+        self.model = None
+        
+        if self.backend == 'onnx':
+            onnx_path = os.path.join(self.model_name, 'model.onnx')
+            try:
+                import onnxruntime
+            except ImportError:
+                onnxruntime = None
+            if onnxruntime is not None and os.path.exists(onnx_path):
+                from transformers import AutoConfig
+                options = onnxruntime.SessionOptions()
+                if num_threads > 0:
+                    options.intra_op_num_threads = num_threads
+                self._session = onnxruntime.InferenceSession(onnx_path, options, providers=['CPUExecutionProvider'])
+                self.config = AutoConfig.from_pretrained(self.model_name)
+            else:
+                print(f"ONNX model not available for {self.model_name}; falling back to torch backend.")
+                self.backend = 'torch'
+                
+        if self._session is None:
+            self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+            self.model.eval()
+            if self.backend == 'int8':
+                self.model = torch.quantization.quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+            self.config = self.model.config
+            
+        # Indeks kolom logits untuk tiap label FinBERT
+        id2label = {int(i): str(label).lower() for i, label in self.config.id2label.items()}
+        self.label_index = {label: i for i, label in id2label.items() if label in FINBERT_LABELS}
+        
+        # Identitas model (nama + revisi) untuk key cache skor
+        self.revision = getattr(self.config, '_commit_hash', None)
+        if self.revision is None:
+            self.revision = local_revision(self.model_name) if os.path.isdir(self.model_name) else 'unknown'
+        fingerprint = make_fingerprint(self.model_id, self.max_length, sorted(self.label_index.items()))
+        self.cache = ScoreCache(cache_path, fingerprint) if cache_path else None
+        
+    @property
+    def model_id(self):
+        return f"{self.model_name}@{self.revision}:{self.backend}"
+        
+    def _logits(self, batch):
+        if self._session is not None:
+            encoded = self.tokenizer(batch, padding=True, truncation=True, max_length=self.max_length, return_tensors='np')
+            input_names = {i.name for i in self._session.get_inputs()}
+            feeds = {name: value for name, value in encoded.items() if name in input_names}
+            return self._session.run(None, feeds)[0]
+            
+        import torch
+        encoded = self.tokenizer(batch, padding=True, truncation=True, max_length=self.max_length, return_tensors='pt')
+        with torch.inference_mode():
+            return self.model(**encoded).logits.numpy()
+            
+    def predict_proba(self, texts, batch_size=None):
+        """
+        Probabilitas positive/negative/neutral per kalimat.
+        
+        Args:
+            texts (list): List kalimat.
+            batch_size (int, optional): Override ukuran batch.
+            
+        Returns:
+            list: List dict {'positive': float, 'negative': float, 'neutral': float}, urutan sama dengan input.
+        """
+        texts = list(texts)
+        batch_size = batch_size or self.batch_size
+        
+        # Lookup cache sekaligus; hanya kalimat unik yang belum ada yang di-inferensi
+        cached = self.cache.get_many(texts) if self.cache is not None else [None] * len(texts)
+        results = dict(zip(texts, cached))
+        missing = [text for text, value in results.items() if value is None]
+        
+        # Urutkan berdasarkan panjang: batch berisi kalimat sepanjang mirip (padding minimal)
+        missing.sort(key=len)
+        
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start:start + batch_size]
+            logits = self._logits(batch)
+            logits = logits - logits.max(axis=1, keepdims=True)
+            probs = np.exp(logits)
+            probs /= probs.sum(axis=1, keepdims=True)
+            values = [{label: float(row[col]) for label, col in self.label_index.items()} for row in probs]
+            results.update(zip(batch, values))
+            if self.cache is not None:
+                self.cache.put_many(batch, values)
+                
+        return [results[text] for text in texts]
+        
+    def score_many(self, texts, batch_size=None):
+        """
+        Skor skalar FinBERT (-1 sampai 1): Positive Prob - Negative Prob.
+        """
+        return [finbert_score(probs) for probs in self.predict_proba(texts, batch_size)]
+
+def finbert_score(probs):
+    """
+    Convert to single scalar score (-1 to 1)
+    Logic: Positive Prob - Negative Prob (Neutral ignored as 0 center)
+    """
+    return probs.get('positive', 0) - probs.get('negative', 0)
+
+_SCORERS = {}
+_SCORERS_LOCK = threading.Lock()
+
+def get_finbert(model_name=None, backend=None, num_threads=None):
+    """
+    FinbertScorer global per (model, backend): model dimuat sekali per proses
+    dan dibagi antar sesi Streamlit (read-only setelah dimuat).
+    Scorer global memakai ScoreCache di CACHE_DIR/finbert.sqlite.
+    """
+    model_name = model_name or os.environ.get('FOMC_FINBERT_MODEL') or DEFAULT_MODEL
+    backend = backend or os.environ.get('FOMC_FINBERT_BACKEND') or 'torch'
+    key = (model_name, backend)
+    with _SCORERS_LOCK:
+        if key not in _SCORERS:
+            print("Loading FinBERT model for validation (this may take a while)...")
+            # Persistent cache aktif kecuali dimatikan lewat FOMC_FINBERT_CACHE=0
+            use_cache = os.environ.get('FOMC_FINBERT_CACHE', '1') != '0'
+            _SCORERS[key] = FinbertScorer(
+                model_name, backend, num_threads=num_threads,
+                cache_path=cache_path('finbert.sqlite') if use_cache else None
+            )
+        return _SCORERS[key]
 
 class ScientificValidator:
     """
     Validasi ilmiah membandingkan skor VADER modifikasi dengan model SOTA (FinBERT).
     """
     
-    def __init__(self):
+    def __init__(self, model_name=None, backend=None, batch_size=DEFAULT_BATCH_SIZE, num_threads=None, scorer=None):
         """
-        Inisialisasi model FinBERT.
-        Menggunakan pipeline 'sentiment-analysis' dari Hugging Face.
+        Inisialisasi model FinBERT (dimuat sekali per proses, lihat get_finbert).
+        
+        Args:
+            model_name (str, optional): Nama/path model (default: DEFAULT_MODEL).
+            backend (str, optional): 'torch', 'int8', atau 'onnx'.
+            batch_size (int): Jumlah kalimat per batch inferensi.
+            num_threads (int, optional): Jumlah thread torch.
+            scorer (FinbertScorer, optional): Scorer yang sudah dimuat (mis. model kecil untuk pengujian).
         """
-        print("Loading FinBERT model for validation (this may take a while)...")
-        # Load SOTA Model: ProsusAI/finbert (Specific for Financial Sentiment)
-        self.finbert = pipeline("sentiment-analysis", model="ProsusAI/finbert", return_all_scores=True)
+        self.finbert = scorer or get_finbert(model_name, backend, num_threads)
+        self.batch_size = batch_size
         
     def validate_against_sota(self, texts, vader_scores, sample_size=30):
         """
@@ -25,7 +236,7 @@ class ScientificValidator:
         Args:
             texts (list): List kalimat original.
             vader_scores (list): List skor VADER (compound) yang sudah dihitung.
-            sample_size (int): Jumlah sampel untuk validasi (default 30 agar cepat).
+            sample_size (int): Jumlah sampel untuk validasi (default 30 agar cepat; None = semua kalimat).
             
         Returns:
             dict: Hasil statistik korelasi dan data plotting.
@@ -39,41 +250,37 @@ class ScientificValidator:
         if total_len == 0:
             return {'correlation': 0, 'p_value': 1, 'data': []}
             
-        indices = random.sample(range(total_len), min(sample_size, total_len))
+        if sample_size is None or sample_size >= total_len:
+            indices = list(range(total_len))
+        else:
+            indices = random.sample(range(total_len), sample_size)
         
         validation_data = []
         finbert_scores = []
         sampled_vader = []
         
-        for idx in indices:
-            text = texts[idx]
+        # Run FinBERT (batch)
+        # FinBERT labels: 'positive', 'negative', 'neutral'
+        sample = [texts[idx] for idx in indices]
+        try:
+            f_scores = self.finbert.score_many(sample, self.batch_size)
+        except Exception as e:
+            # Satu input bermasalah tidak boleh menggagalkan seluruh batch: ulangi per kalimat
+            print(f"Error processing FinBERT batch, retrying per sentence: {e}")
+            f_scores = [self._score_one(text) for text in sample]
+            
+        for idx, f_score in zip(indices, f_scores):
+            if f_score is None:
+                continue
             v_score = vader_scores[idx]
+            finbert_scores.append(f_score)
+            sampled_vader.append(v_score)
             
-            # Run FinBERT
-            # Output format: [[{'label': 'positive', 'score': 0.9}, ...]]
-            # FinBERT labels: 'positive', 'negative', 'neutral'
-            try:
-                results = self.finbert(text)[0]
-                
-                # Extract probabilities
-                prob_pos = next((item['score'] for item in results if item['label'] == 'positive'), 0)
-                prob_neg = next((item['score'] for item in results if item['label'] == 'negative'), 0)
-                # prob_neu = next((item['score'] for item in results if item['label'] == 'neutral'), 0)
-                
-                # Convert to single scalar score (-1 to 1)
-                # Logic: Positive Prob - Negative Prob (Neutral ignored as 0 center)
-                f_score = prob_pos - prob_neg
-                
-                finbert_scores.append(f_score)
-                sampled_vader.append(v_score)
-                
-                validation_data.append({
-                    'text': text,
-                    'vader_score': v_score,
-                    'finbert_score': f_score
-                })
-            except Exception as e:
-                print(f"Error processing text for FinBERT: {e}")
+            validation_data.append({
+                'text': texts[idx],
+                'vader_score': v_score,
+                'finbert_score': f_score
+            })
                 
         # Calculate Pearson Correlation
         if len(validation_data) > 1:
@@ -84,9 +291,26 @@ class ScientificValidator:
         return {
             'correlation': corr_coef,
             'p_value': p_value,
-            'data': validation_data
+            'data': validation_data,
+            'cache_stats': self.cache_stats()
         }
         
+    def _score_one(self, text):
+        """Skor FinBERT satu kalimat, atau None jika gagal (kalimat dilewati)."""
+        try:
+            return self.finbert.score_many([text], 1)[0]
+        except Exception as e:
+            print(f"Error processing text for FinBERT: {e}")
+            return None
+            
+    def cache_stats(self):
+        """
+        Returns:
+            dict: Statistik ScoreCache FinBERT ({'hits', 'misses', 'hit_rate', 'entries'}), atau None tanpa cache.
+        """
+        cache = getattr(self.finbert, 'cache', None)
+        return cache.stats() if cache is not None else None
+        
     def plot_validation_scatter(self, validation_result):
         """
         Membuat Scatter Plot perbandingan VADER vs FinBERT.
@@ -1,5 +1,12 @@
+import hashlib
+import io
+import json
+from collections import Counter
+
 import plotly.graph_objects as go
 
+from modules.raster import get_rasterizer
+
 def plot_comparison(opening_scores, qa_scores):
     """
     Membuat Grouped Bar Chart untuk membandingkan skor sentimen.
@@ -66,86 +73,80 @@ def plot_gauge(opening_compound, qa_compound):
     fig.update_layout(height=400)
     return fig
 
-def plot_wordcloud(text):
+# Parameter Word Cloud (random_state tetap agar layout deterministik dan aman di-cache)
+WORDCLOUD_WIDTH = 800
+WORDCLOUD_HEIGHT = 400
+WORDCLOUD_MAX_WORDS = 200
+WORDCLOUD_SEED = 42
+
+def wordcloud_key(frequencies, width=WORDCLOUD_WIDTH, height=WORDCLOUD_HEIGHT, max_words=WORDCLOUD_MAX_WORDS):
+    """Key cache Word Cloud: hash tabel frekuensi + parameter render + versi wordcloud."""
+    import wordcloud
+    
+    digest = hashlib.sha1(json.dumps(sorted(frequencies.items()), separators=(',', ':')).encode('utf-8'))
+    digest.update(f"|{width}|{height}|{max_words}|{WORDCLOUD_SEED}|{wordcloud.__version__}".encode('utf-8'))
+    return digest.hexdigest()
+
+def wordcloud_png(frequencies, width=WORDCLOUD_WIDTH, height=WORDCLOUD_HEIGHT, max_words=WORDCLOUD_MAX_WORDS):
     """
-    Membuat Word Cloud dari teks dengan filter POS Tagging (Hanya Noun & Adjective).
+    Render Word Cloud dari frekuensi kata kunci ke PNG (Hanya Noun & Adjective, tanpa stopwords).
+    
+    Hasil di-cache (memori + disk, lihat raster.ChartRasterizer.render_cached) berdasarkan
+    hash tabel frekuensi, sehingga rerun Streamlit / transkrip yang sama tidak di-render ulang.
+    Tidak memakai matplotlib (tidak ada figure yang perlu ditutup).
     
     Args:
-        text (str): Teks input.
+        frequencies (dict): {kata: jumlah}, mis. TranscriptAnalysis.keyword_frequencies
+            atau KeywordIndex.keyword_frequencies (korpus).
+        width (int), height (int): Ukuran gambar (pixel).
+        max_words (int): Jumlah kata maksimum di gambar.
         
     Returns:
-        matplotlib.figure.Figure: Objek gambar Matplotlib.
+        bytes: PNG, atau None jika tidak ada kata kunci.
     """
-    from wordcloud import WordCloud
-    import matplotlib.pyplot as plt
-    import nltk
-    from nltk.corpus import stopwords
-    from nltk.tokenize import word_tokenize
-    from nltk.tag import pos_tag
-    
-    # Download NLTK resources if not present
-    try:
-        nltk.data.find('tokenizers/punkt')
-    except LookupError:
-        nltk.download('punkt')
-        
-    try:
-        nltk.data.find('tokenizers/punkt_tab')
-    except LookupError:
-        nltk.download('punkt_tab')
+    # Hanya max_words kata teratas yang tampil: key & render cukup dari tabel yang dipangkas
+    frequencies = dict(Counter(frequencies).most_common(max_words))
+    if not frequencies:
+        return None
         
-    try:
-        nltk.data.find('taggers/averaged_perceptron_tagger')
-    except LookupError:
-        nltk.download('averaged_perceptron_tagger')
+    def render():
+        from wordcloud import WordCloud
         
-    try:
-        nltk.data.find('taggers/averaged_perceptron_tagger_eng')
-    except LookupError:
-        nltk.download('averaged_perceptron_tagger_eng')
+        # Filter POS & stopword sudah dilakukan di fused token pass (nlp.is_keyword_token)
+        wordcloud = WordCloud(
+            width=width, height=height, max_words=max_words, background_color='white',
+            collocations=False, random_state=WORDCLOUD_SEED
+        )
+        wordcloud.generate_from_frequencies(frequencies)
+        buffer = io.BytesIO()
+        wordcloud.to_image().save(buffer, format='PNG')
+        return buffer.getvalue()
         
-    try:
-        nltk.data.find('corpora/stopwords')
-    except LookupError:
-        nltk.download('stopwords')
+    return get_rasterizer().render_cached(wordcloud_key(frequencies, width, height, max_words), 'png', render)
 
-    # 1. Tokenisasi & POS Tagging
-    tokens = word_tokenize(text.lower())
-    tagged_tokens = pos_tag(tokens)
-    
-    # 2. Whitelist Filter: Hanya ambil Noun (NN*) dan Adjective (JJ*)
-    # NN: Noun, singular; NNS: Noun, plural; JJ: Adjective; JJR: Adj, comparative; JJS: Adj, superlative
-    allowed_tags = {'NN', 'NNS', 'JJ', 'JJR', 'JJS'}
-    
-    # 3. Custom Blacklist (Kata benda umum yang tidak informatif)
-    custom_stopwords = set([
-        'percent', 'year', 'month', 'today', 'term', 'point', 'number', 'million', 'billion',
-        'thing', 'way', 'part', 'lot', 'bit', 'side', 'type', 'kind', 'sort', 'sense',
-        'question', 'answer', 'mr', 'ms', 'chair', 'powell', 'chairman', 'operator',
-        'meeting', 'committee', 'reserve', 'federal', 'fed', 'bank', 'system',
-        'program', 'statement', 'guidance', 'tool', 'support', 'policy', 'rate', # Policy & Rate sering muncul, opsional dihapus jika terlalu dominan
-        'time', 'period', 'level', 'range', 'goal', 'objective', 'mandate',
-        'michelle', 'smith', 'hi', 'hello', 'thanks', 'thank', 'please',
-        'quarter', 'half', 'basis', 'pace', 'outlook', 'projection', 'view',
-        'participant', 'member', 'colleague', 'staff', 'governor', 'president'
-    ])
-    
-    # Gabungkan dengan stopwords bawaan NLTK
-    final_stopwords = set(stopwords.words('english')).union(custom_stopwords)
+def plot_wordcloud(frequencies):
+    """
+    Membuat Word Cloud sebagai figure Matplotlib (dari PNG yang di-cache, lihat wordcloud_png).
     
-    # Filter token
-    filtered_words = []
-    for word, tag in tagged_tokens:
-        if tag in allowed_tags and word.isalpha() and word not in final_stopwords and len(word) > 2:
-            filtered_words.append(word)
-            
-    clean_text = " ".join(filtered_words)
+    Figure dibuat tanpa pyplot sehingga tidak terdaftar di figure manager global
+    (tidak menumpuk di setiap rerun) dan dibebaskan seperti objek biasa.
     
-    # Generate Word Cloud
-    wordcloud = WordCloud(width=800, height=400, background_color='white', collocations=False).generate(clean_text)
+    Args:
+        frequencies (dict): {kata: jumlah}, mis. TranscriptAnalysis.keyword_frequencies.
+        
+    Returns:
+        matplotlib.figure.Figure: Objek gambar Matplotlib.
+    """
+    from matplotlib.figure import Figure
+    import matplotlib.image as mpimg
     
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.imshow(wordcloud, interpolation='bilinear')
+    png = wordcloud_png(frequencies)
+    if png is None:
+        raise ValueError("We need at least 1 word to plot a word cloud")
+        
+    fig = Figure(figsize=(10, 5))
+    ax = fig.subplots()
+    ax.imshow(mpimg.imread(io.BytesIO(png), format='png'), interpolation='bilinear')
     ax.axis('off')
     
     return fig
@@ -485,3 +486,118 @@ def plot_cluster_sentiment(cluster_results):
     )
     
     return fig
+
+def plot_reaction_heatmap(reaction_table):
+    """
+    Membuat Heatmap korelasi Sentimen vs Reaksi Pasar (aset x horizon).
+    
+    Args:
+        reaction_table (dict): Output market_reaction.market_reaction_table.
+        
+    Returns:
+        plotly.graph_objects.Figure: Objek grafik Plotly.
+    """
+    corr = reaction_table['correlation']
+    p_values = reaction_table['p_value']
+    
+    # Tandai sel signifikan (p < 0.05)
+    texts = [
+        [f"{r:.2f}{'*' if p < 0.05 else ''}" if r == r else "-" for r, p in zip(r_row, p_row)]
+        for r_row, p_row in zip(corr.values, p_values.values)
+    ]
+    
+    fig = go.Figure(data=go.Heatmap(
+        z=corr.values,
+        x=list(corr.columns),
+        y=list(corr.index),
+        zmin=-1, zmax=1,
+        colorscale='RdBu',
+        text=texts,
+        texttemplate='%{text}',
+        hovertemplate='Aset: %{y}<br>Horizon: %{x}<br>r: %{z:.4f}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title="Korelasi Sentimen vs Reaksi Pasar (Multi-Aset, Multi-Horizon)<br><sub>* = signifikan (p < 0.05)</sub>",
+        xaxis_title="Horizon (Hari Perdagangan)",
+        yaxis_title="Aset",
+        template='plotly_white',
+        height=400
+    )
+    
+    return fig
+
+def plot_keyword_over_time(trend, keyword):
+    """
+    Membuat Line Chart nada kata kunci per pertemuan (lintas waktu).
+    
+    Args:
+        trend (pandas.DataFrame): Output KeywordIndex.trend (index tanggal; kolom 'count', 'avg_compound').
+        keyword (str): Kata kunci yang dianalisis.
+        
+    Returns:
+        plotly.graph_objects.Figure: Objek grafik Plotly.
+    """
+    if trend.empty:
+        return go.Figure()
+        
+    dates = [d.strftime('%Y-%m-%d') for d in trend.index]
+    scores = trend['avg_compound'].tolist()
+    counts = trend['count'].tolist()
+    
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=dates,
+        y=scores,
+        mode='lines+markers',
+        name=f'"{keyword}"',
+        # Ukuran marker mengikuti jumlah kalimat yang memuat kata kunci
+        marker=dict(size=[min(6 + c / 2, 24) for c in counts], color=['green' if s > 0.05 else 'red' if s < -0.05 else 'gray' for s in scores]),
+        line=dict(color='#1f77b4', width=2),
+        customdata=counts,
+        hovertemplate='Tanggal: %{x}<br>Avg Score: %{y:.4f}<br>Kalimat: %{customdata}<extra></extra>'
+    ))
+    
+    fig.add_hline(y=0, line_dash="dash", line_color="black", line_width=1)
+    
+    fig.update_layout(
+        title=f"Nada Powell tentang '{keyword}' per Pertemuan",
+        xaxis_title="Tanggal Pertemuan",
+        yaxis_title="Rata-rata Compound Score",
+        template='plotly_white',
+        height=400
+    )
+    
+    return fig
+
+def plot_topic_trends(topic_table):
+    """
+    Membuat Heatmap sentimen topik korpus per pertemuan (topik x waktu).
+    
+    Args:
+        topic_table (pandas.DataFrame): Output CorpusTopicModel.topic_meeting_table('sentiment').
+        
+    Returns:
+        plotly.graph_objects.Figure: Objek grafik Plotly.
+    """
+    if topic_table.empty:
+        return go.Figure()
+        
+    fig = go.Figure(data=go.Heatmap(
+        z=topic_table.values.T,
+        x=[d.strftime('%Y-%m-%d') for d in topic_table.index],
+        y=list(topic_table.columns),
+        zmid=0,
+        colorscale='RdYlGn',
+        hovertemplate='Tanggal: %{x}<br>Topik: %{y}<br>Avg Score: %{z:.4f}<extra></extra>'
+    ))
+    
+    fig.update_layout(
+        title="Tren Sentimen per Topik Korpus (2020-2025)",
+        xaxis_title="Tanggal Pertemuan",
+        yaxis_title="Topik (Top Terms)",
+        template='plotly_white',
+        height=450
+    )
+    
+    return fig
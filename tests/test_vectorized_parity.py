@@ -0,0 +1,58 @@
+"""
+Parity VectorizedVader vs SentimentIntensityAnalyzer.polarity_scores (lihat check_vectorized_parity).
+"""
+import os
+
+import pytest
+
+from modules.analyzer import FINANCIAL_LEXICON, check_vectorized_parity
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS_DIR = os.path.join(REPO_DIR, 'fomc-transcript')
+
+# Kalimat yang menyentuh aturan khusus VADER: negasi, "but", booster, CAPS, idiom,
+# "kind of", "least", "never so", tanda seru/tanya, emoji, dan lexicon keuangan.
+PARITY_SENTENCES = [
+    "The economy is strong and the labor market remains robust.",
+    "Inflation is not low, but it has cooled somewhat.",
+    "We are NOT optimistic about the outlook!!!",
+    "Growth was extremely weak in the first quarter.",
+    "The risks are kind of balanced, but uncertainty is high?",
+    "This is at least a modest improvement, though not a great one.",
+    "Policy is never so restrictive that it would cause a recession.",
+    "Without doubt, the recovery has been resilient.",
+    "Unemployment rose sharply and the turmoil was painful.",
+    "It was the bomb, and we had a good time, no doubt.",
+    "Prices are rising :) but wages are not keeping up :(",
+    "Spending is neither strong nor weak.",
+    "The committee sort of agrees that tightening may be appropriate.",
+    "We won't hesitate to act if inflation pressure persists.",
+    "Demand has been incredibly solid; expansion continues.",
+    "Volatility isn't helpful, and the downside risk is real.",
+    "No one expects a crisis, yet the slowdown is clear.",
+    "",
+]
+
+def _write_corpus(directory, sentences):
+    with open(os.path.join(directory, 'parity.txt'), 'w', encoding='utf-8') as f:
+        f.write(" ".join(sentences))
+
+@pytest.mark.parametrize('lexicon', [None, {}], ids=['financial', 'vader-only'])
+def test_vectorized_parity_fixed_sentences(tmp_path, lexicon):
+    _write_corpus(tmp_path, PARITY_SENTENCES)
+    result = check_vectorized_parity(str(tmp_path), lexicon=lexicon)
+    assert result['sentences'] > 0
+    assert result['mismatches'] == 0, result['examples']
+    assert result['passed']
+
+def test_vectorized_parity_custom_lexicon(tmp_path):
+    lexicon = dict(FINANCIAL_LEXICON, hawkish=-2.0, dovish=1.5)
+    _write_corpus(tmp_path, ["The statement was hawkish.", "Markets read it as dovish but not very dovish!"])
+    result = check_vectorized_parity(str(tmp_path), lexicon=lexicon)
+    assert result['mismatches'] == 0, result['examples']
+
+@pytest.mark.skipif(not os.path.isdir(CORPUS_DIR), reason="fomc-transcript corpus not available")
+def test_vectorized_parity_corpus():
+    result = check_vectorized_parity(CORPUS_DIR)
+    assert result['sentences'] > 0
+    assert result['mismatches'] == 0, result['examples']